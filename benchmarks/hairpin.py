@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Hairpin benchmark."""
+import random
+import time
+import warnings
+from opr import Primer
+from opr.hairpin import _best_hairpin, _HAIRPIN_SUBRESULTS
+
+PRIMERS_NUMBER = 10 ** 5
+PRIMER_LENGTH = 25
+
+
+def clear_cache() -> None:
+    """Clear the hairpin memoization caches."""
+    _best_hairpin.cache_clear()
+    _HAIRPIN_SUBRESULTS.clear()
+
+
+def run(name: str, sequences: list) -> None:
+    """
+    Compute the hairpin of every sequence and print the timing.
+
+    :param name: benchmark name
+    :param sequences: primers sequences
+    """
+    clear_cache()
+    start = time.perf_counter()
+    for sequence in sequences:
+        _ = Primer(sequence).hairpin
+    elapsed = time.perf_counter() - start
+    info = _best_hairpin.cache_info()
+    subresults_info = _HAIRPIN_SUBRESULTS.info()
+    print("{0:<28}: {1:6.2f} s ({2:6.1f} us/primer, memo hit rate {3:.0%}, sub-results hit rate {4:.0%})".format(
+        name, elapsed, elapsed / len(sequences) * 1e6, info.hits / max(info.hits + info.misses, 1),
+        subresults_info.hits / max(subresults_info.hits + subresults_info.misses, 1)))
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    random.seed(0)
+    print("Hairpin of {0} primers ({1} nt), memo hit rates of the sequences and their sub-results".format(
+        PRIMERS_NUMBER, PRIMER_LENGTH))
+    random_primers = ["".join(random.choice("ATCG") for _ in range(PRIMER_LENGTH)) for _ in range(PRIMERS_NUMBER)]
+    run("Random primers", random_primers)
+    template = "".join(random.choice("ATCG") for _ in range(PRIMERS_NUMBER + PRIMER_LENGTH - 1))
+    windows = [template[index:index + PRIMER_LENGTH] for index in range(PRIMERS_NUMBER)]
+    run("Overlapping template windows", windows)
+    base = random_primers[0]
+    variants = [base[:index] + base_ + base[index + 1:] for index in range(PRIMER_LENGTH) for base_ in "ATCG"]
+    run("Single-base variants", (variants * (PRIMERS_NUMBER // len(variants) + 1))[:PRIMERS_NUMBER])
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""K-mer index benchmark."""
+import io
+import os
+import random
+import tempfile
+import time
+import warnings
+from opr import Primer, KmerIndex
+
+REFERENCE_LENGTH = 10 ** 7
+PRIMERS_NUMBER = 100
+PRIMER_LENGTH = 20
+K = 12
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    random.seed(0)
+    reference = "".join(random.choice("ATCG") for _ in range(REFERENCE_LENGTH))
+    primers = [Primer(reference[start:start + PRIMER_LENGTH])
+               for start in random.sample(range(REFERENCE_LENGTH - PRIMER_LENGTH), PRIMERS_NUMBER)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "reference.idx")
+        start = time.perf_counter()
+        oindex = KmerIndex.build(io.StringIO(">reference\n" + reference), path, k=K)
+        print("Build ({0} nt, k={1}): {2:.1f} s, {3:.0f} MB".format(
+            REFERENCE_LENGTH, K, time.perf_counter() - start, os.path.getsize(path) / 2 ** 20))
+        for max_mismatches in range(4):
+            start = time.perf_counter()
+            sites = sum(len(oindex.search(oprimer, max_mismatches)) for oprimer in primers)
+            elapsed = time.perf_counter() - start
+            print("Search ({0} nt primers, {1} mismatches): {2:.2f} ms/primer, {3:.1f} sites/primer".format(
+                PRIMER_LENGTH, max_mismatches, elapsed / PRIMERS_NUMBER * 1e3, sites / PRIMERS_NUMBER))
+        oindex.close()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Packed sequences benchmark."""
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from opr import Primer, PackedSequences
+
+REFERENCE_LENGTH = 10 ** 7
+WINDOWS_NUMBER = 10 ** 5
+WINDOW_LENGTH = 25
+
+
+def retained_memory(function):
+    """Return the result of a function and the memory it retains."""
+    tracemalloc.start()
+    result = function()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, memory
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    random.seed(0)
+    reference = "".join(random.choice("ATCG") for _ in range(REFERENCE_LENGTH))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "reference.2bit")
+        start = time.perf_counter()
+        opacked = PackedSequences.build(io.StringIO(">reference\n" + reference), path)
+        print("Build ({0} nt): {1:.1f} s".format(REFERENCE_LENGTH, time.perf_counter() - start))
+        print("Reference: str {0:.1f} MB, packed {1:.1f} MB".format(
+            sys.getsizeof(reference) / 2 ** 20, os.path.getsize(path) / 2 ** 20))
+        starts = random.sample(range(REFERENCE_LENGTH - WINDOW_LENGTH), WINDOWS_NUMBER)
+        for label, factory in (
+                ("Primer", lambda start: Primer(reference[start:start + WINDOW_LENGTH])),
+                ("PrimerView", lambda start: opacked.view("reference", start, start + WINDOW_LENGTH))):
+            start_time = time.perf_counter()
+            primers, memory = retained_memory(lambda: [factory(start) for start in starts])
+            gc_contents = [oprimer.gc_content for oprimer in primers]
+            print("{0}: {1:.0f} bytes/window, {2:.1f} us/window (create and gc_content)".format(
+                label, memory / WINDOWS_NUMBER, (time.perf_counter() - start_time) / WINDOWS_NUMBER * 1e6))
+            del primers, gc_contents
+        opacked.close()
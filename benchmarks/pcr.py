@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""In-silico PCR benchmark."""
+import io
+import os
+import random
+import tempfile
+import time
+import warnings
+from opr import Primer, KmerIndex, predict_amplicons
+
+REFERENCE_LENGTH = 5 * 10 ** 6
+PAIRS_NUMBER = 200
+PRIMER_LENGTH = 20
+PRODUCT_SIZE = (100, 1000)
+K = 12
+
+COMPLEMENT = {"A": "T", "T": "A", "C": "G", "G": "C"}
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    random.seed(0)
+    reference = "".join(random.choice("ATCG") for _ in range(REFERENCE_LENGTH))
+    pairs = []
+    for start in random.sample(range(REFERENCE_LENGTH - PRODUCT_SIZE[1]), PAIRS_NUMBER):
+        end = start + random.randint(*PRODUCT_SIZE)
+        reverse = "".join(COMPLEMENT[base] for base in reversed(reference[end - PRIMER_LENGTH:end]))
+        pairs.append((Primer(reference[start:start + PRIMER_LENGTH]), Primer(reverse)))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "reference.idx")
+        start = time.perf_counter()
+        oindex = KmerIndex.build(io.StringIO(">reference\n" + reference), path, k=K)
+        print("Build ({0} nt, k={1}): {2:.1f} s".format(REFERENCE_LENGTH, K, time.perf_counter() - start))
+        for max_mismatches in range(3):
+            start = time.perf_counter()
+            amplicons = predict_amplicons(oindex, pairs, max_mismatches, PRODUCT_SIZE)
+            print("Predict ({0} pairs, {1} mismatches): {2:.2f} s, {3} amplicons".format(
+                PAIRS_NUMBER, max_mismatches, time.perf_counter() - start, len(amplicons)))
+        oindex.close()
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Primer memory benchmark."""
+import gc
+import random
+import tracemalloc
+import warnings
+from opr import Primer, MeltingTemperature
+
+PRIMERS_NUMBER = 10000
+PRIMER_LENGTH = 25
+
+
+def measure(computed: bool) -> float:
+    """
+    Measure memory usage of a Primer instance and return it in bytes.
+
+    :param computed: whether to compute and cache every property before measuring
+    """
+    random.seed(0)
+    sequences = ["".join(random.choice("ATCG") for _ in range(PRIMER_LENGTH)) for _ in range(PRIMERS_NUMBER)]
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    primers = [Primer(sequence) for sequence in sequences]
+    if computed:
+        for oprimer in primers:
+            _ = oprimer.molecular_weight, oprimer.gc_content, oprimer.gc_clamp, oprimer.E260
+            for method in MeltingTemperature:
+                oprimer.melting_temperature(method)
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / len(primers)
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    print("Primer memory usage ({0} nt)".format(PRIMER_LENGTH))
+    print("Fresh instance    : {0:.0f} bytes".format(measure(computed=False)))
+    print("Computed instance : {0:.0f} bytes".format(measure(computed=True)))
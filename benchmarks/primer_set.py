@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Primer set benchmark."""
+import random
+import time
+import warnings
+from opr import Primer, PrimerSet
+
+SEQUENCE_LENGTH = 10 ** 6
+PRIMER_LENGTH = 20
+
+COMPLEMENT = {"A": "T", "T": "A", "C": "G", "G": "C"}
+
+
+def substring_scans(sequence, primers):
+    """Find the occurrences of the primers and their reverse complements with one substring scan per pattern."""
+    found = []
+    for oprimer in primers:
+        reverse_complement = "".join(COMPLEMENT[base] for base in reversed(oprimer.sequence))
+        for pattern in (oprimer.sequence, reverse_complement):
+            position = sequence.find(pattern)
+            while position != -1:
+                found.append(position)
+                position = sequence.find(pattern, position + 1)
+    return found
+
+
+if __name__ == "__main__":
+    warnings.simplefilter("ignore")
+    random.seed(0)
+    sequence = "".join(random.choice("ATCG") for _ in range(SEQUENCE_LENGTH))
+    for primers_number in (100, 1000, 10000):
+        primers = [Primer(sequence[start:start + PRIMER_LENGTH])
+                   for start in random.sample(range(SEQUENCE_LENGTH - PRIMER_LENGTH), primers_number)]
+        start = time.perf_counter()
+        occurrences = substring_scans(sequence, primers)
+        scans_time = time.perf_counter() - start
+        start = time.perf_counter()
+        oprimer_set = PrimerSet(primers)
+        compile_time = time.perf_counter() - start
+        start = time.perf_counter()
+        assert len(oprimer_set.find(sequence)) == len(occurrences)
+        find_time = time.perf_counter() - start
+        print("{0} primers: substring scans {1:.2f} s, PrimerSet compile {2:.2f} s, find {3:.2f} s".format(
+            primers_number, scans_time, compile_time, find_time))
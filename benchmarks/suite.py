@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""OPR benchmark suite."""
+from typing import Callable, Iterable, Optional, Tuple, List, Dict, Any
+import argparse
+import inspect
+import json
+import math
+import platform
+import random
+import re
+import sys
+import time
+import warnings
+from opr import Primer, PrimerBatch, MeltingTemperature, OPR_VERSION
+from opr import disable_property_cache, close_property_store
+from opr import functions
+from opr.hairpin import hairpin_calc, hairpin_loop_delta_g_calc, _best_hairpin, _HAIRPIN_SUBRESULTS
+from opr.functions import is_valid_sequence, is_valid_buffer, complement_calc, reverse_complement_calc
+from opr.functions import complement_buffer, reverse_complement_buffer, padding_calc
+from opr.functions import molecular_weight_from_counts, basic_melting_temperature_from_counts
+from opr.functions import salt_adjusted_melting_temperature_from_counts, molecular_weight_calc
+from opr.functions import basic_melting_temperature_calc, salt_adjusted_melting_temperature_calc
+from opr.functions import calculate_thermodynamics_constants, nearest_neighbor_melting_temperature_calc
+from opr.functions import delta_g_calc, gc_clamp_calc, e260_ssnn_calc, runs_calc, max_runs_calc, primer_profile_calc
+
+PRIMER_LENGTH = 25
+SAMPLE_SIZE = 1000
+REPEATS = 5
+WORKLOAD_SIZES = (10 ** 3, 10 ** 5, 10 ** 6)
+DEFAULT_TOLERANCE = 0.25
+
+
+def counts(sequence: str) -> Tuple[int, int, int, int]:
+    """
+    Count the A, T, C and G bases of a sequence and return them.
+
+    :param sequence: sequence
+    """
+    return tuple(sequence.count(base) for base in "ATCG")
+
+
+# function name: (function, arguments of a sequence)
+FUNCTION_BENCHMARKS = {
+    "is_valid_sequence": (is_valid_sequence, lambda sequence: (sequence,)),
+    "is_valid_buffer": (is_valid_buffer, lambda sequence: (sequence.encode("ascii"),)),
+    "complement_calc": (complement_calc, lambda sequence: (sequence,)),
+    "reverse_complement_calc": (reverse_complement_calc, lambda sequence: (sequence,)),
+    "complement_buffer": (complement_buffer, lambda sequence: (sequence.encode("ascii"),)),
+    "reverse_complement_buffer": (
+        reverse_complement_buffer, lambda sequence: (sequence.encode("ascii"), (0, len(sequence)))),
+    "padding_calc": (padding_calc, lambda sequence: (len(sequence),)),
+    "molecular_weight_from_counts": (molecular_weight_from_counts, counts),
+    "basic_melting_temperature_from_counts": (basic_melting_temperature_from_counts, counts),
+    "salt_adjusted_melting_temperature_from_counts": (
+        salt_adjusted_melting_temperature_from_counts, lambda sequence: counts(sequence) + (50,)),
+    "molecular_weight_calc": (molecular_weight_calc, lambda sequence: (sequence,)),
+    "basic_melting_temperature_calc": (basic_melting_temperature_calc, lambda sequence: (sequence,)),
+    "salt_adjusted_melting_temperature_calc": (salt_adjusted_melting_temperature_calc, lambda sequence: (sequence, 50)),
+    "calculate_thermodynamics_constants": (calculate_thermodynamics_constants, lambda sequence: (sequence,)),
+    "nearest_neighbor_melting_temperature_calc": (
+        nearest_neighbor_melting_temperature_calc,
+        lambda sequence: (sequence, 50, calculate_thermodynamics_constants(sequence))),
+    "delta_g_calc": (delta_g_calc, calculate_thermodynamics_constants),
+    "gc_clamp_calc": (gc_clamp_calc, lambda sequence: (sequence,)),
+    "e260_ssnn_calc": (e260_ssnn_calc, lambda sequence: (sequence,)),
+    "runs_calc": (runs_calc, lambda sequence: (sequence,)),
+    "max_runs_calc": (max_runs_calc, lambda sequence: (sequence,)),
+    "primer_profile_calc": (primer_profile_calc, lambda sequence: (sequence,)),
+    "hairpin_calc": (hairpin_calc, lambda sequence: (sequence,)),
+}
+
+# Primer attributes that are cached on the instance, measured on the first (cold) and the second (cached) access
+PROPERTY_BENCHMARKS = {
+    "molecular_weight": lambda oprimer: oprimer.molecular_weight,
+    "gc_content": lambda oprimer: oprimer.gc_content,
+    "gc_clamp": lambda oprimer: oprimer.gc_clamp,
+    "single_runs": lambda oprimer: oprimer.single_runs,
+    "double_runs": lambda oprimer: oprimer.double_runs,
+    "E260": lambda oprimer: oprimer.E260,
+    "delta_h": lambda oprimer: oprimer.delta_h,
+    "delta_s": lambda oprimer: oprimer.delta_s,
+    "hairpin": lambda oprimer: oprimer.hairpin,
+    "melting_temperature_basic": lambda oprimer: oprimer.melting_temperature(MeltingTemperature.BASIC),
+    "melting_temperature_salt_adjusted": lambda oprimer: oprimer.melting_temperature(
+        MeltingTemperature.SALT_ADJUSTED),
+    "melting_temperature_nearest_neighbor": lambda oprimer: oprimer.melting_temperature(
+        MeltingTemperature.NEAREST_NEIGHBOR),
+    "to_protein": lambda oprimer: oprimer.to_protein(),
+    "profile": lambda oprimer: oprimer.profile(),
+}
+
+# Primer methods that are not cached
+METHOD_BENCHMARKS = {
+    "__init__": lambda oprimer: Primer(oprimer.sequence),
+    "__len__": len,
+    "__eq__": lambda oprimer: oprimer == oprimer,
+    "__add__": lambda oprimer: oprimer + oprimer,
+    "__mul__": lambda oprimer: oprimer * 2,
+    "__contains__": lambda oprimer: "GATC" in oprimer,
+    "repeats": lambda oprimer: oprimer.repeats("AT"),
+    "repeats_consecutive": lambda oprimer: oprimer.repeats("AT", consecutive=True),
+    "reverse": lambda oprimer: oprimer.reverse(),
+    "complement": lambda oprimer: oprimer.complement(),
+    "reverse_complement": lambda oprimer: oprimer.reverse_complement(),
+    "variants": lambda oprimer: list(oprimer.variants()),
+    "to_rna": lambda oprimer: oprimer.to_rna(),
+}
+
+
+def unregistered_functions() -> List[str]:
+    """Find the public functions of `opr/functions.py` missing in FUNCTION_BENCHMARKS and return their names."""
+    return [
+        name for name, function in inspect.getmembers(functions, inspect.isfunction)
+        if function.__module__ == functions.__name__ and not name.startswith("_") and name not in FUNCTION_BENCHMARKS]
+
+
+WORKLOAD_PROPERTIES = ("molecular_weight", "gc_content", "E260")
+
+
+def primer_library(sequences: List[str]) -> None:
+    """
+    Analyze a library as Primer objects.
+
+    :param sequences: library sequences
+    """
+    for sequence in sequences:
+        oprimer = Primer(sequence)
+        for attr in WORKLOAD_PROPERTIES:
+            getattr(oprimer, attr)
+        oprimer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+
+
+def batch_library(sequences: List[str]) -> None:
+    """
+    Analyze a library as a PrimerBatch.
+
+    :param sequences: library sequences
+    """
+    obatch = PrimerBatch(sequences)
+    for attr in WORKLOAD_PROPERTIES:
+        getattr(obatch, attr)
+    obatch.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+
+
+WORKLOAD_BENCHMARKS = {
+    "primer_library": primer_library,
+    "batch_library": batch_library,
+}
+
+
+def random_sequences(number: int, seed: int = 0) -> List[str]:
+    """
+    Generate random primer sequences and return them.
+
+    :param number: number of sequences
+    :param seed: random seed
+    """
+    generator = random.Random(seed)
+    return ["".join(generator.choices("ATCG", k=PRIMER_LENGTH)) for _ in range(number)]
+
+
+def clear_caches() -> None:
+    """Clear every memoization cache, so each repeat starts cold."""
+    _best_hairpin.cache_clear()
+    _HAIRPIN_SUBRESULTS.clear()
+    hairpin_loop_delta_g_calc.cache_clear()
+    disable_property_cache()
+    close_property_store()
+
+
+def measure(run: Callable[[Any], None], setup: Callable[[], Any], items: int, repeats: int) -> float:
+    """
+    Measure the best time of a benchmark over the repeats and return it in microseconds per item.
+
+    :param run: benchmark function, called with the result of `setup`
+    :param setup: function preparing the benchmark state, not measured
+    :param items: number of items processed by each run
+    :param repeats: number of repeats
+    """
+    best = math.inf
+    for _ in range(repeats):
+        clear_caches()
+        state = setup()
+        start = time.perf_counter()
+        run(state)
+        best = min(best, time.perf_counter() - start)
+    return best / items * 1e6
+
+
+def benchmarks(sizes: Iterable[int], repeats: int) -> Iterable[Tuple[str, Callable[[], float]]]:
+    """
+    Yield the (name, measure function) of all benchmarks.
+
+    :param sizes: workload sizes
+    :param repeats: number of repeats
+    """
+    sequences = random_sequences(SAMPLE_SIZE)
+
+    def call_all(function: Callable[..., Any]) -> Callable[[List[Tuple[Any, ...]]], None]:
+        def run(arguments: List[Tuple[Any, ...]]) -> None:
+            for args in arguments:
+                function(*args)
+        return run
+
+    def access_all(access: Callable[[Primer], Any]) -> Callable[[List[Primer]], None]:
+        def run(primers: List[Primer]) -> None:
+            for oprimer in primers:
+                access(oprimer)
+        return run
+
+    def primers(access: Optional[Callable[[Primer], Any]] = None) -> Callable[[], List[Primer]]:
+        def setup() -> List[Primer]:
+            result = [Primer(sequence) for sequence in sequences]
+            if access is not None:
+                access_all(access)(result)
+            return result
+        return setup
+
+    for name, (function, arguments) in FUNCTION_BENCHMARKS.items():
+        yield "functions/{0}".format(name), lambda function=function, arguments=arguments: measure(
+            call_all(function), lambda: [arguments(sequence) for sequence in sequences], SAMPLE_SIZE, repeats)
+    for name, access in PROPERTY_BENCHMARKS.items():
+        yield "primer/{0}/cold".format(name), lambda access=access: measure(
+            access_all(access), primers(), SAMPLE_SIZE, repeats)
+        yield "primer/{0}/cached".format(name), lambda access=access: measure(
+            access_all(access), primers(access), SAMPLE_SIZE, repeats)
+    for name, access in METHOD_BENCHMARKS.items():
+        yield "primer/{0}".format(name), lambda access=access: measure(
+            access_all(access), primers(), SAMPLE_SIZE, repeats)
+    for size in sizes:
+        library = random_sequences(size, seed=1)
+        for name, workload in WORKLOAD_BENCHMARKS.items():
+            # large workloads are too slow to repeat
+            yield "workload/{0}/{1}".format(name, size), lambda workload=workload, library=library: measure(
+                workload, lambda: library, size, repeats if size <= SAMPLE_SIZE else 1)
+
+
+def run_suite(sizes: Iterable[int], repeats: int, pattern: Optional[str]) -> Dict[str, Any]:
+    """
+    Run the benchmarks, print their results and return them.
+
+    :param sizes: workload sizes
+    :param repeats: number of repeats
+    :param pattern: regular expression selecting the benchmarks to run, all if None
+    """
+    results = {}
+    for name, benchmark in benchmarks(sizes, repeats):
+        if pattern is not None and not re.search(pattern, name):
+            continue
+        results[name] = benchmark()
+        print("{0:<60} {1:12.3f} us".format(name, results[name]), flush=True)
+    return {
+        "metadata": {
+            "opr_version": OPR_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    """
+    Compare the results with a baseline, print the comparison and return the names of the regressed benchmarks.
+
+    :param results: benchmark results (unit microseconds per item)
+    :param baseline: baseline results (unit microseconds per item)
+    :param tolerance: allowed relative slowdown
+    """
+    regressions = []
+    print("\n{0:<60} {1:>12} {2:>12} {3:>8}".format("Benchmark", "Baseline", "Current", "Ratio"))
+    for name, value in results.items():
+        if name not in baseline:
+            continue
+        ratio = value / baseline[name] if baseline[name] else math.inf
+        status = ""
+        if ratio > 1 + tolerance:
+            status = "REGRESSION"
+            regressions.append(name)
+        print("{0:<60} {1:12.3f} {2:12.3f} {3:8.2f} {4}".format(name, baseline[name], value, ratio, status))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmark suite from the command line and return the exit code.
+
+    :param argv: command line arguments
+    """
+    parser = argparse.ArgumentParser(description="OPR benchmark suite")
+    parser.add_argument("--output", help="JSON file to save the results to")
+    parser.add_argument("--baseline", help="JSON results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative slowdown before a benchmark is reported as a regression")
+    parser.add_argument("--sizes", type=int, nargs="*", default=list(WORKLOAD_SIZES), help="library workload sizes")
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="number of repeats of each benchmark")
+    parser.add_argument("--filter", help="regular expression selecting the benchmarks to run")
+    args = parser.parse_args(argv)
+    missing = unregistered_functions()
+    if missing:
+        print("Functions without a benchmark: {0}".format(", ".join(missing)), file=sys.stderr)
+    warnings.simplefilter("ignore")
+    report = run_suite(args.sizes, args.repeats, args.filter)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=4, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(report["results"], baseline, args.tolerance)
+        if regressions:
+            print("\n{0} regression(s) over {1:.0%}".format(len(regressions), args.tolerance))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Six-frame translation and ORF benchmark."""
+import random
+import time
+from opr import six_frame_translation, find_orfs
+from opr.params import CODONS_TO_AMINO_ACIDS_SHORT
+
+SEQUENCE_LENGTHS = [10 ** 5, 10 ** 6, 10 ** 7]
+COMPLEMENT = {"A": "T", "T": "A", "C": "G", "G": "C"}
+
+
+def per_codon_six_frame_translation(sequence: str) -> dict:
+    """
+    Translate the six frames of a sequence one codon string at a time and return the proteins.
+
+    :param sequence: nucleotides sequence
+    """
+    reverse_complement = "".join(COMPLEMENT[base] for base in reversed(sequence))
+    proteins = {}
+    for frame in (1, 2, 3):
+        for sign, strand in ((1, sequence), (-1, reverse_complement)):
+            rna_sequence = strand.replace("T", "U")
+            proteins[sign * frame] = "".join(
+                CODONS_TO_AMINO_ACIDS_SHORT[rna_sequence[index:index + 3]]
+                for index in range(frame - 1, len(rna_sequence) - 2, 3))
+    return proteins
+
+
+def timed(function, *args) -> float:
+    """
+    Run a function and return its wall time.
+
+    :param function: benchmarked function
+    :param args: function arguments
+    """
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print("{0:>10} | {1:>12} | {2:>12} | {3:>12}".format("Length", "Per codon", "Six-frame", "ORFs"))
+    for length in SEQUENCE_LENGTHS:
+        sequence = "".join(random.choice("ATCG") for _ in range(length))
+        print("{0:>10} | {1:>10.3f} s | {2:>10.3f} s | {3:>10.3f} s".format(
+            length,
+            timed(per_codon_six_frame_translation, sequence),
+            timed(six_frame_translation, sequence),
+            timed(lambda: list(find_orfs(sequence, min_length=100)))))
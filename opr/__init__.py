@@ -1,7 +1,29 @@
 # -*- coding: utf-8 -*-
 """OPR modules."""
 from .params import OPR_VERSION
-from .primer import Primer, MeltingTemperature
+from .primer import Primer, FrozenPrimer, MeltingTemperature
+from .hairpin import Hairpin
+from .batch import PrimerBatch
+from .reader import SequenceFormat, read_records, read_primers
+from .parallel import analyze_many
+from .scanner import Window, scan_windows
+from .dimer import Dimer, DimerIndex, self_dimer, cross_dimer, dimer_matrix
+from .index import BindingSite, KmerIndex
+from .packed import PackedSequences, PrimerView
+from .primer_set import PrimerSet, PrimerOccurrence
+from .pair import PrimerPair, design_pairs
+from .panel import Panel, PanelInteraction, PanelUpdate
+from .pool import Pool, assign_pools, dimer_conflict
+from .pcr import Amplicon, predict_amplicons, binding_melting_temperature
+from .cache import PropertyCache, PropertyCacheInfo
+from .cache import enable_property_cache, disable_property_cache, get_property_cache
+from .store import PropertyStore, open_property_store, close_property_store, get_property_store
+from .instrumentation import Instrumentation, InstrumentationEvent, PropertyStats
+from .instrumentation import enable_instrumentation, disable_instrumentation, get_instrumentation
+from .diagnostics import Diagnostic, DiagnosticsMode, count_diagnostics
+from .diagnostics import set_diagnostics_mode, get_diagnostics_mode, diagnostics_mode
+from .variants import Mutation, Variant
+from .translation import ORF, translate_frame, six_frame_translation, find_orfs
 from .errors import OPRBaseError
 
 __version__ = OPR_VERSION
@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+"""OPR primer batch."""
+from __future__ import annotations
+from typing import Callable, Generator, Iterable, Iterator, Optional, Sequence, List, Tuple, Dict, Union, Any
+from array import array
+from itertools import accumulate, repeat
+from operator import add, mul, sub
+from warnings import catch_warnings, simplefilter
+from .errors import OPRBaseError
+from .primer import Primer, MeltingTemperature, MELTING_TEMPERATURE_SLOTS, melting_temperature_parameters
+from .store import get_property_store
+from .variants import Variant, sequence_variants
+from .diagnostics import Diagnostic, report_diagnostic, length_diagnostic, gc_content_diagnostic
+from .params import DEFAULT_PRIMER_NAME
+from .params import PRIMER_SEQUENCE_TYPE_ERROR, PRIMER_SEQUENCE_VALID_BASES_ERROR
+from .params import PRIMER_MELTING_TEMPERATURE_NOT_IMPLEMENTED_ERROR
+from .params import PRIMER_BATCH_NAMES_LENGTH_ERROR, PRIMER_BATCH_PRIMERS_TYPE_ERROR
+from .functions import DELTA_H_SCALE, DELTA_S_SCALE, E260_SCALE, NN_SCALED_DELTA_H, NN_SCALED_DELTA_S
+from .functions import NN53_SCALED_EXTINCTION_COEFFICIENTS, BASE_SCALED_EXTINCTION_COEFFICIENTS
+from .functions import is_valid_buffer, complement_buffer, reverse_complement_buffer
+from .functions import molecular_weight_from_counts, basic_melting_temperature_from_counts
+from .functions import salt_adjusted_melting_temperature_from_counts, nearest_neighbor_melting_temperature_calc
+
+
+def _pair_weights(weights: Dict[str, int]) -> Tuple[bytes, int]:
+    """
+    Build the translation table of the dinucleotide codes to their weights, minus the smallest one, and return it
+    with the smallest weight.
+
+    :param weights: integer weight of each dinucleotide
+    """
+    offset = min(weights.values())
+    table = bytearray(256)
+    for pair, weight in weights.items():
+        table[PAIR_FIRST_BASE_TABLE[ord(pair[0])] + PAIR_SECOND_BASE_TABLE[ord(pair[1])]] = weight - offset
+    return bytes(table), offset
+
+
+# The dinucleotide code of a position is 4 × the index of its base plus the index of the next base
+PAIR_FIRST_BASE_TABLE = bytes.maketrans(b"ATCG", bytes([0, 4, 8, 12]))
+PAIR_SECOND_BASE_TABLE = bytes.maketrans(b"ATCG", bytes([0, 1, 2, 3]))
+DELTA_H_WEIGHTS = _pair_weights(NN_SCALED_DELTA_H)
+DELTA_S_WEIGHTS = _pair_weights(NN_SCALED_DELTA_S)
+NN53_E260_WEIGHTS = _pair_weights(NN53_SCALED_EXTINCTION_COEFFICIENTS)
+BASE_E260_WEIGHTS_TABLE = bytes.maketrans(
+    b"ATCG", bytes(BASE_SCALED_EXTINCTION_COEFFICIENTS[base] for base in "ATCG"))
+
+
+class PrimerBatch:
+    """
+    The PrimerBatch class holds many primer sequences in one contiguous buffer and computes their properties in bulk.
+
+    >>> obatch = PrimerBatch(["ATCGATCGATCGATCGAT", "CTGGAGGACGGAAGAGGAAGTAA"])
+    >>> obatch.molecular_weight
+    """
+
+    def __init__(self, sequences: Iterable[str], names: Optional[Iterable[str]] = None, salt: float = 50) -> None:
+        """
+        Initialize the PrimerBatch instance.
+
+        :param sequences: primers nucleotides sequences
+        :param names: primers names
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        buffer = bytearray()
+        offsets = array('Q', [0])
+        for sequence in sequences:
+            buffer += PrimerBatch.encode_primer(sequence)
+            offsets.append(len(buffer))
+        self._initialize(bytes(buffer), offsets, names, salt)
+        report_diagnostic(Diagnostic.LENGTH_OUT_OF_RANGE if any(self._diagnostics) else Diagnostic.NONE)
+
+    def _initialize(self, buffer: bytes, offsets: array, names: Optional[Iterable[str]], salt: float) -> None:
+        """
+        Initialize the batch from validated sequences.
+
+        :param buffer: concatenated uppercase ASCII sequences
+        :param offsets: start offsets of the sequences followed by the end offset of the last one
+        :param names: primers names
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        self._buffer = buffer
+        self._offsets = offsets
+        self._names = None
+        if names is not None:
+            self._names = list(names)
+            if len(self._names) != len(self):
+                raise OPRBaseError(PRIMER_BATCH_NAMES_LENGTH_ERROR)
+        self._salt_level = salt
+        self._base_counts = None
+        self._pair_codes_buffer = None
+        self._molecular_weight = None
+        self._gc_content = None
+        self._diagnostics = array('B', (length_diagnostic(end - start) for start, end in self._spans()))
+        self._gc_clamp = None
+        self._E260 = None
+        self._delta_h = None
+        self._delta_s = None
+        self._melting_temperature = {
+            MeltingTemperature.BASIC: None,
+            MeltingTemperature.SALT_ADJUSTED: None,
+            MeltingTemperature.NEAREST_NEIGHBOR: None,
+        }
+
+    @classmethod
+    def from_primers(cls, primers: Iterable[Primer], salt: float = 50) -> PrimerBatch:
+        """
+        Build a PrimerBatch from Primer objects and return it.
+
+        :param primers: Primer objects
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        primers = list(primers)
+        if not all(isinstance(primer, Primer) for primer in primers):
+            raise OPRBaseError(PRIMER_BATCH_PRIMERS_TYPE_ERROR)
+        return cls([primer.sequence for primer in primers], [primer.name for primer in primers], salt)
+
+    def _derived(self, buffer: bytes) -> PrimerBatch:
+        """
+        Build a batch of the same layout, names and salt from a transformed buffer and return it.
+
+        The sequences are not validated again and length conditions are not reported again, as the lengths are kept.
+
+        :param buffer: transformed concatenated sequences
+        """
+        obatch = PrimerBatch.__new__(PrimerBatch)
+        obatch._initialize(buffer, self._offsets, self._names, self._salt_level)
+        return obatch
+
+    def complement(self) -> PrimerBatch:
+        """Complement every sequence and return them as a new PrimerBatch."""
+        return self._derived(complement_buffer(self._buffer))
+
+    def reverse_complement(self) -> PrimerBatch:
+        """Reverse complement every sequence and return them as a new PrimerBatch."""
+        return self._derived(reverse_complement_buffer(self._buffer, self._offsets))
+
+    @staticmethod
+    def encode_primer(sequence: str) -> bytes:
+        """
+        Validate the given primer sequence and return it as uppercase ASCII bytes.
+
+        :param sequence: primer nucleotides sequence
+        """
+        if not isinstance(sequence, str):
+            raise OPRBaseError(PRIMER_SEQUENCE_TYPE_ERROR)
+        encoded = sequence.upper().encode("ascii", "replace")
+        if not is_valid_buffer(encoded):
+            raise OPRBaseError(PRIMER_SEQUENCE_VALID_BASES_ERROR)
+        return encoded
+
+    def _spans(self) -> Iterator[Tuple[int, int]]:
+        """Iterate through the (start, end) offsets of the sequences in the buffer."""
+        return zip(self._offsets, self._offsets[1:])
+
+    def __len__(self) -> int:
+        """Return the number of primers in the batch."""
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Primer, PrimerBatch]:
+        """
+        Return the primer at the given index as a Primer object, or the primers of a slice as a new PrimerBatch.
+
+        :param index: primer index or slice
+        """
+        if isinstance(index, slice):
+            return self._sliced(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PrimerBatch index out of range")
+        return Primer(self.sequence(index), self.name(index), self._salt_level)
+
+    def _sliced(self, indices: range) -> PrimerBatch:
+        """
+        Build a batch of the primers at the given indices and return it.
+
+        The sequences are not validated again and length conditions are not reported again.
+
+        :param indices: primers indices
+        """
+        offsets = array('Q', [0])
+        if indices.step == 1:
+            start = self._offsets[indices.start] if indices else 0
+            buffer = self._buffer[start:self._offsets[indices.stop] if indices else 0]
+            offsets.extend(map(sub, self._offsets[indices.start + 1:indices.stop + 1], repeat(start)))
+        else:
+            buffer = self._joined(indices)
+            offsets.extend(accumulate(map(self.lengths.__getitem__, indices)))
+        names = None if self._names is None else list(map(self._names.__getitem__, indices))
+        obatch = PrimerBatch.__new__(PrimerBatch)
+        obatch._initialize(buffer, offsets, names, self._salt_level)
+        return obatch
+
+    def _joined(self, indices: Iterable[int]) -> bytes:
+        """
+        Concatenate the sequences of the primers at the given indices and return them.
+
+        :param indices: primers indices
+        """
+        indices = list(indices)
+        starts = map(self._offsets.__getitem__, indices)
+        ends = map(self._offsets.__getitem__, map((1).__add__, indices))
+        return b"".join(map(self._buffer.__getitem__, map(slice, starts, ends)))
+
+    def __iter__(self) -> Iterator[Primer]:
+        """Iterate through the batch primers as Primer objects."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def variants(self, indels: bool = False) -> Generator[Tuple[int, Variant], None, None]:
+        """
+        Generate the single-base variants of every primer and yield them with the index of their primer.
+
+        :param indels: include insertions and deletions flag
+        """
+        for index, sequence in enumerate(self.sequences):
+            for variant in sequence_variants(sequence, self._salt_level, indels):
+                yield index, variant
+
+    def sequence(self, index: int) -> str:
+        """
+        Return the sequence of the primer at the given index.
+
+        :param index: primer index
+        """
+        return self._buffer[self._offsets[index]:self._offsets[index + 1]].decode("ascii")
+
+    def name(self, index: int) -> str:
+        """
+        Return the name of the primer at the given index.
+
+        :param index: primer index
+        """
+        if self._names is None:
+            return DEFAULT_PRIMER_NAME
+        return self._names[index]
+
+    @property
+    def sequences(self) -> List[str]:
+        """Return the primers sequences."""
+        return [self.sequence(index) for index in range(len(self))]
+
+    @property
+    def names(self) -> List[str]:
+        """Return the primers names."""
+        if self._names is None:
+            return [DEFAULT_PRIMER_NAME] * len(self)
+        return list(self._names)
+
+    @property
+    def salt(self) -> float:
+        """Return the Sodium ion concentration in millimoles (unit mM)."""
+        return self._salt_level
+
+    @property
+    def lengths(self) -> array:
+        """Return the primers lengths."""
+        return array('Q', map(sub, self._offsets[1:], self._offsets[:-1]))
+
+    @property
+    def base_counts(self) -> Tuple[array, array, array, array]:
+        """Count the A, T, C and G bases of every primer and return them as four arrays."""
+        if self._base_counts is None:
+            starts, ends = self._offsets[:-1], self._offsets[1:]
+            self._base_counts = tuple(
+                array('Q', map(self._buffer.count, repeat(base), starts, ends)) for base in (b"A", b"T", b"C", b"G"))
+        return self._base_counts
+
+    def _pair_codes(self) -> bytes:
+        """Encode the dinucleotide starting at every position of the buffer as one byte and return them."""
+        if self._pair_codes_buffer is None:
+            buffer = self._buffer
+            first_bases = int.from_bytes(buffer.translate(PAIR_FIRST_BASE_TABLE), "big")
+            second_bases = int.from_bytes(buffer[1:].translate(PAIR_SECOND_BASE_TABLE) + b"\x00", "big")
+            # the codes are at most 15, so adding the bytes as big-endian integers never carries between positions
+            self._pair_codes_buffer = (first_bases + second_bases).to_bytes(len(buffer), "big")
+        return self._pair_codes_buffer
+
+    def _pair_sums(self, weights: Tuple[bytes, int]) -> List[int]:
+        """
+        Sum the integer weights of the dinucleotides of every primer and return them.
+
+        :param weights: translation table of the dinucleotide codes to their weights, minus the offset, and the offset
+        """
+        table, offset = weights
+        weighted = self._pair_codes().translate(table)
+        starts = self._offsets[:-1]
+        pair_ends = list(map(max, starts, map(sub, self._offsets[1:], repeat(1))))
+        sums = map(sum, map(weighted.__getitem__, map(slice, starts, pair_ends)))
+        return list(map(add, sums, map(mul, map(sub, pair_ends, starts), repeat(offset))))
+
+    def _inner_base_sums(self, table: bytes) -> List[int]:
+        """
+        Sum the integer weights of the bases of every primer, without its first and last base, and return them.
+
+        :param table: translation table of the bases to their weights
+        """
+        weighted = self._buffer.translate(table)
+        starts = map(add, self._offsets[:-1], repeat(1))
+        ends = map(sub, self._offsets[1:], repeat(1))
+        return list(map(sum, map(weighted.__getitem__, map(slice, starts, ends))))
+
+    def _stored(self, name: str, parameters: str, column: Callable[[PrimerBatch], Sequence[Any]]) -> Sequence[Any]:
+        """
+        Calculate a property column, reading and writing the results of the property store if one is open.
+
+        Only the sequences missing in the store are calculated, as a batch of their own.
+
+        :param name: property name
+        :param parameters: calculation parameters
+        :param column: function calculating the property column of a batch
+        """
+        property_store = get_property_store()
+        if property_store is None:
+            return column(self)
+        sequences = self.sequences
+        values = property_store.get_many(name, parameters, set(sequences))
+        missing = [sequence for sequence in dict.fromkeys(sequences) if sequence not in values]
+        if missing:
+            with catch_warnings():
+                # length warnings have already been raised by this batch
+                simplefilter("ignore")
+                missing_batch = PrimerBatch(missing, salt=self._salt_level)
+            missing_values = dict(zip(missing, column(missing_batch)))
+            property_store.put_many(name, parameters, missing_values.items())
+            values.update(missing_values)
+        return [values[sequence] for sequence in sequences]
+
+    def _molecular_weight_column(self) -> Sequence[float]:
+        """Calculate the molecular weight of every primer and return them."""
+        return [molecular_weight_from_counts(*counts) for counts in zip(*self.base_counts)]
+
+    @property
+    def molecular_weight(self) -> array:
+        """Calculate the molecular weight of every primer and return them."""
+        if self._molecular_weight is None:
+            self._molecular_weight = array('d', self._stored(
+                "molecular_weight", "", PrimerBatch._molecular_weight_column))
+        return self._molecular_weight
+
+    def _compute_gc_content(self) -> Diagnostic:
+        """Calculate gc content of every primer, record their diagnostics and return the newly found conditions."""
+        found = Diagnostic.NONE
+        if self._gc_content is None:
+            _, _, c_counts, g_counts = self.base_counts
+            self._gc_content = array('d', (
+                (g_count + c_count) / length
+                for c_count, g_count, length in zip(c_counts, g_counts, self.lengths)))
+            for index, gc_content in enumerate(self._gc_content):
+                diagnostic = gc_content_diagnostic(gc_content)
+                self._diagnostics[index] |= diagnostic
+                found |= diagnostic
+        return found
+
+    @property
+    def gc_content(self) -> array:
+        """Calculate gc content of every primer and return them."""
+        report_diagnostic(self._compute_gc_content())
+        return self._gc_content
+
+    @property
+    def diagnostics(self) -> array:
+        """
+        Return the Diagnostic flags of every primer.
+
+        The conditions of the batch are reported once, when they are first found, and the flags record which primers
+        they were found in.
+        """
+        self._compute_gc_content()
+        return self._diagnostics
+
+    @property
+    def gc_clamp(self) -> array:
+        """Calculate GC clamp of every primer and return them."""
+        if self._gc_clamp is None:
+            buffer = self._buffer
+            self._gc_clamp = array('Q', (
+                0 if end - start < 5 else buffer.count(b"G", end - 5, end) + buffer.count(b"C", end - 5, end)
+                for start, end in self._spans()))
+        return self._gc_clamp
+
+    def _E260_column(self) -> Sequence[float]:
+        """Calculate the extinction coefficient at 260 nm of every primer and return them."""
+        pair_sums = self._pair_sums(NN53_E260_WEIGHTS)
+        base_sums = self._inner_base_sums(BASE_E260_WEIGHTS_TABLE)
+        return list(map(E260_SCALE.__rtruediv__, map(sub, pair_sums, base_sums)))
+
+    @property
+    def E260(self) -> array:
+        """Calculate the extinction coefficient at 260 nm of every primer and return them."""
+        if self._E260 is None:
+            self._E260 = array('d', self._stored("E260", "", PrimerBatch._E260_column))
+        return self._E260
+
+    def _thermodynamics_constants_column(self) -> Sequence[Tuple[float, float]]:
+        """Calculate ΔH (in kcal/mol) and ΔS (in kcal/mol·K) of every primer and return them."""
+        delta_h = map(DELTA_H_SCALE.__rtruediv__, self._pair_sums(DELTA_H_WEIGHTS))
+        delta_s = map(DELTA_S_SCALE.__rtruediv__, self._pair_sums(DELTA_S_WEIGHTS))
+        return list(zip(delta_h, delta_s))
+
+    def _thermodynamics_constants(self) -> None:
+        """Calculate ΔH (in kcal/mol) and ΔS (in kcal/mol·K) of every primer."""
+        constants = self._stored("thermodynamics_constants", "", PrimerBatch._thermodynamics_constants_column)
+        self._delta_h = array('d', (delta_h for delta_h, _ in constants))
+        self._delta_s = array('d', (delta_s for _, delta_s in constants))
+
+    @property
+    def delta_h(self) -> array:
+        """Calculate enthalpy change, ΔH (in kcal/mol), of every primer and return them."""
+        if self._delta_h is None:
+            self._thermodynamics_constants()
+        return self._delta_h
+
+    @property
+    def delta_s(self) -> array:
+        """Calculate entropy change, ΔS (in kcal/mol·K), of every primer and return them."""
+        if self._delta_s is None:
+            self._thermodynamics_constants()
+        return self._delta_s
+
+    def melting_temperature(self, method: MeltingTemperature = MeltingTemperature.BASIC) -> array:
+        """
+        Calculate the approximated melting temperature of every primer and return them.
+
+        :param method: requested calculation mode for melting temperature
+        """
+        if method not in self._melting_temperature:
+            raise NotImplementedError(PRIMER_MELTING_TEMPERATURE_NOT_IMPLEMENTED_ERROR)
+        if self._melting_temperature[method] is None:
+            self._melting_temperature[method] = array('d', self._stored(
+                MELTING_TEMPERATURE_SLOTS[method][1:], melting_temperature_parameters(method, self._salt_level),
+                lambda batch: batch._melting_temperature_column(method)))
+        return self._melting_temperature[method]
+
+    def _melting_temperature_column(self, method: MeltingTemperature) -> Sequence[float]:
+        """
+        Calculate the approximated melting temperature of every primer and return them.
+
+        :param method: requested calculation mode for melting temperature
+        """
+        if method == MeltingTemperature.BASIC:
+            return [basic_melting_temperature_from_counts(*counts) for counts in zip(*self.base_counts)]
+        if method == MeltingTemperature.SALT_ADJUSTED:
+            return [salt_adjusted_melting_temperature_from_counts(*counts, self._salt_level)
+                    for counts in zip(*self.base_counts)]
+        # the method is MeltingTemperature.NEAREST_NEIGHBOR
+        return [nearest_neighbor_melting_temperature_calc("", self._salt_level, (delta_h, delta_s))
+                for delta_h, delta_s in zip(self.delta_h, self.delta_s)]
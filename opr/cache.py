@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""OPR process-wide property cache."""
+from typing import Callable, Hashable, Optional, NamedTuple, Any
+from collections import OrderedDict
+import threading
+from .errors import OPRBaseError
+from .params import PROPERTY_CACHE_DEFAULT_SIZE, PROPERTY_CACHE_SIZE_ERROR
+
+
+class PropertyCacheInfo(NamedTuple):
+    """Statistics of a property cache."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class PropertyCache:
+    """
+    The PropertyCache class is a thread-safe, size-bounded LRU cache of primer properties.
+
+    Entries are keyed by the property, the sequence and the parameters the property depends on (such as salt), so
+    every Primer with the same sequence shares them.
+
+    >>> ocache = enable_property_cache(maxsize=10000)
+    >>> Primer("ATCGATCGATCGATCGAT").E260
+    >>> ocache.info()
+    """
+
+    def __init__(self, maxsize: int = PROPERTY_CACHE_DEFAULT_SIZE) -> None:
+        """
+        Initialize the PropertyCache instance.
+
+        :param maxsize: maximum number of cached entries
+        """
+        PropertyCache._validate_maxsize(maxsize)
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _validate_maxsize(maxsize: int) -> None:
+        """
+        Validate the maximum number of cached entries.
+
+        :param maxsize: maximum number of cached entries
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise OPRBaseError(PROPERTY_CACHE_SIZE_ERROR)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value of the key, or compute, cache and return it.
+
+        The lock is not held while computing, so a value may be computed more than once by concurrent threads.
+
+        :param key: cache key
+        :param compute: function computing the value
+        """
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self._misses += 1
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def info(self) -> PropertyCacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return PropertyCacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the maximum number of cached entries, dropping the least recently used ones if needed.
+
+        :param maxsize: maximum number of cached entries
+        """
+        PropertyCache._validate_maxsize(maxsize)
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._data)
+
+
+_property_cache = None
+
+
+def enable_property_cache(maxsize: int = PROPERTY_CACHE_DEFAULT_SIZE) -> PropertyCache:
+    """
+    Enable the process-wide property cache consulted by all Primer instances and return it.
+
+    If the cache is already enabled it is resized and kept.
+
+    :param maxsize: maximum number of cached entries
+    """
+    global _property_cache
+    if _property_cache is None:
+        _property_cache = PropertyCache(maxsize)
+    else:
+        _property_cache.resize(maxsize)
+    return _property_cache
+
+
+def disable_property_cache() -> None:
+    """Disable the process-wide property cache and drop its entries."""
+    global _property_cache
+    _property_cache = None
+
+
+def get_property_cache() -> Optional[PropertyCache]:
+    """Return the process-wide property cache, or None if it is disabled."""
+    return _property_cache
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""OPR diagnostics."""
+from typing import Generator, Iterable, Dict
+from enum import Enum, IntFlag
+from contextlib import contextmanager
+from collections import Counter
+from warnings import warn
+from .errors import OPRBaseError
+from .params import PRIMER_LOWER_LENGTH, PRIMER_HIGHEST_LENGTH, PRIMER_LOWEST_GC_RANGE, PRIMER_HIGHEST_GC_RANGE
+from .params import PRIMER_SEQUENCE_LENGTH_WARNING, PRIMER_SEQUENCE_VALID_GC_CONTENT_RANGE_WARNING
+from .params import DIAGNOSTICS_MODE_ERROR
+
+
+class Diagnostic(IntFlag):
+    """Conditions found in a primer, combined as bit flags."""
+
+    NONE = 0
+    LENGTH_OUT_OF_RANGE = 1
+    GC_CONTENT_OUT_OF_RANGE = 2
+
+
+class DiagnosticsMode(Enum):
+    """How found conditions are reported, besides being recorded as Diagnostic flags."""
+
+    WARN = 1
+    RECORD = 2
+    RAISE = 3
+
+
+DIAGNOSTIC_MESSAGES = {
+    Diagnostic.LENGTH_OUT_OF_RANGE: PRIMER_SEQUENCE_LENGTH_WARNING,
+    Diagnostic.GC_CONTENT_OUT_OF_RANGE: PRIMER_SEQUENCE_VALID_GC_CONTENT_RANGE_WARNING,
+}
+
+_diagnostics_mode = DiagnosticsMode.WARN
+
+
+def set_diagnostics_mode(mode: DiagnosticsMode) -> None:
+    """
+    Set the process-wide diagnostics mode.
+
+    In the WARN mode (default) a RuntimeWarning is issued for each found condition, in the RECORD mode conditions are
+    only recorded as Diagnostic flags and in the RAISE mode an OPRBaseError is raised.
+
+    :param mode: diagnostics mode
+    """
+    global _diagnostics_mode
+    if not isinstance(mode, DiagnosticsMode):
+        raise OPRBaseError(DIAGNOSTICS_MODE_ERROR)
+    _diagnostics_mode = mode
+
+
+def get_diagnostics_mode() -> DiagnosticsMode:
+    """Return the process-wide diagnostics mode."""
+    return _diagnostics_mode
+
+
+@contextmanager
+def diagnostics_mode(mode: DiagnosticsMode) -> Generator[None, None, None]:
+    """
+    Use the given diagnostics mode in a context and restore the previous one at its end.
+
+    :param mode: diagnostics mode
+    """
+    previous_mode = _diagnostics_mode
+    set_diagnostics_mode(mode)
+    try:
+        yield
+    finally:
+        set_diagnostics_mode(previous_mode)
+
+
+def report_diagnostic(diagnostic: Diagnostic) -> None:
+    """
+    Report found conditions according to the diagnostics mode.
+
+    :param diagnostic: found conditions
+    """
+    if not diagnostic or _diagnostics_mode == DiagnosticsMode.RECORD:
+        return
+    for flag, message in DIAGNOSTIC_MESSAGES.items():
+        if diagnostic & flag:
+            if _diagnostics_mode == DiagnosticsMode.RAISE:
+                raise OPRBaseError(message)
+            warn(message, RuntimeWarning)
+
+
+def length_diagnostic(length: int) -> Diagnostic:
+    """
+    Check a primer length and return the found condition.
+
+    :param length: primer length
+    """
+    if length < PRIMER_LOWER_LENGTH or length > PRIMER_HIGHEST_LENGTH:
+        return Diagnostic.LENGTH_OUT_OF_RANGE
+    return Diagnostic.NONE
+
+
+def gc_content_diagnostic(gc_content: float) -> Diagnostic:
+    """
+    Check a primer GC content and return the found condition.
+
+    :param gc_content: primer GC content
+    """
+    if gc_content < PRIMER_LOWEST_GC_RANGE or gc_content > PRIMER_HIGHEST_GC_RANGE:
+        return Diagnostic.GC_CONTENT_OUT_OF_RANGE
+    return Diagnostic.NONE
+
+
+def count_diagnostics(diagnostics: Iterable[int]) -> Dict[Diagnostic, int]:
+    """
+    Count the primers with each condition and return the counts.
+
+    :param diagnostics: Diagnostic flags of the primers
+    """
+    counts = {}
+    for value, count in Counter(diagnostics).items():
+        for flag in DIAGNOSTIC_MESSAGES:
+            if value & flag:
+                counts[flag] = counts.get(flag, 0) + count
+    return {flag: counts.get(flag, 0) for flag in DIAGNOSTIC_MESSAGES}
+
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""OPR primer-dimer detection."""
+from typing import Hashable, Iterable, Iterator, Optional, List, Tuple, Dict, Set, NamedTuple
+from collections import defaultdict
+from .errors import OPRBaseError
+from .primer import Primer
+from .params import DEFAULT_TEMPERATURE
+from .params import DIMER_PRIMER_TYPE_ERROR, DIMER_SEED_LENGTH_ERROR
+from .params import DIMER_INDEX_KEY_ERROR, DIMER_INDEX_DUPLICATE_KEY_ERROR
+from .functions import NN_PAIR_PARAMS, delta_g_calc, reverse_complement_calc
+
+
+class Dimer(NamedTuple):
+    """
+    Complementarity of two primers annealed to each other.
+
+    `longest_complementarity` is the longest stretch of consecutive complementary bases, `end_complementarity` is the
+    longest stretch of complementary bases that starts at the 3' end of one of the primers and `delta_g` is the
+    nearest-neighbor ΔG (in kcal/mol) of the most stable alignment.
+    """
+
+    longest_complementarity: int
+    end_complementarity: int
+    delta_g: float
+
+
+class _EncodedSequence(NamedTuple):
+    """Bit-parallel encoding of a sequence."""
+
+    length: int
+    masks: Dict[str, int]
+    reverse_complement_masks: Dict[str, int]
+    stack_delta_g: List[float]
+
+
+def _encode(sequence: str, temperature: float) -> _EncodedSequence:
+    """
+    Encode a sequence as one bitmask per base (bit i is set if base i is that base) and return it.
+
+    :param sequence: nucleotides sequence
+    :param temperature: temperature of the ΔG calculations (unit °C)
+    """
+    reverse_complement = reverse_complement_calc(sequence)
+    masks = dict.fromkeys("ATCG", 0)
+    reverse_complement_masks = dict.fromkeys("ATCG", 0)
+    for index, base in enumerate(sequence):
+        masks[base] |= 1 << index
+    for index, base in enumerate(reverse_complement):
+        reverse_complement_masks[base] |= 1 << index
+    stack_delta_g = [delta_g_calc(*NN_PAIR_PARAMS[sequence[index:index + 2]], temperature)
+                     for index in range(len(sequence) - 1)]
+    return _EncodedSequence(len(sequence), masks, reverse_complement_masks, stack_delta_g)
+
+
+def _dimer(first: _EncodedSequence, second: _EncodedSequence, shifts: Optional[Iterable[int]] = None) -> Dimer:
+    """
+    Align two encoded sequences antiparallel at the given shifts and return their complementarity.
+
+    At shift d, base i of the first sequence is paired with base i - d of the reverse complement of the second one,
+    and the complementary positions of all 4 bases are found with bitwise operations.
+
+    :param first: first encoded sequence
+    :param second: second encoded sequence
+    :param shifts: alignment shifts, all overlapping alignments if None
+    """
+    if shifts is None:
+        shifts = range(1 - second.length, first.length)
+    full_mask = (1 << first.length) - 1
+    longest_complementarity = 0
+    end_complementarity = 0
+    delta_g = 0.0
+    for shift in shifts:
+        match = 0
+        for base, mask in first.masks.items():
+            other_mask = second.reverse_complement_masks[base]
+            match |= mask & (other_mask << shift if shift >= 0 else other_mask >> -shift)
+        if not match:
+            continue
+        run_mask = match
+        run_length = 0
+        while run_mask:
+            run_mask &= run_mask >> 1
+            run_length += 1
+        longest_complementarity = max(longest_complementarity, run_length)
+        # 3' end of the first sequence is its last bit
+        end_complementarity = max(end_complementarity, first.length - (~match & full_mask).bit_length())
+        # 3' end of the second sequence is paired with the base `shift` of the first sequence
+        if shift >= 0:
+            end_match = match >> shift
+            end_complementarity = max(end_complementarity, (end_match ^ (end_match + 1)).bit_length() - 1)
+        # stacked pairs are consecutive complementary bases
+        stacks = match & (match >> 1)
+        alignment_delta_g = 0.0
+        while stacks:
+            lowest_bit = stacks & -stacks
+            alignment_delta_g += first.stack_delta_g[lowest_bit.bit_length() - 1]
+            stacks ^= lowest_bit
+        delta_g = min(delta_g, alignment_delta_g)
+    return Dimer(longest_complementarity, end_complementarity, delta_g)
+
+
+def cross_dimer(primer1: Primer, primer2: Primer, temperature: float = DEFAULT_TEMPERATURE) -> Dimer:
+    """
+    Calculate the complementarity of two primers and return it.
+
+    :param primer1: first primer
+    :param primer2: second primer
+    :param temperature: temperature of the ΔG calculations (unit °C)
+    """
+    if not isinstance(primer1, Primer) or not isinstance(primer2, Primer):
+        raise OPRBaseError(DIMER_PRIMER_TYPE_ERROR)
+    return _dimer(_encode(primer1.sequence, temperature), _encode(primer2.sequence, temperature))
+
+
+def self_dimer(primer: Primer, temperature: float = DEFAULT_TEMPERATURE) -> Dimer:
+    """
+    Calculate the complementarity of a primer with itself and return it.
+
+    :param primer: primer
+    :param temperature: temperature of the ΔG calculations (unit °C)
+    """
+    return cross_dimer(primer, primer, temperature)
+
+
+class DimerIndex:
+    """
+    The DimerIndex class keeps the seeds (k-mers) of primers in an inverted index to find their dimers.
+
+    An indexed primer is probed with the seeds of its reverse complement, so only the primers sharing a complementary
+    seed with it are scored, and only at the alignments given by the seeds. Any alignment with at least
+    `seed_length` consecutive complementary bases is one of them.
+
+    >>> oindex = DimerIndex(seed_length=6)
+    >>> oindex.add("forward", Primer("CTGGAGGACGGAAGAGGAAGTAA"))
+    >>> oindex.add("reverse", Primer("TTACTTCCTCTTCCGTCC"))
+    >>> oindex.dimers("reverse")
+    """
+
+    def __init__(self, seed_length: int = 6, temperature: float = DEFAULT_TEMPERATURE) -> None:
+        """
+        Initialize the DimerIndex instance.
+
+        :param seed_length: length of the seeds
+        :param temperature: temperature of the ΔG calculations (unit °C)
+        """
+        if not isinstance(seed_length, int) or seed_length < 1:
+            raise OPRBaseError(DIMER_SEED_LENGTH_ERROR)
+        self._seed_length = seed_length
+        self._temperature = temperature
+        self._sequences = {}
+        self._encoded = {}
+        self._index = defaultdict(dict)
+
+    def _seeds(self, sequence: str) -> Iterator[Tuple[int, str]]:
+        """
+        Iterate through the (position, seed) pairs of a sequence.
+
+        :param sequence: nucleotides sequence
+        """
+        for position in range(len(sequence) - self._seed_length + 1):
+            yield position, sequence[position:position + self._seed_length]
+
+    def _sequence(self, key: Hashable) -> str:
+        """
+        Return the sequence of an indexed primer.
+
+        :param key: primer key
+        """
+        if key not in self._sequences:
+            raise OPRBaseError(DIMER_INDEX_KEY_ERROR)
+        return self._sequences[key]
+
+    def add(self, key: Hashable, primer: Primer) -> None:
+        """
+        Add a primer to the index.
+
+        :param key: primer key
+        :param primer: primer
+        """
+        if not isinstance(primer, Primer):
+            raise OPRBaseError(DIMER_PRIMER_TYPE_ERROR)
+        if key in self._sequences:
+            raise OPRBaseError(DIMER_INDEX_DUPLICATE_KEY_ERROR)
+        sequence = primer.sequence
+        self._sequences[key] = sequence
+        self._encoded[key] = _encode(sequence, self._temperature)
+        for position, seed in self._seeds(sequence):
+            self._index[seed].setdefault(key, []).append(position)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove a primer from the index.
+
+        :param key: primer key
+        """
+        for _, seed in self._seeds(self._sequence(key)):
+            keys = self._index.get(seed)
+            if keys is not None and key in keys:
+                del keys[key]
+                if not keys:
+                    del self._index[seed]
+        del self._sequences[key]
+        del self._encoded[key]
+
+    def _shifts(self, key: Hashable, other_key: Optional[Hashable] = None) -> Dict[Hashable, Set[int]]:
+        """
+        Find the alignment shifts of the complementary seeds of an indexed primer with the other indexed primers.
+
+        :param key: primer key
+        :param other_key: key of the only primer to probe, all primers if None
+        """
+        shifts = defaultdict(set)
+        for reverse_position, seed in self._seeds(reverse_complement_calc(self._sequence(key))):
+            keys = self._index.get(seed, {})
+            if other_key is not None:
+                keys = {other_key: keys[other_key]} if other_key in keys else {}
+            for found_key, positions in keys.items():
+                shifts[found_key].update(position - reverse_position for position in positions)
+        return shifts
+
+    def dimers(self, key: Hashable) -> Dict[Hashable, Dimer]:
+        """
+        Find the indexed primers (the primer itself included) sharing a complementary seed with a primer and return
+        their complementarity with it by key.
+
+        The found primer is the first of each Dimer and the given one is the second.
+
+        :param key: primer key
+        """
+        return {other_key: _dimer(self._encoded[other_key], self._encoded[key], sorted(shifts))
+                for other_key, shifts in self._shifts(key).items()}
+
+    def dimer(self, first_key: Hashable, second_key: Hashable) -> Optional[Dimer]:
+        """
+        Calculate the complementarity of two indexed primers and return it, None if they share no complementary seed.
+
+        :param first_key: first primer key
+        :param second_key: second primer key
+        """
+        self._sequence(first_key)
+        shifts = self._shifts(second_key, first_key)
+        if not shifts:
+            return None
+        return _dimer(self._encoded[first_key], self._encoded[second_key], sorted(shifts[first_key]))
+
+    def shared_seeds(self, key: Hashable) -> Dict[Hashable, int]:
+        """
+        Count the distinct seeds of a primer found in each other indexed primer and return the counts by key.
+
+        :param key: primer key
+        """
+        shared_seeds = defaultdict(int)
+        for seed in {seed for _, seed in self._seeds(self._sequence(key))}:
+            for other_key in self._index[seed]:
+                if other_key != key:
+                    shared_seeds[other_key] += 1
+        return dict(shared_seeds)
+
+    @property
+    def seed_length(self) -> int:
+        """Return the seed length."""
+        return self._seed_length
+
+    def __len__(self) -> int:
+        """Return the number of indexed primers."""
+        return len(self._sequences)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """
+        Check whether the index has a primer with the given key.
+
+        :param key: primer key
+        """
+        return key in self._sequences
+
+
+def dimer_matrix(primers: Iterable[Primer], seed_length: int = 6,
+                 temperature: float = DEFAULT_TEMPERATURE) -> List[Tuple[int, int, Dimer]]:
+    """
+    Find all primer pairs (including self-dimers) with at least `seed_length` consecutive complementary bases.
+
+    The primers are added to a DimerIndex one by one and each one is probed against the primers added before it and
+    itself, so only pairs sharing a seed are scored. Results are returned as (i, j, Dimer) tuples with i <= j, ordered
+    by i and j.
+
+    :param primers: primers
+    :param seed_length: minimum length of the complementary stretches
+    :param temperature: temperature of the ΔG calculations (unit °C)
+    """
+    oindex = DimerIndex(seed_length, temperature)
+    primers = list(primers)
+    if not all(isinstance(primer, Primer) for primer in primers):
+        raise OPRBaseError(DIMER_PRIMER_TYPE_ERROR)
+    result = []
+    for second_index, primer in enumerate(primers):
+        oindex.add(second_index, primer)
+        for first_index, dimer in oindex.dimers(second_index).items():
+            result.append((first_index, second_index, dimer))
+    result.sort(key=lambda item: item[:2])
+    return result
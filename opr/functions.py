@@ -1,54 +1,153 @@
 # -*- coding: utf-8 -*-
 """OPR functions."""
-from typing import Tuple
+from typing import Sequence, Tuple, List, Dict, Any
 import math
+import itertools
+from operator import add
 from .params import A_WEIGHT, T_WEIGHT, C_WEIGHT, G_WEIGHT, ANHYDROUS_MOLECULAR_WEIGHT_CONSTANT
 from .params import BASE_EXTINCTION_COEFFICIENTS, NN53_EXTINCTION_COEFFICIENTS
-from .params import NN_PARAMS, DNA_COMPLEMENT_MAP
+from .params import NN_PARAMS, DNA_COMPLEMENT_MAP, VALID_BASES
+from .params import VALID_BASES_BYTES, DNA_COMPLEMENT_TABLE, DNA_COMPLEMENT_BYTES_TABLE
+from .params import RUNS_UNIT_LENGTH_ERROR, DEFAULT_TEMPERATURE, KELVIN_OFFSET, FILE_BLOCK_ALIGNMENT
+from .errors import OPRBaseError
 
-def molecular_weight_calc(sequence: str) -> float:
+# Nearest-neighbor parameters of all 16 dinucleotides, including the reverse complement ones missing in NN_PARAMS
+NN_PAIR_PARAMS = {
+    first + second: NN_PARAMS.get(first + second, NN_PARAMS.get(DNA_COMPLEMENT_MAP[second] + DNA_COMPLEMENT_MAP[first]))
+    for first, second in itertools.product("ACGT", repeat=2)
+}
+# Sums of the nearest-neighbor terms are kept as integers (ΔH in 0.1 kcal/mol, ΔS in 0.0001 kcal/mol·K and E260 in
+# 0.1 L ⋅ mmol-1 ⋅ cm-1), so they are exact whatever order the terms are added in
+DELTA_H_SCALE = 10
+DELTA_S_SCALE = 10000
+E260_SCALE = 10
+NN_SCALED_PARAMS = {
+    pair: (round(dh * DELTA_H_SCALE), round(ds * DELTA_S_SCALE)) for pair, (dh, ds) in NN_PAIR_PARAMS.items()
+}
+NN_SCALED_DELTA_H = {pair: dh for pair, (dh, _) in NN_SCALED_PARAMS.items()}
+NN_SCALED_DELTA_S = {pair: ds for pair, (_, ds) in NN_SCALED_PARAMS.items()}
+NN53_SCALED_EXTINCTION_COEFFICIENTS = {
+    first + second: round(value * E260_SCALE)
+    for first, coefficients in NN53_EXTINCTION_COEFFICIENTS.items() for second, value in coefficients.items()
+}
+BASE_SCALED_EXTINCTION_COEFFICIENTS = {
+    base: round(value * E260_SCALE) for base, value in BASE_EXTINCTION_COEFFICIENTS.items()}
+
+
+def is_valid_sequence(sequence: str) -> bool:
     """
-    Calculate molecular weight and return it.
+    Check whether an uppercase sequence only contains the A, T, C and G bases and return the result.
 
-    :param sequence: primer nucleotides sequence
+    :param sequence: nucleotides sequence
+    """
+    return not sequence.encode("ascii", "replace").translate(None, VALID_BASES_BYTES)
+
+
+def is_valid_buffer(buffer: bytes) -> bool:
+    """
+    Check whether a buffer of uppercase ASCII sequences only contains the A, T, C and G bases and return the result.
+
+    :param buffer: concatenated nucleotides sequences
+    """
+    return not buffer.translate(None, VALID_BASES_BYTES)
+
+
+def complement_calc(sequence: str) -> str:
+    """
+    Calculate the complement of a sequence and return it.
+
+    :param sequence: nucleotides sequence
+    """
+    return sequence.translate(DNA_COMPLEMENT_TABLE)
+
+
+def reverse_complement_calc(sequence: str) -> str:
+    """
+    Calculate the reverse complement of a sequence and return it.
+
+    :param sequence: nucleotides sequence
+    """
+    return sequence[::-1].translate(DNA_COMPLEMENT_TABLE)
+
+
+def complement_buffer(buffer: bytes) -> bytes:
+    """
+    Calculate the complement of every sequence in a buffer and return them in the same layout.
+
+    :param buffer: concatenated nucleotides sequences
+    """
+    return buffer.translate(DNA_COMPLEMENT_BYTES_TABLE)
+
+
+def reverse_complement_buffer(buffer: bytes, offsets: Sequence[int]) -> bytes:
+    """
+    Calculate the reverse complement of every sequence in a buffer and return them in the same layout.
+
+    The whole buffer is complemented and reversed at once, which reverses the order of the sequences as well, so each
+    sequence is then sliced back to its original place.
+
+    :param buffer: concatenated nucleotides sequences
+    :param offsets: start offsets of the sequences followed by the end offset of the last one
+    """
+    reversed_buffer = buffer.translate(DNA_COMPLEMENT_BYTES_TABLE)[::-1]
+    size = len(buffer)
+    return b"".join(reversed_buffer[size - end:size - start] for start, end in zip(offsets, offsets[1:]))
+
+
+def padding_calc(size: int) -> int:
+    """
+    Calculate the number of bytes needed to align a file block of the given size to FILE_BLOCK_ALIGNMENT bytes.
+
+    :param size: block size
+    """
+    return -size % FILE_BLOCK_ALIGNMENT
+
+
+def molecular_weight_from_counts(a_count: int, t_count: int, c_count: int, g_count: int) -> float:
+    """
+    Calculate molecular weight from the base counts and return it.
+
+    :param a_count: number of A bases
+    :param t_count: number of T bases
+    :param c_count: number of C bases
+    :param g_count: number of G bases
     """
-    a_count = sequence.count('A')
-    t_count = sequence.count('T')
-    c_count = sequence.count('C')
-    g_count = sequence.count('G')
     return (a_count * A_WEIGHT) + (t_count * T_WEIGHT) + (c_count * C_WEIGHT) + \
         (g_count * G_WEIGHT) - ANHYDROUS_MOLECULAR_WEIGHT_CONSTANT
 
 
-def basic_melting_temperature_calc(sequence: str) -> float:
+def basic_melting_temperature_from_counts(a_count: int, t_count: int, c_count: int, g_count: int) -> float:
     """
-    Calculate basic melting temperature and return it.
+    Calculate basic melting temperature from the base counts and return it.
 
-    :param sequence: primer nucleotides sequence
+    :param a_count: number of A bases
+    :param t_count: number of T bases
+    :param c_count: number of C bases
+    :param g_count: number of G bases
     """
-    a_count = sequence.count('A')
-    t_count = sequence.count('T')
-    c_count = sequence.count('C')
-    g_count = sequence.count('G')
-    if len(sequence) <= 13:
+    if a_count + t_count + c_count + g_count <= 13:
         melting_temperature = (a_count + t_count) * 2 + (g_count + c_count) * 4
     else:
         melting_temperature = 64.9 + 41 * ((g_count + c_count - 16.4) / (a_count + t_count + g_count + c_count))
     return melting_temperature
 
 
-def salt_adjusted_melting_temperature_calc(sequence: str, salt: float) -> float:
+def salt_adjusted_melting_temperature_from_counts(
+        a_count: int,
+        t_count: int,
+        c_count: int,
+        g_count: int,
+        salt: float) -> float:
     """
-    Calculate the salt-adjusted melting temperature (Tm) of a primer sequence and return it.
+    Calculate the salt-adjusted melting temperature (Tm) from the base counts and return it.
 
-    :param sequence: Primer nucleotides sequence
+    :param a_count: number of A bases
+    :param t_count: number of T bases
+    :param c_count: number of C bases
+    :param g_count: number of G bases
     :param salt: Sodium ion concentration in moles (unit mM)
     """
-    a_count = sequence.count('A')
-    t_count = sequence.count('T')
-    c_count = sequence.count('C')
-    g_count = sequence.count('G')
-    seq_length = len(sequence)
+    seq_length = a_count + t_count + c_count + g_count
     if seq_length <= 13:
         salt_adjustment = 16.6 * (math.log10(salt) - 3) - 16.6 * math.log10(0.050)
         tm = (a_count + t_count) * 2 + (g_count + c_count) * 4 + salt_adjustment
@@ -61,26 +160,47 @@ def salt_adjusted_melting_temperature_calc(sequence: str, salt: float) -> float:
     return tm
 
 
+def molecular_weight_calc(sequence: str) -> float:
+    """
+    Calculate molecular weight and return it.
+
+    :param sequence: primer nucleotides sequence
+    """
+    return molecular_weight_from_counts(
+        sequence.count('A'), sequence.count('T'), sequence.count('C'), sequence.count('G'))
+
+
+def basic_melting_temperature_calc(sequence: str) -> float:
+    """
+    Calculate basic melting temperature and return it.
+
+    :param sequence: primer nucleotides sequence
+    """
+    return basic_melting_temperature_from_counts(
+        sequence.count('A'), sequence.count('T'), sequence.count('C'), sequence.count('G'))
+
+
+def salt_adjusted_melting_temperature_calc(sequence: str, salt: float) -> float:
+    """
+    Calculate the salt-adjusted melting temperature (Tm) of a primer sequence and return it.
+
+    :param sequence: Primer nucleotides sequence
+    :param salt: Sodium ion concentration in moles (unit mM)
+    """
+    return salt_adjusted_melting_temperature_from_counts(
+        sequence.count('A'), sequence.count('T'), sequence.count('C'), sequence.count('G'), salt)
+
+
 def calculate_thermodynamics_constants(sequence: str) -> Tuple[float, float]:
     """
     Calculate ΔH (in kcal/mol) and ΔS (in kcal/mol·K) for a primer sequence and return it.
 
     :param sequence: Primer nucleotides sequence
     """
-    delta_h = 0.0
-    delta_s = 0.0
-
-    # Sum ΔH and ΔS from nearest neighbors
-    for i in range(len(sequence) - 1):
-        pair = sequence[i:i+2]
-        if pair in NN_PARAMS:
-            dh, ds = NN_PARAMS[pair]
-        else:
-            rev_comp_pair = ''.join(DNA_COMPLEMENT_MAP[base] for base in reversed(pair))
-            dh, ds = NN_PARAMS[rev_comp_pair]
-        delta_h += dh
-        delta_s += ds
-    return delta_h, delta_s
+    pairs = list(map(add, sequence, sequence[1:]))
+    delta_h = sum(map(NN_SCALED_DELTA_H.__getitem__, pairs))
+    delta_s = sum(map(NN_SCALED_DELTA_S.__getitem__, pairs))
+    return delta_h / DELTA_H_SCALE, delta_s / DELTA_S_SCALE
 
 
 def nearest_neighbor_melting_temperature_calc(sequence: str, na_salt: float, thermodynamic_constants: Tuple[float, float]) -> float:
@@ -108,6 +228,17 @@ def nearest_neighbor_melting_temperature_calc(sequence: str, na_salt: float, the
     return tm
 
 
+def delta_g_calc(delta_h: float, delta_s: float, temperature: float = DEFAULT_TEMPERATURE) -> float:
+    """
+    Calculate Gibbs free energy change, ΔG (in kcal/mol), from ΔH and ΔS and return it.
+
+    :param delta_h: enthalpy change, ΔH (in kcal/mol)
+    :param delta_s: entropy change, ΔS (in kcal/mol·K)
+    :param temperature: temperature (unit °C)
+    """
+    return delta_h - (temperature + KELVIN_OFFSET) * delta_s
+
+
 def gc_clamp_calc(sequence: str) -> int:
     """
     Calculate GC clamp, number of guanine (G) or cytosine (C) bases in the last 5 bases of the primer, and return it.
@@ -127,9 +258,122 @@ def e260_ssnn_calc(sequence: str) -> float:
 
     :param sequence: primer sequence
     """
-    e260 = 0
-    for i in range(len(sequence) - 1):
-        e260 += NN53_EXTINCTION_COEFFICIENTS[sequence[i]][sequence[i + 1]]
-    for base in sequence[1:-1]:
-        e260 -= BASE_EXTINCTION_COEFFICIENTS[base]
-    return e260
+    e260 = sum(map(NN53_SCALED_EXTINCTION_COEFFICIENTS.__getitem__, map(add, sequence, sequence[1:])))
+    e260 -= sum(map(BASE_SCALED_EXTINCTION_COEFFICIENTS.__getitem__, sequence[1:-1]))
+    return e260 / E260_SCALE
+
+
+def runs_calc(sequence: str, unit_length: int = 1, min_repeats: int = 1) -> List[Tuple[str, int, int]]:
+    """
+    Find maximal runs of single bases (homopolymers) or of 2-base pairs in a linear scan and return them.
+
+    Each run is returned as a (unit, start, repeats) tuple, ordered by start position. A double run is a repeat of a
+    pair of two different bases, e.g. ATATAT is 3 repeats of AT (and 2 repeats of TA starting one base later).
+
+    :param sequence: nucleotides sequence
+    :param unit_length: length of the repeated unit, 1 for single runs and 2 for double runs
+    :param min_repeats: minimum number of repeats of the reported runs
+    """
+    if unit_length not in [1, 2]:
+        raise OPRBaseError(RUNS_UNIT_LENGTH_ERROR)
+    runs = []
+    if unit_length == 1:
+        start = 0
+        for index in range(1, len(sequence) + 1):
+            if index == len(sequence) or sequence[index] != sequence[start]:
+                if index - start >= min_repeats:
+                    runs.append((sequence[start], start, index - start))
+                start = index
+        return runs
+
+    def close(end: int) -> None:
+        # add the runs of an alternating segment [start, end)
+        length = end - start
+        if length >= 2 and length // 2 >= min_repeats:
+            runs.append((sequence[start:start + 2], start, length // 2))
+        if length >= 3 and (length - 1) // 2 >= min_repeats:
+            runs.append((sequence[start + 1:start + 3], start + 1, (length - 1) // 2))
+
+    start = 0
+    for index in range(1, len(sequence)):
+        if sequence[index] == sequence[index - 1]:
+            close(index)
+            start = index
+        elif index - start >= 2 and sequence[index] != sequence[index - 2]:
+            close(index)
+            start = index - 1
+    close(len(sequence))
+    return runs
+
+
+def max_runs_calc(sequence: str, unit_length: int = 1) -> Dict[str, int]:
+    """
+    Calculate the maximum number of consecutive repeats of every single base or 2-base pair and return them.
+
+    :param sequence: nucleotides sequence
+    :param unit_length: length of the repeated unit, 1 for single runs and 2 for double runs
+    """
+    if unit_length == 1:
+        result = dict.fromkeys(VALID_BASES, 0)
+    else:
+        result = {first + second: 0 for first, second in itertools.product(VALID_BASES, repeat=2) if first != second}
+    for unit, _, repeats in runs_calc(sequence, unit_length):
+        if repeats > result[unit]:
+            result[unit] = repeats
+    return result
+
+
+def primer_profile_calc(sequence: str) -> Dict[str, Any]:
+    """
+    Calculate base counts, thermodynamic constants, E260, GC clamp and runs of a primer and return them.
+
+    The base counts, GC clamp and runs are calculated in a single pass over the sequence. The thermodynamic constants
+    and E260 are summed over the dinucleotides with the same integer-scaled terms as
+    `calculate_thermodynamics_constants` and `e260_ssnn_calc`, so the results are identical to them.
+
+    :param sequence: primer sequence
+    """
+    base_counts = dict.fromkeys("ATCG", 0)
+    single_runs = dict.fromkeys(VALID_BASES, 0)
+    double_runs = {first + second: 0 for first, second in itertools.product(VALID_BASES, repeat=2) if first != second}
+    gc_clamp = 0
+    clamp_start = len(sequence) - 5 if len(sequence) >= 5 else len(sequence)
+    single_run = 0
+    # consecutive repeats of the dinucleotides ending at the previous two positions
+    double_run_1 = double_run_2 = 0
+    previous_2 = previous = ""
+    for index, base in enumerate(sequence):
+        base_counts[base] += 1
+        if index >= clamp_start and (base == "G" or base == "C"):
+            gc_clamp += 1
+        if base == previous:
+            single_run += 1
+            double_run = 0
+        else:
+            single_run = 1
+            if previous:
+                pair = previous + base
+                if previous_2 == base and index >= 3 and sequence[index - 3] == previous:
+                    double_run = double_run_2 + 1
+                else:
+                    double_run = 1
+                if double_run > double_runs[pair]:
+                    double_runs[pair] = double_run
+            else:
+                double_run = 0
+        if single_run > single_runs[base]:
+            single_runs[base] = single_run
+        double_run_1, double_run_2 = double_run, double_run_1
+        previous_2, previous = previous, base
+    pairs = list(map(add, sequence, sequence[1:]))
+    e260 = sum(map(NN53_SCALED_EXTINCTION_COEFFICIENTS.__getitem__, pairs))
+    e260 -= sum(map(BASE_SCALED_EXTINCTION_COEFFICIENTS.__getitem__, sequence[1:-1]))
+    return {
+        "base_counts": base_counts,
+        "gc_clamp": gc_clamp,
+        "single_runs": single_runs,
+        "double_runs": double_runs,
+        "E260": e260 / E260_SCALE,
+        "delta_h": sum(map(NN_SCALED_DELTA_H.__getitem__, pairs)) / DELTA_H_SCALE,
+        "delta_s": sum(map(NN_SCALED_DELTA_S.__getitem__, pairs)) / DELTA_S_SCALE,
+    }
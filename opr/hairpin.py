@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""OPR hairpin prediction."""
+from typing import Optional, Tuple, List, NamedTuple, Any
+from collections import OrderedDict
+from functools import lru_cache
+import math
+import threading
+from .params import DNA_COMPLEMENT_MAP, DEFAULT_TEMPERATURE, KELVIN_OFFSET, GAS_CONSTANT
+from .params import HAIRPIN_MIN_LOOP_LENGTH, HAIRPIN_MIN_SEQUENCE_LENGTH, HAIRPIN_LOOP_DELTA_G
+from .params import HAIRPIN_CACHE_SIZE, HAIRPIN_SUBRESULTS_CACHE_SIZE
+from .functions import NN_PAIR_PARAMS, delta_g_calc
+from .cache import PropertyCacheInfo
+
+
+class Hairpin(NamedTuple):
+    """
+    Most stable stem-loop of a sequence.
+
+    The stem pairs base `stem_start + k` with base `stem_end - k` for k < `stem_length`, and `loop_length` unpaired
+    bases close the loop. `delta_g` is the ΔG (in kcal/mol) of the structure.
+    """
+
+    delta_g: float
+    stem_start: int
+    stem_end: int
+    stem_length: int
+    loop_length: int
+
+
+# (ΔG, stem start, stem end, stem length, loop length)
+_HairpinResult = Tuple[float, int, int, int, int]
+
+
+@lru_cache(maxsize=None)
+def hairpin_loop_delta_g_calc(loop_length: int, temperature: float = DEFAULT_TEMPERATURE) -> float:
+    """
+    Calculate the initiation ΔG (in kcal/mol) of a hairpin loop and return it.
+
+    Loop lengths missing in HAIRPIN_LOOP_DELTA_G are extrapolated from the longest shorter tabulated loop, and the
+    loop ΔG is treated as purely entropic when scaling it to the given temperature.
+
+    :param loop_length: number of unpaired loop bases
+    :param temperature: temperature (unit °C)
+    """
+    tabulated_length = max(length for length in HAIRPIN_LOOP_DELTA_G if length <= loop_length)
+    delta_g = HAIRPIN_LOOP_DELTA_G[tabulated_length] + 2.44 * GAS_CONSTANT * \
+        (DEFAULT_TEMPERATURE + KELVIN_OFFSET) * math.log(loop_length / tabulated_length)
+    return delta_g * (temperature + KELVIN_OFFSET) / (DEFAULT_TEMPERATURE + KELVIN_OFFSET)
+
+
+class _HairpinSubresults:
+    """
+    Thread-safe, size-bounded memo of hairpin sub-results, keyed by the content of their sequences and temperature.
+
+    The oldest entries are dropped first when the memo is full.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initialize the _HairpinSubresults instance.
+
+        :param maxsize: maximum number of entries
+        """
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, keys: List[str], temperature: float) -> List[Any]:
+        """
+        Return the memoized sub-results of the keys, with _MISSING for the keys that are not memoized.
+
+        :param keys: sub-results keys
+        :param temperature: temperature (unit °C)
+        """
+        with self._lock:
+            results = [self._data.get((key, temperature), _MISSING) for key in keys]
+            misses = results.count(_MISSING)
+            self._hits += len(results) - misses
+            self._misses += misses
+        return results
+
+    def update(self, keys: List[str], temperature: float, results: List[Any]) -> None:
+        """
+        Memoize the sub-results of the keys.
+
+        :param keys: sub-results keys
+        :param temperature: temperature (unit °C)
+        :param results: sub-results
+        """
+        with self._lock:
+            for key, result in zip(keys, results):
+                self._data[key, temperature] = result
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> PropertyCacheInfo:
+        """Return the memo statistics."""
+        with self._lock:
+            return PropertyCacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+
+_MISSING = object()
+# the (prefixes, suffixes) hairpins of a sequence, keyed by the sequence: prefixes[j] is the most stable hairpin of
+# `sequence[:j]` and suffixes[i] the most stable hairpin of `sequence[i:]`, both positioned in the sequence and None
+# if unknown; and the last sequence with a given half, keyed by the half with a "<" (first) or ">" (second) mark
+_HAIRPIN_SUBRESULTS = _HairpinSubresults(HAIRPIN_SUBRESULTS_CACHE_SIZE)
+
+
+def _halves(sequence: str) -> List[str]:
+    """
+    Return the keys of the two halves of a sequence.
+
+    A single-base variant of a sequence shares one of its halves.
+
+    :param sequence: nucleotides sequence
+    """
+    middle = len(sequence) // 2
+    return ["<" + sequence[:middle], sequence[middle:] + ">"]
+
+
+def _better(first: Optional[_HairpinResult], second: Optional[_HairpinResult]) -> Optional[_HairpinResult]:
+    """
+    Return the more stable of two hairpins, the one with the leftmost stem (then stem end) if they are equally stable.
+
+    :param first: first hairpin
+    :param second: second hairpin
+    """
+    if first is None or (second is not None and second[:3] < first[:3]):
+        return second
+    return first
+
+
+def _shifted(result: Optional[_HairpinResult], offset: int) -> Optional[_HairpinResult]:
+    """
+    Return a hairpin with its stem positions shifted by the given offset.
+
+    :param result: hairpin
+    :param offset: positions offset
+    """
+    if result is None:
+        return None
+    return result[0], result[1] + offset, result[2] + offset, result[3], result[4]
+
+
+def _closed_hairpin(sequence: str, start: int, end: int, temperature: float) -> Optional[_HairpinResult]:
+    """
+    Find the most stable hairpin whose stem starts with pairing the given bases and return it.
+
+    The stem is extended inwards as long as the bases are complementary, and the hairpin closed by each base pair
+    extends the one closed by the inner pair only if that is more stable, so the shortest stem is kept among equally
+    stable ones. Returns None if the bases can not close a hairpin.
+
+    :param sequence: nucleotides sequence
+    :param start: index of the first base of the stem
+    :param end: index of the last base of the stem
+    :param temperature: temperature (unit °C)
+    """
+    pairs = 0
+    while end - start - 2 * pairs - 1 >= HAIRPIN_MIN_LOOP_LENGTH and \
+            DNA_COMPLEMENT_MAP[sequence[start + pairs]] == sequence[end - pairs]:
+        pairs += 1
+    if not pairs:
+        return None
+    closed = None
+    for index in range(pairs - 1, -1, -1):
+        loop_length = end - start - 2 * index - 1
+        hairpin = (hairpin_loop_delta_g_calc(loop_length, temperature), 1, loop_length)
+        if closed is not None:
+            stack = start + index
+            delta_g = delta_g_calc(*NN_PAIR_PARAMS[sequence[stack:stack + 2]], temperature) + closed[0]
+            if delta_g < hairpin[0]:
+                hairpin = (delta_g, closed[1] + 1, closed[2])
+        closed = hairpin
+    return closed[0], start, end, closed[1], closed[2]
+
+
+def _window_hairpin(sequence: str, temperature: float) -> Optional[_HairpinResult]:
+    """
+    Find the most stable hairpin of a sequence from the memoized hairpins of the suffixes of the previous window.
+
+    This is the case of a window shifted by one base along a template: the previous window memoized its suffixes,
+    which include the suffixes of `sequence[:-1]`, so only the base pairs closed by the last base are new. The
+    hairpins of the suffixes of the sequence are memoized for the next window. Returns _MISSING if the previous
+    window is not memoized.
+
+    :param sequence: nucleotides sequence
+    :param temperature: temperature (unit °C)
+    """
+    length = len(sequence)
+    previous = [subresults for subresults in _HAIRPIN_SUBRESULTS.lookup(
+        [base + sequence[:-1] for base in "ATCG"], temperature) if subresults is not _MISSING]
+    if not previous:
+        return _MISSING
+    inner = previous[0][1]
+    suffixes = [None] * (length + 1)
+    closed = result = None
+    for start in range(length - 1, -1, -1):
+        hairpin = _closed_hairpin(sequence, start, length - 1, temperature)
+        if hairpin is not None and hairpin[3] >= 2 and hairpin[0] < 0:
+            closed = _better(closed, hairpin)
+        result = suffixes[start] = _better(_shifted(inner[start + 1], -1), closed)
+    _HAIRPIN_SUBRESULTS.update([sequence], temperature, [(None, suffixes)])
+    return result
+
+
+def _variant_hairpin(sequence: str, temperature: float) -> Optional[_HairpinResult]:
+    """
+    Find the most stable hairpin of a sequence from the memoized hairpins of the two sides of one of its bases.
+
+    This is the case of a single-base variant of a known sequence: both sides of the changed base are memoized, so
+    only the base pairs around it are new. Returns _MISSING if no memoized sequence differs by one base.
+
+    :param sequence: nucleotides sequence
+    :param temperature: temperature (unit °C)
+    """
+    length = len(sequence)
+    for other in _HAIRPIN_SUBRESULTS.lookup(_halves(sequence), temperature):
+        if other is _MISSING or len(other) != length:
+            continue
+        positions = [position for position in range(length) if sequence[position] != other[position]]
+        if len(positions) != 1:
+            continue
+        [subresults] = _HAIRPIN_SUBRESULTS.lookup([other], temperature)
+        if subresults is _MISSING or subresults[0] is None:
+            continue
+        [position] = positions
+        result = _better(subresults[0][position], subresults[1][position + 1])
+        for start in range(position + 1):
+            for end in range(max(position, start + HAIRPIN_MIN_LOOP_LENGTH + 1), length):
+                hairpin = _closed_hairpin(sequence, start, end, temperature)
+                if hairpin is not None and hairpin[3] >= 2 and hairpin[0] < 0:
+                    result = _better(result, hairpin)
+        return result
+    return _MISSING
+
+
+def _sequence_hairpin(sequence: str, temperature: float) -> Optional[_HairpinResult]:
+    """
+    Find the most stable hairpin of a sequence with dynamic programming over all its base pairs.
+
+    The base pairs (i, j) with the same i + j are walked from the innermost one outwards, so the most stable hairpin
+    closed by (i, j) extends the one closed by (i + 1, j - 1) by one stack, and only that one is kept. This takes
+    O(L²) time and O(L) memory. The hairpins of the prefixes and suffixes of the sequence are memoized. Like
+    _best_hairpin, only hairpins with at least 2 stem base pairs and a negative ΔG are returned.
+
+    :param sequence: nucleotides sequence
+    :param temperature: temperature (unit °C)
+    """
+    length = len(sequence)
+    complements = [DNA_COMPLEMENT_MAP[base] for base in sequence]
+    stack_delta_g = [delta_g_calc(*NN_PAIR_PARAMS[sequence[index:index + 2]], temperature)
+                     for index in range(length - 1)]
+    # most stable hairpin (with a negative ΔG) of each stem start and of each stem end, the base pairs of a stem start
+    # are walked by increasing end and the base pairs of a stem end by increasing start, so the first of equally
+    # stable ones is kept
+    starts = [None] * length
+    ends = [None] * length
+    for pair_sum in range(2 * length - 3):
+        # most stable (ΔG, stem length, loop length) closed by the previous (inner) base pair
+        inner = None
+        for start in range((pair_sum - 1) // 2, max(0, pair_sum - length + 1) - 1, -1):
+            end = pair_sum - start
+            loop_length = end - start - 1
+            if loop_length < HAIRPIN_MIN_LOOP_LENGTH or complements[start] != sequence[end]:
+                inner = None
+                continue
+            closed = (hairpin_loop_delta_g_calc(loop_length, temperature), 1, loop_length)
+            if inner is not None:
+                delta_g = stack_delta_g[start] + inner[0]
+                if delta_g < closed[0]:
+                    closed = (delta_g, inner[1] + 1, inner[2])
+            inner = closed
+            if closed[1] >= 2 and closed[0] < 0:
+                if starts[start] is None or closed[0] < starts[start][0]:
+                    starts[start] = (closed[0], start, end, closed[1], closed[2])
+                if ends[end] is None or closed[0] < ends[end][0]:
+                    ends[end] = (closed[0], start, end, closed[1], closed[2])
+    prefixes = [None] * (length + 1)
+    for end, hairpin in enumerate(ends):
+        prefixes[end + 1] = _better(prefixes[end], hairpin) if hairpin is not None else prefixes[end]
+    suffixes = [None] * (length + 1)
+    for start in range(length - 1, -1, -1):
+        hairpin = starts[start]
+        suffixes[start] = _better(suffixes[start + 1], hairpin) if hairpin is not None else suffixes[start + 1]
+    _HAIRPIN_SUBRESULTS.update([sequence] + _halves(sequence), temperature, [(prefixes, suffixes), sequence, sequence])
+    return suffixes[0]
+
+
+@lru_cache(maxsize=HAIRPIN_CACHE_SIZE)
+def _best_hairpin(sequence: str, temperature: float) -> Optional[_HairpinResult]:
+    """
+    Find the most stable hairpin with at least 2 stem base pairs and a negative ΔG in the sequence and return it.
+
+    The result is a (ΔG, stem start, stem end, stem length, loop length) tuple or None if there is no such hairpin.
+    Among equally stable hairpins the one with the leftmost stem (then the leftmost stem end) is returned. Hairpins
+    of subsequences are memoized by content, so overlapping windows of a template and single-base variants of a
+    sequence only compute the base pairs that are new to them.
+
+    :param sequence: nucleotides sequence
+    :param temperature: temperature (unit °C)
+    """
+    if len(sequence) < HAIRPIN_MIN_SEQUENCE_LENGTH:
+        return None
+    result = _window_hairpin(sequence, temperature)
+    if result is _MISSING:
+        result = _variant_hairpin(sequence, temperature)
+    if result is _MISSING:
+        result = _sequence_hairpin(sequence, temperature)
+    return result
+
+
+def hairpin_calc(sequence: str, temperature: float = DEFAULT_TEMPERATURE) -> Optional[Hairpin]:
+    """
+    Predict the most stable hairpin (stem-loop) of a sequence and return it, or None if no hairpin is stable.
+
+    The stem ΔG is the sum of its nearest-neighbor stacks and the loop ΔG comes from HAIRPIN_LOOP_DELTA_G.
+
+    :param sequence: nucleotides sequence
+    :param temperature: temperature (unit °C)
+    """
+    result = _best_hairpin(sequence, temperature)
+    if result is None:
+        return None
+    return Hairpin(*result)
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""OPR k-mer index."""
+from __future__ import annotations
+from typing import Union, Generator, Optional, Tuple, List, Set, FrozenSet, TextIO, NamedTuple
+from array import array
+from bisect import bisect_right
+import itertools
+import math
+import mmap
+import os
+import re
+import struct
+from .errors import OPRBaseError
+from .primer import Primer
+from .reader import read_records
+from .functions import reverse_complement_calc, padding_calc
+from .params import KMER_INDEX_MAGIC_NUMBER, KMER_INDEX_BYTE_ORDER_MARK, KMER_INDEX_MAX_K
+from .params import KMER_INDEX_MIN_DEFAULT_K, KMER_INDEX_MAX_DEFAULT_K
+from .params import KMER_INDEX_K_ERROR, KMER_INDEX_FILE_ERROR, KMER_INDEX_PRIMER_TYPE_ERROR
+from .params import KMER_INDEX_PRIMER_LENGTH_ERROR, KMER_INDEX_MISMATCHES_ERROR
+from .params import KMER_INDEX_RECORD_ERROR, KMER_INDEX_REGION_ERROR
+
+# Bases are encoded in 2 bits (A=0, C=1, G=2, T=3), any other byte is translated to 4 and breaks the k-mers
+KMER_BASE_CODES = bytes({"A": 0, "C": 1, "G": 2, "T": 3}.get(chr(byte), 4) for byte in range(256))
+# Runs of bases other than A, T, C and G, which break the k-mers
+KMER_INVALID_BASES_PATTERN = re.compile(rb"[^ACGT]+")
+# magic number, byte order mark, k, positions item size, records, names block size, sequence size, positions
+KMER_INDEX_HEADER = struct.Struct("=8sQQQQQQQ")
+
+
+class BindingSite(NamedTuple):
+    """
+    Candidate binding site of a primer in a reference.
+
+    `position` is the 0-based start of the site on the forward strand of the `name` record. A primer binds on the "+"
+    strand if its sequence matches the forward strand, and on the "-" strand if its reverse complement does.
+    """
+
+    name: str
+    position: int
+    strand: str
+    mismatches: int
+
+
+def _kmers(codes: bytes, start: int, end: int, k: int) -> Generator[Tuple[int, int], None, None]:
+    """
+    Yield the (position, k-mer code) of all k-mers of an encoded sequence region without invalid bases.
+
+    :param codes: 2-bit base codes of the sequence (one per byte)
+    :param start: region start
+    :param end: region end
+    :param k: k-mer length
+    """
+    mask = (1 << 2 * k) - 1
+    code = 0
+    valid = 0
+    for position in range(start, end):
+        value = codes[position]
+        if value == 4:
+            valid = 0
+            continue
+        code = ((code << 2) | value) & mask
+        valid += 1
+        if valid >= k:
+            yield position - k + 1, code
+
+
+def _variants(code: int, k: int, mismatches: int) -> Generator[int, None, None]:
+    """
+    Yield all k-mer codes with at most the given number of substitutions from the given code.
+
+    :param code: k-mer code
+    :param k: k-mer length
+    :param mismatches: maximum number of substitutions
+    """
+    yield code
+    for number in range(1, mismatches + 1):
+        for positions in itertools.combinations(range(k), number):
+            # xor-ing a base code with 1, 2 or 3 gives the 3 other bases
+            for substitutions in itertools.product((1, 2, 3), repeat=number):
+                variant = code
+                for position, substitution in zip(positions, substitutions):
+                    variant ^= substitution << 2 * (k - 1 - position)
+                yield variant
+
+
+class KmerIndex:
+    """
+    The KmerIndex class is a k-mer seed index of a reference, stored in a file and opened with mmap.
+
+    The file holds the reference sequence, a table of 4^k + 1 bucket offsets (8 * 4^k bytes) and the positions of all
+    k-mers grouped by k-mer, so worker processes opening the same index share its pages.
+
+    >>> oindex = KmerIndex.build("reference.fasta", "reference.idx")
+    >>> oindex.search(Primer("CTGGAGGACGGAAGAGGAAGTAA"))
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Open the KmerIndex instance.
+
+        :param path: index file path
+        """
+        self._path = os.fspath(path)
+        self._views = []
+        with open(self._path, "rb") as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise OPRBaseError(KMER_INDEX_FILE_ERROR)
+        try:
+            self._load()
+        except (struct.error, TypeError, ValueError, OPRBaseError):
+            self.close()
+            raise OPRBaseError(KMER_INDEX_FILE_ERROR)
+
+    def _view(self, start: int, size: int, typecode: str) -> memoryview:
+        """
+        Return a typed view of a block of the index file.
+
+        :param start: block start
+        :param size: number of items
+        :param typecode: item type code
+        """
+        end = start + size * array(typecode).itemsize
+        if end > len(self._mmap):
+            raise OPRBaseError(KMER_INDEX_FILE_ERROR)
+        view = memoryview(self._mmap)[start:end].cast(typecode)
+        self._views.append(view)
+        return view
+
+    def _load(self) -> None:
+        """Read the index file header and map its blocks."""
+        magic_number, byte_order_mark, k, itemsize, records, names_size, sequence_size, positions = \
+            KMER_INDEX_HEADER.unpack_from(self._mmap)
+        if magic_number != KMER_INDEX_MAGIC_NUMBER or byte_order_mark != KMER_INDEX_BYTE_ORDER_MARK or \
+                not 1 <= k <= KMER_INDEX_MAX_K:
+            raise OPRBaseError(KMER_INDEX_FILE_ERROR)
+        self._k = k
+        offset = KMER_INDEX_HEADER.size
+        names = self._mmap[offset:offset + names_size].decode("utf-8")
+        self._names = names.split("\n") if records else []
+        self._records = {name: record for record, name in reversed(list(enumerate(self._names)))}
+        offset += names_size + padding_calc(names_size)
+        self._offsets = self._view(offset, records + 1, "Q")
+        offset += len(self._offsets) * 8
+        self._sequence_start = offset
+        offset += sequence_size + padding_calc(sequence_size)
+        self._table = self._view(offset, 4 ** k + 1, "Q")
+        offset += len(self._table) * 8
+        self._positions = self._view(offset, positions, "I" if itemsize == 4 else "Q")
+        self._invalid_blocks = None
+        # (length, max_mismatches): start positions of the regions overlapping the invalid blocks
+        self._invalid_block_regions = {}
+
+    @classmethod
+    def build(cls, reference: Union[str, os.PathLike, TextIO], path: Union[str, os.PathLike],
+              k: Optional[int] = None) -> KmerIndex:
+        """
+        Build the k-mer index of a reference, write it to a file and open it.
+
+        K-mers containing bases other than A, T, C and G are not indexed. The k-mer table holds 4^k offsets, so by
+        default k is sized from the reference (log4 of its length, between KMER_INDEX_MIN_DEFAULT_K and
+        KMER_INDEX_MAX_DEFAULT_K) and the table is not larger than the reference needs.
+
+        :param reference: reference FASTA file path (plain or gzip-compressed) or an open text file
+        :param path: index file path
+        :param k: k-mer length, sized from the reference if None
+        """
+        if k is not None and (not isinstance(k, int) or not 1 <= k <= KMER_INDEX_MAX_K):
+            raise OPRBaseError(KMER_INDEX_K_ERROR)
+        names = []
+        offsets = array('Q', [0])
+        buffer = bytearray()
+        for name, sequence in read_records(reference):
+            names.append(name)
+            buffer += sequence.upper().encode("ascii", "replace")
+            offsets.append(len(buffer))
+        if k is None:
+            k = min(max(int(math.log(max(len(buffer), 1), 4)), KMER_INDEX_MIN_DEFAULT_K), KMER_INDEX_MAX_DEFAULT_K)
+        codes = bytes(buffer).translate(KMER_BASE_CODES)
+        spans = list(zip(offsets, offsets[1:]))
+        # counting sort of the k-mer positions by k-mer code
+        table = array('Q', [0]) * (4 ** k + 1)
+        for start, end in spans:
+            for _, code in _kmers(codes, start, end, k):
+                table[code + 1] += 1
+        table = array('Q', itertools.accumulate(table))
+        typecode = "I" if len(buffer) < 2 ** 32 and array("I").itemsize == 4 else "Q"
+        positions = array(typecode, [0]) * table[-1]
+        cursors = array('Q', table)
+        for start, end in spans:
+            for position, code in _kmers(codes, start, end, k):
+                positions[cursors[code]] = position
+                cursors[code] += 1
+        names_block = "\n".join(names).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(KMER_INDEX_HEADER.pack(KMER_INDEX_MAGIC_NUMBER, KMER_INDEX_BYTE_ORDER_MARK, k,
+                                              positions.itemsize, len(names), len(names_block), len(buffer),
+                                              len(positions)))
+            file.write(names_block + bytes(padding_calc(len(names_block))))
+            offsets.tofile(file)
+            file.write(buffer + bytes(padding_calc(len(buffer))))
+            table.tofile(file)
+            positions.tofile(file)
+        return cls(path)
+
+    @property
+    def path(self) -> str:
+        """Return the index file path."""
+        return self._path
+
+    @property
+    def k(self) -> int:
+        """Return the k-mer length."""
+        return self._k
+
+    @property
+    def names(self) -> List[str]:
+        """Return the reference records names."""
+        return list(self._names)
+
+    def region(self, name: str, start: int, end: int) -> str:
+        """
+        Return a region of the forward strand of a reference record.
+
+        :param name: record name
+        :param start: 0-based region start
+        :param end: region end (exclusive)
+        """
+        record = self._records.get(name)
+        if record is None:
+            raise OPRBaseError(KMER_INDEX_RECORD_ERROR)
+        length = self._offsets[record + 1] - self._offsets[record]
+        if not isinstance(start, int) or not isinstance(end, int) or not 0 <= start <= end <= length:
+            raise OPRBaseError(KMER_INDEX_REGION_ERROR)
+        offset = self._sequence_start + self._offsets[record]
+        return self._mmap[offset + start:offset + end].decode("ascii")
+
+    def _candidates(self, codes: bytes, max_mismatches: int) -> Set[int]:
+        """
+        Find the start positions of the reference regions that may match the encoded sequence.
+
+        The sequence is split into non-overlapping k-mer seeds. A region with at most `max_mismatches` mismatches has
+        a seed with at most `max_mismatches // seeds` mismatches, so those seed variants are looked up.
+
+        :param codes: 2-bit base codes of the sequence (one per byte)
+        :param max_mismatches: maximum number of mismatches
+        """
+        k = self._k
+        seeds = len(codes) // k
+        candidates = set()
+        for offset in range(0, seeds * k, k):
+            code = 0
+            for value in codes[offset:offset + k]:
+                code = (code << 2) | value
+            for variant in _variants(code, k, max_mismatches // seeds):
+                for position in self._positions[self._table[variant]:self._table[variant + 1]]:
+                    if position >= offset:
+                        candidates.add(position - offset)
+        return candidates
+
+    def _invalid_block_candidates(self, length: int, max_mismatches: int) -> FrozenSet[int]:
+        """
+        Find the start positions of the reference regions that overlap bases other than A, T, C and G.
+
+        Such regions have no indexed seed over those bases, so they are verified directly. A region is only returned
+        if it overlaps a run of those bases by at most `max_mismatches` bases. The positions are cached by length and
+        `max_mismatches`, so searching many primers of the same length does not find them again.
+
+        :param length: region length
+        :param max_mismatches: maximum number of mismatches
+        """
+        key = (length, max_mismatches)
+        if key in self._invalid_block_regions:
+            return self._invalid_block_regions[key]
+        if self._invalid_blocks is None:
+            sequence_end = self._sequence_start + self._offsets[-1]
+            self._invalid_blocks = [
+                (match.start() - self._sequence_start, match.end() - self._sequence_start)
+                for match in KMER_INVALID_BASES_PATTERN.finditer(self._mmap, self._sequence_start, sequence_end)]
+        candidates = set()
+        for block_start, block_end in self._invalid_blocks:
+            # regions overlapping the start of the run, containing it, or overlapping its end
+            candidates.update(range(block_start - length + 1, block_start - length + max_mismatches + 1))
+            if block_end - block_start <= max_mismatches:
+                candidates.update(range(block_end - length, block_start + 1))
+            candidates.update(range(max(block_end - max_mismatches, block_start), block_end))
+        self._invalid_block_regions[key] = frozenset(start for start in candidates if start >= 0)
+        return self._invalid_block_regions[key]
+
+    def search(self, primer: Primer, max_mismatches: int = 2) -> List[BindingSite]:
+        """
+        Find the binding sites of a primer on both strands of the reference with at most `max_mismatches` mismatches.
+
+        Bases other than A, T, C and G in the reference never match and count as mismatches. The sites are returned
+        ordered by record, position and strand.
+
+        :param primer: primer
+        :param max_mismatches: maximum number of mismatches
+        """
+        if not isinstance(primer, Primer):
+            raise OPRBaseError(KMER_INDEX_PRIMER_TYPE_ERROR)
+        if not isinstance(max_mismatches, int) or max_mismatches < 0:
+            raise OPRBaseError(KMER_INDEX_MISMATCHES_ERROR)
+        if len(primer) < self._k:
+            raise OPRBaseError(KMER_INDEX_PRIMER_LENGTH_ERROR)
+        sites = []
+        for strand, query in (("+", primer.sequence), ("-", reverse_complement_calc(primer.sequence))):
+            sequence = query.encode("ascii")
+            codes = sequence.translate(KMER_BASE_CODES)
+            candidates = self._candidates(codes, max_mismatches)
+            candidates |= self._invalid_block_candidates(len(sequence), max_mismatches)
+            for start in candidates:
+                record = bisect_right(self._offsets, start) - 1
+                end = start + len(sequence)
+                if end > self._offsets[record + 1]:
+                    continue
+                region = self._mmap[self._sequence_start + start:self._sequence_start + end]
+                mismatches = sum(1 for first, second in zip(sequence, region) if first != second)
+                if mismatches <= max_mismatches:
+                    sites.append((record, start - self._offsets[record], strand, mismatches))
+        sites.sort()
+        return [BindingSite(self._names[record], position, strand, mismatches)
+                for record, position, strand, mismatches in sites]
+
+    def close(self) -> None:
+        """Close the index file."""
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> KmerIndex:
+        """Enter the index context."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the index file at the end of the context."""
+        self.close()
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        """Pickle the index by its path, so each process maps the same file."""
+        return KmerIndex, (self._path,)
+
+    def __len__(self) -> int:
+        """Return the number of indexed k-mers."""
+        return len(self._positions)
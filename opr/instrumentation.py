@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""OPR instrumentation."""
+from typing import Callable, Optional, Dict, NamedTuple, Any
+import functools
+import threading
+import time
+from .primer import Primer, MeltingTemperature
+from .primer import COMPUTED_FLAGS, MELTING_TEMPERATURE_FLAGS, MELTING_TEMPERATURE_SLOTS, ALL_COMPUTED_FLAGS
+from .primer import PROFILE_COMPUTED_FLAGS
+
+
+class InstrumentationEvent(NamedTuple):
+    """
+    Access of a Primer property.
+
+    `cached` is true if the value was served from the Primer cache, and `duration` is the exclusive wall time (in
+    seconds) of the access: the properties accessed while it is calculated are recorded separately and their time is
+    not counted twice.
+    """
+
+    name: str
+    sequence_length: int
+    cached: bool
+    duration: float
+
+
+class PropertyStats(NamedTuple):
+    """Statistics of a Primer property, `lengths` is the histogram of the sequence lengths it was computed for."""
+
+    computes: int
+    hits: int
+    time: float
+    lengths: Dict[int, int]
+
+
+class Instrumentation:
+    """
+    The Instrumentation class records the accesses of Primer properties.
+
+    >>> oinstrumentation = enable_instrumentation()
+    >>> Primer("ATCGATCGATCGATCGAT").molecular_weight
+    >>> oinstrumentation.snapshot()
+    """
+
+    def __init__(self, callback: Optional[Callable[[InstrumentationEvent], Any]] = None) -> None:
+        """
+        Initialize the Instrumentation instance.
+
+        :param callback: function called with every InstrumentationEvent
+        """
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._stats = {}
+        # wall time of the nested accesses of each access in progress, per thread
+        self._active = threading.local()
+
+    def record(self, name: str, sequence_length: int, cached: bool, duration: float) -> None:
+        """
+        Record the access of a property.
+
+        :param name: property name
+        :param sequence_length: primer sequence length
+        :param cached: cached flag
+        :param duration: access wall time (unit s)
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = [0, 0, 0.0, {}]
+            if cached:
+                stats[1] += 1
+            else:
+                stats[0] += 1
+                stats[3][sequence_length] = stats[3].get(sequence_length, 0) + 1
+            stats[2] += duration
+        if self.callback is not None:
+            self.callback(InstrumentationEvent(name, sequence_length, cached, duration))
+
+    def measure(self, name: str, sequence_length: int, cached: bool, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call a property function and return its value, recording the access with its exclusive wall time.
+
+        :param name: property name
+        :param sequence_length: primer sequence length
+        :param cached: cached flag
+        :param function: property function
+        :param args: function arguments
+        """
+        nested_times = getattr(self._active, "nested_times", None)
+        if nested_times is None:
+            nested_times = self._active.nested_times = []
+        nested_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            value = function(*args)
+        finally:
+            nested_time = nested_times.pop()
+        self.record(name, sequence_length, cached, time.perf_counter() - start - nested_time)
+        if nested_times:
+            nested_times[-1] += time.perf_counter() - start
+        return value
+
+    def snapshot(self) -> Dict[str, PropertyStats]:
+        """Return the statistics of every accessed property."""
+        with self._lock:
+            return {name: PropertyStats(computes, hits, total_time, dict(lengths))
+                    for name, (computes, hits, total_time, lengths) in self._stats.items()}
+
+    def reset(self) -> None:
+        """Reset the statistics."""
+        with self._lock:
+            self._stats = {}
+
+
+def _instrumented_property(instrumentation: Instrumentation, name: str, flag: int, original: property) -> property:
+    """
+    Wrap a cached Primer property to record its accesses and return the wrapper.
+
+    :param instrumentation: instrumentation recording the accesses
+    :param name: property name
+    :param flag: computed flag of the property
+    :param original: original property
+    """
+    getter = original.fget
+
+    @functools.wraps(getter)
+    def wrapper(self: Primer) -> Any:
+        return instrumentation.measure(name, len(self._sequence), bool(self._computed & flag), getter, self)
+    return property(wrapper)
+
+
+def _instrumented_melting_temperature(instrumentation: Instrumentation,
+                                      original: Callable[..., float]) -> Callable[..., float]:
+    """
+    Wrap the Primer melting temperature method to record its accesses and return the wrapper.
+
+    Each method is recorded under the name of its slot, such as "nearest_neighbor_melting_temperature".
+
+    :param instrumentation: instrumentation recording the accesses
+    :param original: original method
+    """
+    @functools.wraps(original)
+    def wrapper(self: Primer, method: MeltingTemperature = MeltingTemperature.BASIC) -> float:
+        cached = bool(self._computed & MELTING_TEMPERATURE_FLAGS.get(method, 0))
+        return instrumentation.measure(
+            MELTING_TEMPERATURE_SLOTS[method][1:], len(self._sequence), cached, original, self, method)
+    return wrapper
+
+
+# names and computed flags of the properties calculated in the single pass of profile
+_PROFILE_PROPERTY_FLAGS = {name: flag for name, flag in COMPUTED_FLAGS.items() if flag & PROFILE_COMPUTED_FLAGS}
+_PROFILE_PROPERTY_FLAGS.update(
+    {MELTING_TEMPERATURE_SLOTS[method][1:]: flag for method, flag in MELTING_TEMPERATURE_FLAGS.items()})
+
+
+def _instrumented_profile(instrumentation: Instrumentation,
+                          original: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """
+    Wrap the Primer profile method to record its accesses and return the wrapper.
+
+    The properties calculated in the single pass of profile are recorded as computes without time, since that time is
+    recorded for profile.
+
+    :param instrumentation: instrumentation recording the accesses
+    :param original: original method
+    """
+    @functools.wraps(original)
+    def wrapper(self: Primer, hairpin: bool = False) -> Dict[str, Any]:
+        flags = ALL_COMPUTED_FLAGS if hairpin else PROFILE_COMPUTED_FLAGS
+        computed = self._computed
+        value = instrumentation.measure(
+            "profile", len(self._sequence), computed & flags == flags, original, self, hairpin)
+        for name, flag in _PROFILE_PROPERTY_FLAGS.items():
+            if self._computed & flag and not computed & flag:
+                instrumentation.record(name, len(self._sequence), False, 0.0)
+        return value
+    return wrapper
+
+
+_instrumentation = None
+_original_attributes = {}
+
+
+def enable_instrumentation(callback: Optional[Callable[[InstrumentationEvent], Any]] = None) -> Instrumentation:
+    """
+    Start recording the accesses of Primer properties and return the Instrumentation instance.
+
+    The Primer properties are replaced by recording wrappers, so there is no overhead while instrumentation is
+    disabled. If instrumentation is already enabled, its callback is replaced.
+
+    :param callback: function called with every InstrumentationEvent
+    """
+    global _instrumentation
+    if _instrumentation is not None:
+        _instrumentation.callback = callback
+        return _instrumentation
+    _instrumentation = Instrumentation(callback)
+    wrappers = {
+        name: _instrumented_property(_instrumentation, name, flag, Primer.__dict__[name])
+        for name, flag in COMPUTED_FLAGS.items()
+    }
+    wrappers["melting_temperature"] = _instrumented_melting_temperature(
+        _instrumentation, Primer.__dict__["melting_temperature"])
+    wrappers["profile"] = _instrumented_profile(_instrumentation, Primer.__dict__["profile"])
+    for name, wrapper in wrappers.items():
+        _original_attributes[name] = Primer.__dict__[name]
+        setattr(Primer, name, wrapper)
+    return _instrumentation
+
+
+def disable_instrumentation() -> None:
+    """Stop recording the accesses of Primer properties and restore the original properties."""
+    global _instrumentation
+    for name, attribute in _original_attributes.items():
+        setattr(Primer, name, attribute)
+    _original_attributes.clear()
+    _instrumentation = None
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """Return the Instrumentation instance, or None if instrumentation is disabled."""
+    return _instrumentation
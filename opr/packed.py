@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+"""OPR 2-bit packed sequences."""
+from __future__ import annotations
+from typing import Union, Generator, Optional, Tuple, List, TextIO, Any
+from array import array
+from bisect import bisect_left, bisect_right
+import mmap
+import os
+import re
+import struct
+from .errors import OPRBaseError
+from .primer import Primer
+from .reader import read_records
+from .functions import padding_calc
+from .diagnostics import report_diagnostic, length_diagnostic
+from .params import PRIMER_SEQUENCE_VALID_BASES_ERROR
+from .params import PACKED_SEQUENCES_MAGIC_NUMBER, PACKED_SEQUENCES_BYTE_ORDER_MARK
+from .params import PACKED_SEQUENCES_FILE_ERROR, PACKED_SEQUENCES_RECORD_ERROR, PACKED_SEQUENCES_REGION_ERROR
+from .params import PACKED_SEQUENCES_WINDOW_ERROR
+
+# Bases are packed 4 per byte (A=0, C=1, G=2, T=3), the first base in the highest bits
+PACKED_BASES = b"ACGT"
+PACKED_BASE_CODES = bytes({"A": 0, "C": 1, "G": 2, "T": 3}.get(chr(byte), 0) for byte in range(256))
+# Codes shifted to the bits of each of the 4 bases of a byte
+PACKED_SHIFT_TABLES = tuple(bytes((code << 6 - 2 * index) & 0xFF for code in range(256)) for index in range(4))
+# Bases stored in the bits of each of the 4 bases of a byte
+PACKED_UNPACK_TABLES = tuple(bytes(PACKED_BASES[byte >> 6 - 2 * index & 3] for byte in range(256))
+                             for index in range(4))
+# Bases stored in each byte
+PACKED_BYTE_BASES = tuple(bytes(table[byte] for table in PACKED_UNPACK_TABLES) for byte in range(256))
+# Regions up to this number of bytes are unpacked byte by byte, longer ones with one translation per base of a byte
+PACKED_SHORT_REGION_SIZE = 64
+# Runs of bases other than A, T, C and G, stored as N blocks
+PACKED_N_BLOCK_PATTERN = re.compile(rb"[^ACGT]+")
+# magic number, byte order mark, records, names block size, bases, N blocks
+PACKED_SEQUENCES_HEADER = struct.Struct("=8sQQQQQ")
+
+
+def _pack(buffer: bytes) -> bytes:
+    """
+    Pack an uppercase sequence in 2 bits per base and return it.
+
+    Bases other than A, T, C and G are packed as A.
+
+    :param buffer: sequence bytes
+    """
+    codes = buffer.translate(PACKED_BASE_CODES) + bytes(-len(buffer) % 4)
+    size = len(codes) // 4
+    packed = 0
+    for index in range(4):
+        packed |= int.from_bytes(codes[index::4].translate(PACKED_SHIFT_TABLES[index]), "big")
+    return packed.to_bytes(size, "big")
+
+
+class PackedSequences:
+    """
+    The PackedSequences class stores the sequences of FASTA records in 2 bits per base, in a file opened with mmap.
+
+    Runs of bases other than A, T, C and G are stored as N blocks. Regions of the records are decoded on demand, and
+    PrimerView objects refer to them without copying.
+
+    >>> opacked = PackedSequences.build("reference.fasta", "reference.2bit")
+    >>> opacked.view("chr1", 1043, 1066).melting_temperature()
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Open the PackedSequences instance.
+
+        :param path: packed sequences file path
+        """
+        self._path = os.fspath(path)
+        self._views = []
+        with open(self._path, "rb") as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise OPRBaseError(PACKED_SEQUENCES_FILE_ERROR)
+        try:
+            self._load()
+        except (struct.error, TypeError, ValueError, OPRBaseError):
+            self.close()
+            raise OPRBaseError(PACKED_SEQUENCES_FILE_ERROR)
+
+    def _view(self, start: int, size: int, typecode: str) -> memoryview:
+        """
+        Return a typed view of a block of the packed sequences file.
+
+        :param start: block start
+        :param size: number of items
+        :param typecode: item type code
+        """
+        end = start + size * array(typecode).itemsize
+        if end > len(self._mmap):
+            raise OPRBaseError(PACKED_SEQUENCES_FILE_ERROR)
+        view = memoryview(self._mmap)[start:end].cast(typecode)
+        self._views.append(view)
+        return view
+
+    def _load(self) -> None:
+        """Read the packed sequences file header and map its blocks."""
+        magic_number, byte_order_mark, records, names_size, bases, n_blocks = \
+            PACKED_SEQUENCES_HEADER.unpack_from(self._mmap)
+        if magic_number != PACKED_SEQUENCES_MAGIC_NUMBER or byte_order_mark != PACKED_SEQUENCES_BYTE_ORDER_MARK:
+            raise OPRBaseError(PACKED_SEQUENCES_FILE_ERROR)
+        offset = PACKED_SEQUENCES_HEADER.size
+        names = self._mmap[offset:offset + names_size].decode("utf-8")
+        self._names = names.split("\n") if records else []
+        self._records = {name: record for record, name in reversed(list(enumerate(self._names)))}
+        offset += names_size + padding_calc(names_size)
+        self._offsets = self._view(offset, records + 1, "Q")
+        offset += len(self._offsets) * 8
+        self._n_starts = self._view(offset, n_blocks, "Q")
+        offset += n_blocks * 8
+        self._n_ends = self._view(offset, n_blocks, "Q")
+        offset += n_blocks * 8
+        self._packed = self._view(offset, (bases + 3) // 4, "B")
+        if self._offsets[-1] != bases:
+            raise OPRBaseError(PACKED_SEQUENCES_FILE_ERROR)
+
+    @classmethod
+    def build(cls, reference: Union[str, os.PathLike, TextIO], path: Union[str, os.PathLike]) -> PackedSequences:
+        """
+        Pack the sequences of a reference, write them to a file and open it.
+
+        :param reference: reference FASTA file path (plain or gzip-compressed) or an open text file
+        :param path: packed sequences file path
+        """
+        names = []
+        offsets = array('Q', [0])
+        buffer = bytearray()
+        for name, sequence in read_records(reference):
+            names.append(name)
+            buffer += sequence.upper().encode("ascii", "replace")
+            offsets.append(len(buffer))
+        n_starts = array('Q')
+        n_ends = array('Q')
+        for match in PACKED_N_BLOCK_PATTERN.finditer(buffer):
+            n_starts.append(match.start())
+            n_ends.append(match.end())
+        names_block = "\n".join(names).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(PACKED_SEQUENCES_HEADER.pack(PACKED_SEQUENCES_MAGIC_NUMBER, PACKED_SEQUENCES_BYTE_ORDER_MARK,
+                                                   len(names), len(names_block), len(buffer), len(n_starts)))
+            file.write(names_block + bytes(padding_calc(len(names_block))))
+            offsets.tofile(file)
+            n_starts.tofile(file)
+            n_ends.tofile(file)
+            file.write(_pack(bytes(buffer)))
+        return cls(path)
+
+    @property
+    def path(self) -> str:
+        """Return the packed sequences file path."""
+        return self._path
+
+    @property
+    def names(self) -> List[str]:
+        """Return the records names."""
+        return list(self._names)
+
+    def _record(self, name: str) -> int:
+        """
+        Return the index of a record.
+
+        :param name: record name
+        """
+        record = self._records.get(name)
+        if record is None:
+            raise OPRBaseError(PACKED_SEQUENCES_RECORD_ERROR)
+        return record
+
+    def _region(self, name: str, start: int, end: Optional[int]) -> Tuple[int, int, int]:
+        """
+        Validate a region of a record and return its record index, start and end.
+
+        :param name: record name
+        :param start: 0-based region start
+        :param end: region end (exclusive), the record end if None
+        """
+        record = self._record(name)
+        length = self._offsets[record + 1] - self._offsets[record]
+        if end is None:
+            end = length
+        if not isinstance(start, int) or not isinstance(end, int) or not 0 <= start <= end <= length:
+            raise OPRBaseError(PACKED_SEQUENCES_REGION_ERROR)
+        return record, start, end
+
+    def length(self, name: str) -> int:
+        """
+        Return the length of a record.
+
+        :param name: record name
+        """
+        record = self._record(name)
+        return self._offsets[record + 1] - self._offsets[record]
+
+    def _decode(self, offset: int, length: int) -> bytes:
+        """
+        Unpack the bases of the concatenated records in [offset, offset + length) and return them.
+
+        :param offset: 0-based start in the concatenated records
+        :param length: number of bases
+        """
+        first_byte = offset // 4
+        packed = self._packed[first_byte:(offset + length + 3) // 4]
+        if len(packed) <= PACKED_SHORT_REGION_SIZE:
+            bases = bytearray().join([PACKED_BYTE_BASES[byte] for byte in packed])
+        else:
+            packed = packed.tobytes()
+            bases = bytearray(len(packed) * 4)
+            for index in range(4):
+                bases[index::4] = packed.translate(PACKED_UNPACK_TABLES[index])
+        start = offset - first_byte * 4
+        bases = bases[start:start + length]
+        for block in range(bisect_right(self._n_ends, offset), bisect_left(self._n_starts, offset + length)):
+            block_start = max(self._n_starts[block], offset) - offset
+            block_end = min(self._n_ends[block], offset + length) - offset
+            bases[block_start:block_end] = b"N" * (block_end - block_start)
+        return bytes(bases)
+
+    def _has_n_block(self, offset: int, length: int) -> bool:
+        """
+        Check whether a region of the concatenated records overlaps an N block and return the result.
+
+        :param offset: 0-based start in the concatenated records
+        :param length: number of bases
+        """
+        return bisect_right(self._n_ends, offset) < bisect_left(self._n_starts, offset + length)
+
+    def sequence(self, name: str, start: int = 0, end: Optional[int] = None) -> str:
+        """
+        Unpack a region of a record and return it.
+
+        Bases other than A, T, C and G are returned as N.
+
+        :param name: record name
+        :param start: 0-based region start
+        :param end: region end (exclusive), the record end if None
+        """
+        record, start, end = self._region(name, start, end)
+        return self._decode(self._offsets[record] + start, end - start).decode("ascii")
+
+    def view(self, name: str, start: int = 0, end: Optional[int] = None, salt: float = 50) -> PrimerView:
+        """
+        Return a PrimerView of a region of a record.
+
+        :param name: record name
+        :param start: 0-based region start
+        :param end: region end (exclusive), the record end if None
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        record, start, end = self._region(name, start, end)
+        return PrimerView(self, self._offsets[record] + start, end - start, salt)
+
+    def windows(self, name: str, length: int, step: int = 1,
+                salt: float = 50) -> Generator[PrimerView, None, None]:
+        """
+        Generate PrimerView objects of the windows of a record, skipping the windows that overlap N blocks.
+
+        :param name: record name
+        :param length: window length
+        :param step: distance between the starts of consecutive windows
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        record = self._record(name)
+        if not isinstance(length, int) or not isinstance(step, int) or length < 1 or step < 1:
+            raise OPRBaseError(PACKED_SEQUENCES_WINDOW_ERROR)
+        return self._windows(record, length, step, salt)
+
+    def _windows(self, record: int, length: int, step: int, salt: float) -> Generator[PrimerView, None, None]:
+        """
+        Generate PrimerView objects of the windows of a record.
+
+        :param record: record index
+        :param length: window length
+        :param step: distance between the starts of consecutive windows
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        offset = self._offsets[record]
+        for start in range(0, self._offsets[record + 1] - offset - length + 1, step):
+            if not self._has_n_block(offset + start, length):
+                yield PrimerView(self, offset + start, length, salt)
+
+    def close(self) -> None:
+        """Close the packed sequences file."""
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> PackedSequences:
+        """Enter the packed sequences context."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the packed sequences file at the end of the context."""
+        self.close()
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        """Pickle the packed sequences by their path, so each process maps the same file."""
+        return PackedSequences, (self._path,)
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Check if a record is in the packed sequences.
+
+        :param name: record name
+        """
+        return name in self._records
+
+
+class PrimerView(Primer):
+    """
+    The PrimerView class is a Primer that refers to a region of PackedSequences instead of holding its sequence.
+
+    The sequence is unpacked whenever it is needed, and the computed properties are cached as in Primer. Inplace
+    operations detach the view from the packed sequences.
+
+    >>> oview = opacked.view("chr1", 1043, 1066)
+    >>> oview.gc_content
+    """
+
+    __slots__ = ("_packed_sequences", "_offset", "_length")
+
+    def __init__(self, packed_sequences: PackedSequences, offset: int, length: int, salt: float = 50) -> None:
+        """
+        Initialize the PrimerView instance.
+
+        :param packed_sequences: packed sequences
+        :param offset: 0-based start of the view in the concatenated records
+        :param length: view length
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        report_diagnostic(length_diagnostic(length))
+        if packed_sequences._has_n_block(offset, length):
+            raise OPRBaseError(PRIMER_SEQUENCE_VALID_BASES_ERROR)
+        self._packed_sequences = packed_sequences
+        self._offset = offset
+        self._length = length
+        _PRIMER_SEQUENCE_SLOT.__set__(self, None)
+        # the name is formatted from the view region when it is first requested
+        self._initialize(None, salt)
+
+    @property
+    def _sequence(self) -> str:
+        """Return the unpacked sequence of the view."""
+        sequence = _PRIMER_SEQUENCE_SLOT.__get__(self)
+        if sequence is not None:
+            return sequence
+        return self._packed_sequences._decode(self._offset, self._length).decode("ascii")
+
+    @_sequence.setter
+    def _sequence(self, sequence: str) -> None:
+        """
+        Detach the view from the packed sequences and hold the given sequence.
+
+        :param sequence: primer nucleotides sequence
+        """
+        _PRIMER_SEQUENCE_SLOT.__set__(self, sequence)
+
+    @property
+    def name(self) -> str:
+        """Return the primer name, the view region ("record:start-end") by default."""
+        if self._name is None:
+            self._name = "{0}:{1}-{2}".format(self.record, self.start, self.end)
+        return self._name
+
+    @property
+    def record(self) -> str:
+        """Return the name of the record of the view."""
+        return self._packed_sequences._names[bisect_right(self._packed_sequences._offsets, self._offset) - 1]
+
+    @property
+    def start(self) -> int:
+        """Return the 0-based start of the view in its record."""
+        offsets = self._packed_sequences._offsets
+        return self._offset - offsets[bisect_right(offsets, self._offset) - 1]
+
+    @property
+    def end(self) -> int:
+        """Return the end (exclusive) of the view in its record."""
+        return self.start + self._length
+
+    def __len__(self) -> int:
+        """Return the length of the PrimerView sequence."""
+        sequence = _PRIMER_SEQUENCE_SLOT.__get__(self)
+        if sequence is not None:
+            return len(sequence)
+        return self._length
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the view by its packed sequences and region, or as a Primer if it has been detached."""
+        sequence = _PRIMER_SEQUENCE_SLOT.__get__(self)
+        if sequence is not None:
+            return Primer, (sequence, self.name, self._salt_level)
+        return PrimerView, (self._packed_sequences, self._offset, self._length, self._salt_level)
+
+
+# PrimerView holds its sequence only once detached, in the sequence slot of Primer
+_PRIMER_SEQUENCE_SLOT = Primer.__dict__["_sequence"]
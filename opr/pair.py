@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""OPR primer pair design."""
+from typing import Union, Callable, Generator, Iterable, Optional, Tuple, List, NamedTuple
+from bisect import bisect_left, bisect_right
+import heapq
+from .errors import OPRBaseError
+from .primer import Primer, FrozenPrimer, MeltingTemperature
+from .batch import PrimerBatch
+from .primer_set import PrimerSet
+from .functions import reverse_complement_calc
+from .params import PRIMER_LOWEST_GC_RANGE, PRIMER_HIGHEST_GC_RANGE
+from .params import PAIR_TEMPLATE_TYPE_ERROR, PAIR_PRIMERS_TYPE_ERROR, PAIR_PRODUCT_SIZE_ERROR, PAIR_TOP_K_ERROR
+
+
+class PrimerPair(NamedTuple):
+    """
+    Forward and reverse primer pair amplifying a template region.
+
+    `forward_start` and `reverse_start` are the 0-based starts of the primers binding sites on the template, and
+    `product_size` is the length of the amplified region.
+    """
+
+    forward: Primer
+    reverse: Primer
+    forward_start: int
+    reverse_start: int
+    product_size: int
+    melting_temperature_difference: float
+
+
+def melting_temperature_difference_penalty(pair: PrimerPair) -> float:
+    """
+    Return the melting temperature difference of a primer pair as its penalty.
+
+    :param pair: primer pair
+    """
+    return pair.melting_temperature_difference
+
+
+class _Candidate(NamedTuple):
+    """Candidate primer located on the template."""
+
+    start: int
+    end: int
+    melting_temperature: float
+    index: int
+
+
+class _Candidates:
+    """Candidate primers of one direction and the Primer objects they refer to."""
+
+    def __init__(self, primers: Union[Iterable[Primer], PrimerBatch]) -> None:
+        """
+        Initialize the _Candidates instance.
+
+        :param primers: candidate Primer objects or PrimerBatch
+        """
+        if isinstance(primers, PrimerBatch):
+            self.batch = primers
+            self.primers = {}
+            self.sequences = primers.sequences
+            self.gc_contents = primers.gc_content
+        else:
+            self.batch = None
+            self.primers = dict(enumerate(primers))
+            if not all(isinstance(primer, Primer) for primer in self.primers.values()):
+                raise OPRBaseError(PAIR_PRIMERS_TYPE_ERROR)
+            self.sequences = [primer.sequence for primer in self.primers.values()]
+            self.gc_contents = [primer.gc_content for primer in self.primers.values()]
+
+    def primer(self, index: int) -> Primer:
+        """
+        Return the Primer object of a candidate, built only once for batch candidates.
+
+        :param index: candidate index
+        """
+        if index not in self.primers:
+            self.primers[index] = self.batch[index]
+        return self.primers[index]
+
+    def locate(self, template: str, method: MeltingTemperature, gc_range: Tuple[float, float],
+               reverse: bool) -> List[_Candidate]:
+        """
+        Find all binding sites of the candidates within the GC content range on the template and return them.
+
+        The candidates are matched together in a single pass over the template, and a candidate is returned once per
+        binding site.
+
+        :param template: template sequence
+        :param method: melting temperature calculation method
+        :param gc_range: (minimum, maximum) GC content
+        :param reverse: reverse primers flag, their reverse complement is searched on the template
+        """
+        indexes = {}
+        for index, (sequence, gc_content) in enumerate(zip(self.sequences, self.gc_contents)):
+            if not gc_range[0] <= gc_content <= gc_range[1]:
+                continue
+            if reverse:
+                sequence = reverse_complement_calc(sequence)
+            indexes.setdefault(sequence, []).append(index)
+        if not indexes:
+            return []
+        # the sequences are already valid, so they are not validated again
+        primer_set = PrimerSet((FrozenPrimer._from_valid_sequence(sequence) for sequence in indexes),
+                               reverse_complements=False)
+        if self.batch is not None:
+            melting_temperatures = self.batch.melting_temperature(method)
+        candidates = []
+        for occurrence in primer_set.find(template):
+            start = occurrence.position
+            end = start + len(occurrence.primer)
+            for index in indexes[occurrence.primer.sequence]:
+                if self.batch is not None:
+                    melting_temperature = melting_temperatures[index]
+                else:
+                    # the melting temperature is cached on the primer and reused by later calls
+                    melting_temperature = self.primers[index].melting_temperature(method)
+                candidates.append(_Candidate(start, end, melting_temperature, index))
+        return candidates
+
+
+def _compatible_pairs(forward: List[_Candidate], reverse: List[_Candidate], product_size: Tuple[int, int],
+                      max_difference: float) -> Generator[Tuple[_Candidate, _Candidate], None, None]:
+    """
+    Yield the (forward, reverse) candidate pairs within the product size range and melting temperature difference.
+
+    The reverse candidates are sorted by melting temperature and by binding site end, and for each forward candidate
+    both ranges are found by binary search. Only the smaller range is walked and checked for the other constraint.
+
+    :param forward: forward candidates
+    :param reverse: reverse candidates
+    :param product_size: (minimum, maximum) product size
+    :param max_difference: maximum melting temperature difference
+    """
+    by_melting_temperature = sorted(reverse, key=lambda candidate: candidate.melting_temperature)
+    melting_temperatures = [candidate.melting_temperature for candidate in by_melting_temperature]
+    by_end = sorted(reverse, key=lambda candidate: candidate.end)
+    ends = [candidate.end for candidate in by_end]
+    for forward_candidate in forward:
+        lowest_melting_temperature = forward_candidate.melting_temperature - max_difference
+        highest_melting_temperature = forward_candidate.melting_temperature + max_difference
+        lowest_end = forward_candidate.start + product_size[0]
+        highest_end = forward_candidate.start + product_size[1]
+        melting_temperature_range = (bisect_left(melting_temperatures, lowest_melting_temperature),
+                                     bisect_right(melting_temperatures, highest_melting_temperature))
+        end_range = (bisect_left(ends, lowest_end), bisect_right(ends, highest_end))
+        if melting_temperature_range[1] - melting_temperature_range[0] <= end_range[1] - end_range[0]:
+            matches = (candidate for candidate in by_melting_temperature[slice(*melting_temperature_range)]
+                       if lowest_end <= candidate.end <= highest_end)
+        else:
+            matches = (candidate for candidate in by_end[slice(*end_range)]
+                       if lowest_melting_temperature <= candidate.melting_temperature <= highest_melting_temperature)
+        for reverse_candidate in matches:
+            if reverse_candidate.start >= forward_candidate.start:
+                yield forward_candidate, reverse_candidate
+
+
+def design_pairs(template: str, forward_primers: Union[Iterable[Primer], PrimerBatch],
+                 reverse_primers: Union[Iterable[Primer], PrimerBatch], product_size: Tuple[int, int] = (100, 1000),
+                 max_melting_temperature_difference: float = 5,
+                 gc_range: Tuple[float, float] = (PRIMER_LOWEST_GC_RANGE, PRIMER_HIGHEST_GC_RANGE),
+                 method: MeltingTemperature = MeltingTemperature.NEAREST_NEIGHBOR, top_k: Optional[int] = None,
+                 penalty: Optional[Callable[[PrimerPair], float]] = None) -> List[PrimerPair]:
+    """
+    Find the compatible forward and reverse primer pairs for a template, ranked by penalty.
+
+    Forward primers are located on the template and reverse primers by their reverse complement, at all their binding
+    sites; candidates that do not bind the template or are out of the GC content range are ignored. Pairs are
+    compatible if their product size is in the `product_size` range and their melting temperatures differ by at most
+    `max_melting_temperature_difference`. The pairs are returned in ascending order of `penalty`, which is the
+    melting temperature difference by default, and only the `top_k` best pairs are returned if it is given.
+
+    :param template: template sequence
+    :param forward_primers: forward candidate Primer objects or PrimerBatch
+    :param reverse_primers: reverse candidate Primer objects or PrimerBatch
+    :param product_size: (minimum, maximum) product size
+    :param max_melting_temperature_difference: maximum melting temperature difference (unit °C)
+    :param gc_range: (minimum, maximum) GC content of the primers
+    :param method: melting temperature calculation method
+    :param top_k: number of the best pairs to return
+    :param penalty: pair penalty function, lower is better
+    """
+    if not isinstance(template, str):
+        raise OPRBaseError(PAIR_TEMPLATE_TYPE_ERROR)
+    if len(product_size) != 2 or not all(isinstance(size, int) for size in product_size) or \
+            not 1 <= product_size[0] <= product_size[1]:
+        raise OPRBaseError(PAIR_PRODUCT_SIZE_ERROR)
+    if top_k is not None and (not isinstance(top_k, int) or top_k < 1):
+        raise OPRBaseError(PAIR_TOP_K_ERROR)
+    if penalty is None:
+        penalty = melting_temperature_difference_penalty
+    template = template.upper()
+    forward = _Candidates(forward_primers)
+    reverse = _Candidates(reverse_primers)
+    pairs = (
+        PrimerPair(
+            forward=forward.primer(forward_candidate.index),
+            reverse=reverse.primer(reverse_candidate.index),
+            forward_start=forward_candidate.start,
+            reverse_start=reverse_candidate.start,
+            product_size=reverse_candidate.end - forward_candidate.start,
+            melting_temperature_difference=abs(
+                forward_candidate.melting_temperature - reverse_candidate.melting_temperature),
+        )
+        for forward_candidate, reverse_candidate in _compatible_pairs(
+            forward.locate(template, method, gc_range, reverse=False),
+            reverse.locate(template, method, gc_range, reverse=True),
+            product_size, max_melting_temperature_difference)
+    )
+    if top_k is None:
+        return sorted(pairs, key=penalty)
+    return heapq.nsmallest(top_k, pairs, key=penalty)
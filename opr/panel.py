@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""OPR multiplex panel compatibility."""
+from typing import Callable, Iterable, Iterator, Optional, List, Tuple, Dict, NamedTuple, Any
+import heapq
+from .errors import OPRBaseError
+from .primer import Primer, MeltingTemperature
+from .dimer import Dimer, DimerIndex
+from .params import DEFAULT_TEMPERATURE
+from .params import PANEL_PRIMER_TYPE_ERROR, PANEL_KEY_ERROR, PANEL_TOP_K_ERROR
+
+
+class PanelInteraction(NamedTuple):
+    """
+    Interaction of two primers of a panel, identified by their keys (first <= second).
+
+    `dimer` is the complementarity of the primers if they share a complementary seed, None otherwise, and
+    `shared_kmers` is the number of distinct seeds found in both sequences.
+    """
+
+    first: int
+    second: int
+    dimer: Optional[Dimer]
+    shared_kmers: int
+
+
+class PanelUpdate(NamedTuple):
+    """Interactions added to or removed from a panel with the primer of the given key."""
+
+    key: int
+    interactions: List[PanelInteraction]
+
+
+def interaction_severity(interaction: PanelInteraction) -> Tuple[int, float, int]:
+    """
+    Return the sort key of an interaction, lower is worse.
+
+    Interactions are ranked by 3' end complementarity, then by dimer ΔG and then by the number of shared seeds.
+
+    :param interaction: panel interaction
+    """
+    if interaction.dimer is None:
+        return 0, 0.0, -interaction.shared_kmers
+    return -interaction.dimer.end_complementarity, interaction.dimer.delta_g, -interaction.shared_kmers
+
+
+class Panel:
+    """
+    The Panel class checks the cross-compatibility of the primers of a multiplex panel.
+
+    The seeds (k-mers) of the primer sequences are kept in a DimerIndex, which is probed with the seeds of each added
+    primer and of its reverse complement. Only the pairs sharing a complementary seed are scored as dimers, at
+    the alignments given by the seeds, so adding or removing a primer only updates the interactions of that primer.
+
+    >>> opanel = Panel([Primer("CTGGAGGACGGAAGAGGAAGTAA"), Primer("TTACTTCCTCTTCCGTCC")])
+    >>> opanel.worst(top_k=5)
+    """
+
+    def __init__(self, primers: Iterable[Primer] = (), seed_length: int = 6,
+                 temperature: float = DEFAULT_TEMPERATURE,
+                 method: MeltingTemperature = MeltingTemperature.NEAREST_NEIGHBOR) -> None:
+        """
+        Initialize the Panel instance.
+
+        :param primers: panel primers
+        :param seed_length: minimum length of the complementary stretches and length of the shared seeds
+        :param temperature: temperature of the ΔG calculations (unit °C)
+        :param method: melting temperature calculation method
+        """
+        self._index = DimerIndex(seed_length, temperature)
+        self._method = method
+        self._next_key = 0
+        self._primers = {}
+        self._melting_temperatures = {}
+        self._interactions = {}
+        self._partners = {}
+        for primer in primers:
+            self.add(primer)
+
+    def add(self, primer: Primer) -> PanelUpdate:
+        """
+        Add a primer to the panel and return its key with its interactions.
+
+        :param primer: primer
+        """
+        if not isinstance(primer, Primer):
+            raise OPRBaseError(PANEL_PRIMER_TYPE_ERROR)
+        key = self._next_key
+        self._next_key += 1
+        self._primers[key] = primer
+        self._melting_temperatures[key] = primer.melting_temperature(self._method)
+        self._partners[key] = set()
+        self._index.add(key, primer)
+        dimers = self._index.dimers(key)
+        shared_kmers = self._index.shared_seeds(key)
+        interactions = []
+        for other_key in sorted(dimers.keys() | shared_kmers.keys()):
+            interaction = PanelInteraction(other_key, key, dimers.get(other_key), shared_kmers.get(other_key, 0))
+            self._interactions[other_key, key] = interaction
+            self._partners[other_key].add(key)
+            self._partners[key].add(other_key)
+            interactions.append(interaction)
+        return PanelUpdate(key, interactions)
+
+    def remove(self, key: int) -> PanelUpdate:
+        """
+        Remove a primer from the panel and return its key with the interactions removed along with it.
+
+        :param key: primer key
+        """
+        if key not in self._primers:
+            raise OPRBaseError(PANEL_KEY_ERROR)
+        del self._primers[key]
+        del self._melting_temperatures[key]
+        self._index.remove(key)
+        interactions = []
+        for other_key in sorted(self._partners.pop(key)):
+            self._partners.get(other_key, set()).discard(key)
+            interactions.append(self._interactions.pop((min(key, other_key), max(key, other_key))))
+        return PanelUpdate(key, interactions)
+
+    def __len__(self) -> int:
+        """Return the number of primers in the panel."""
+        return len(self._primers)
+
+    def __contains__(self, key: int) -> bool:
+        """
+        Check whether the panel has a primer with the given key.
+
+        :param key: primer key
+        """
+        return key in self._primers
+
+    def __getitem__(self, key: int) -> Primer:
+        """
+        Return the primer of the given key.
+
+        :param key: primer key
+        """
+        if key not in self._primers:
+            raise OPRBaseError(PANEL_KEY_ERROR)
+        return self._primers[key]
+
+    def __iter__(self) -> Iterator[Tuple[int, Primer]]:
+        """Iterate through the (key, primer) pairs of the panel."""
+        return iter(list(self._primers.items()))
+
+    @property
+    def seed_length(self) -> int:
+        """Return the seed length."""
+        return self._index.seed_length
+
+    @property
+    def interactions(self) -> List[PanelInteraction]:
+        """Return all the interactions of the panel, ordered by the keys of their primers."""
+        return sorted(self._interactions.values(), key=lambda interaction: interaction[:2])
+
+    def interactions_of(self, key: int) -> List[PanelInteraction]:
+        """
+        Return the interactions of a primer, ordered by the keys of their primers.
+
+        :param key: primer key
+        """
+        if key not in self._primers:
+            raise OPRBaseError(PANEL_KEY_ERROR)
+        return [self._interactions[min(key, other_key), max(key, other_key)]
+                for other_key in sorted(self._partners[key])]
+
+    @property
+    def melting_temperatures(self) -> Dict[int, float]:
+        """Return the melting temperature of each primer by key."""
+        return dict(self._melting_temperatures)
+
+    @property
+    def melting_temperature_spread(self) -> float:
+        """Return the difference between the highest and the lowest melting temperatures of the panel."""
+        if not self._melting_temperatures:
+            return 0.0
+        return max(self._melting_temperatures.values()) - min(self._melting_temperatures.values())
+
+    def worst(self, top_k: int = 10,
+              key: Optional[Callable[[PanelInteraction], Any]] = None) -> List[PanelInteraction]:
+        """
+        Return the `top_k` worst interactions of the panel, worst first.
+
+        :param top_k: number of interactions to return
+        :param key: sort key of the interactions, lower is worse, `interaction_severity` if None
+        """
+        if not isinstance(top_k, int) or top_k < 1:
+            raise OPRBaseError(PANEL_TOP_K_ERROR)
+        return heapq.nsmallest(top_k, self._interactions.values(), key=key or interaction_severity)
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""OPR parallel analysis."""
+from typing import Union, Iterable, Generator, Optional, Sequence, Tuple, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import itertools
+import os
+from .errors import OPRBaseError
+from .primer import Primer, MeltingTemperature
+from .batch import PrimerBatch
+from .store import open_property_store, get_property_store
+from .diagnostics import DiagnosticsMode, set_diagnostics_mode, get_diagnostics_mode
+from .params import ANALYZE_PROPERTIES, ANALYZE_PROPERTY_ERROR, ANALYZE_WORKERS_ERROR, ANALYZE_CHUNK_SIZE_ERROR
+
+Property = Union[str, MeltingTemperature]
+
+
+def _validate_properties(properties: Sequence[Property]) -> Tuple[Property, ...]:
+    """
+    Validate the requested properties and return them as a tuple.
+
+    :param properties: requested properties
+    """
+    properties = tuple(properties)
+    for item in properties:
+        if not isinstance(item, MeltingTemperature) and item not in ANALYZE_PROPERTIES:
+            raise OPRBaseError(ANALYZE_PROPERTY_ERROR.format(", ".join(ANALYZE_PROPERTIES)))
+    return properties
+
+
+def _batch_property(batch: PrimerBatch, item: Property) -> Sequence[Any]:
+    """
+    Calculate a property for all primers of a batch and return the values.
+
+    :param batch: primer batch
+    :param item: property name or melting temperature method
+    """
+    if isinstance(item, MeltingTemperature):
+        return batch.melting_temperature(item)
+    return getattr(batch, item)
+
+
+def _initialize_worker(store_path: Optional[str], mode: DiagnosticsMode) -> None:
+    """
+    Open the property store and set the diagnostics mode of the parent process in a worker process.
+
+    :param store_path: property store file path, None if no store is open
+    :param mode: diagnostics mode
+    """
+    if store_path is not None:
+        open_property_store(store_path)
+    set_diagnostics_mode(mode)
+
+
+def _analyze_chunk(batch: PrimerBatch, properties: Tuple[Property, ...]) -> List[Sequence[Any]]:
+    """
+    Calculate the requested properties of a batch and return one column per property.
+
+    :param batch: primer batch
+    :param properties: requested properties
+    """
+    return [_batch_property(batch, item) for item in properties]
+
+
+def _chunks(sequences: Iterable[Union[str, Primer]], chunk_size: int,
+            salt: float) -> Generator[Tuple[int, PrimerBatch], None, None]:
+    """
+    Split the sequences into PrimerBatch chunks and yield them with the index of their first sequence.
+
+    :param sequences: primers sequences or Primer objects
+    :param chunk_size: number of sequences in each chunk
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    """
+    iterator = iter(sequences)
+    start = 0
+    while True:
+        chunk = [item.sequence if isinstance(item, Primer) else item for item in itertools.islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        yield start, PrimerBatch(chunk, salt=salt)
+        start += len(chunk)
+
+
+def _rows(start: int, properties: Tuple[Property, ...],
+          columns: List[Sequence[Any]]) -> Generator[Tuple[int, Dict[Property, Any]], None, None]:
+    """
+    Convert property columns of a chunk into (index, result) rows and yield them.
+
+    :param start: index of the first sequence of the chunk
+    :param properties: requested properties
+    :param columns: one column of values per property
+    """
+    for offset, values in enumerate(zip(*columns)):
+        yield start + offset, dict(zip(properties, values))
+
+
+def _analyze_stream(chunks: Iterable[Tuple[int, PrimerBatch]], properties: Tuple[Property, ...],
+                    workers: int) -> Generator[Tuple[int, Dict[Property, Any]], None, None]:
+    """
+    Analyze the chunks on a process pool and yield (index, result) rows as soon as each chunk is done.
+
+    :param chunks: (start index, batch) chunks
+    :param properties: requested properties
+    :param workers: number of worker processes
+    """
+    if workers == 1:
+        for start, batch in chunks:
+            yield from _rows(start, properties, _analyze_chunk(batch, properties))
+        return
+    property_store = get_property_store()
+    store_path = property_store.path if property_store is not None else None
+    initargs = (store_path, get_diagnostics_mode())
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initialize_worker, initargs=initargs) as executor:
+        pending = {}
+        for start, batch in chunks:
+            pending[executor.submit(_analyze_chunk, batch, properties)] = start
+            # bound the number of chunks in flight so memory does not grow with the input size
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from _rows(pending.pop(future), properties, future.result())
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from _rows(pending.pop(future), properties, future.result())
+
+
+def analyze_many(sequences: Iterable[Union[str, Primer]], properties: Sequence[Property] = ANALYZE_PROPERTIES,
+                 workers: Optional[int] = 1, chunk_size: int = 10000, salt: float = 50,
+                 ordered: bool = True) -> Union[List[Dict[Property, Any]],
+                                                Generator[Tuple[int, Dict[Property, Any]], None, None]]:
+    """
+    Calculate properties of many primers on a process pool.
+
+    Sequences are sent to the workers as PrimerBatch chunks, and the results are returned as one dictionary per
+    sequence. In the ordered mode a list in input order is returned, otherwise a generator of (index, result)
+    pairs is returned which yields the results of each chunk as soon as it is done.
+
+    :param sequences: primers sequences or Primer objects
+    :param properties: property names and/or MeltingTemperature methods to calculate
+    :param workers: number of worker processes, all CPUs if None
+    :param chunk_size: number of sequences sent to a worker at once
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    :param ordered: ordered flag
+    """
+    properties = _validate_properties(properties)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers < 1:
+        raise OPRBaseError(ANALYZE_WORKERS_ERROR)
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise OPRBaseError(ANALYZE_CHUNK_SIZE_ERROR)
+    stream = _analyze_stream(_chunks(sequences, chunk_size, salt), properties, workers)
+    if not ordered:
+        return stream
+    results = {}
+    for index, result in stream:
+        results[index] = result
+    return [results[index] for index in range(len(results))]
@@ -3,6 +3,9 @@
 OPR_VERSION = "0.5"
 VALID_BASES = set('ATCG')
 DNA_COMPLEMENT_MAP = {"A": "T", "C": "G", "G": "C", "T": "A"}
+VALID_BASES_BYTES = b"ATCG"
+DNA_COMPLEMENT_TABLE = str.maketrans(DNA_COMPLEMENT_MAP)
+DNA_COMPLEMENT_BYTES_TABLE = bytes.maketrans(b"ACGT", b"TGCA")
 
 PRIMER_LOWER_LENGTH = 18
 PRIMER_HIGHEST_LENGTH = 30
@@ -139,6 +142,131 @@ PRIMER_MELTING_TEMPERATURE_NOT_IMPLEMENTED_ERROR = "This method for calculating
 
 PRIMER_ATTRIBUTE_NOT_COMPUTABLE_ERROR = "This attribute either doesn't exist or cannot be computed/cached."
 
+FROZEN_PRIMER_INPLACE_ERROR = "The sequence of a FrozenPrimer cannot be changed inplace."
+
+PRIMER_BATCH_NAMES_LENGTH_ERROR = "The number of names should be equal to the number of sequences."
+PRIMER_BATCH_PRIMERS_TYPE_ERROR = "PrimerBatch can only be built from Primer objects."
+
+READER_FORMAT_ERROR = "`file_format` should be a SequenceFormat."
+READER_FASTA_RECORD_ERROR = "FASTA sequence lines should follow a `>` header line."
+READER_FASTQ_RECORD_ERROR = "FASTQ records should consist of a header, sequence, separator and quality line."
+READER_BATCH_SIZE_ERROR = "`batch_size` should be a positive integer."
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
+ANALYZE_PROPERTIES = ("molecular_weight", "gc_content", "gc_clamp", "E260", "delta_h", "delta_s")
+ANALYZE_PROPERTY_ERROR = "Properties should be chosen from {0} or be a MeltingTemperature."
+ANALYZE_WORKERS_ERROR = "`workers` should be a positive integer."
+ANALYZE_CHUNK_SIZE_ERROR = "`chunk_size` should be a positive integer."
+
+RUNS_UNIT_LENGTH_ERROR = "`unit_length` should be 1 (single runs) or 2 (double runs)."
+
+SCANNER_TEMPLATE_TYPE_ERROR = "Template sequence should be a string variable."
+SCANNER_LENGTH_ERROR = (
+    "Window lengths should be positive integers and `min_length` should not be greater than `max_length`.")
+SCANNER_TOP_K_ERROR = "`top_k` should be a positive integer and requires a `key` function."
+
+DIMER_PRIMER_TYPE_ERROR = "Dimers can only be calculated between Primer objects."
+DIMER_SEED_LENGTH_ERROR = "`seed_length` should be a positive integer."
+DIMER_INDEX_KEY_ERROR = "There is no primer with the given key in the dimer index."
+DIMER_INDEX_DUPLICATE_KEY_ERROR = "There is already a primer with the given key in the dimer index."
+
+KMER_INDEX_MAGIC_NUMBER = b"OPRKIDX1"
+KMER_INDEX_BYTE_ORDER_MARK = 0x0102030405060708
+# Blocks of the index and packed sequences files are aligned to 8 bytes, so their arrays can be mapped in place
+FILE_BLOCK_ALIGNMENT = 8
+KMER_INDEX_MAX_K = 13
+KMER_INDEX_MIN_DEFAULT_K = 8
+KMER_INDEX_MAX_DEFAULT_K = 12
+KMER_INDEX_K_ERROR = "`k` should be an integer between 1 and {0}.".format(KMER_INDEX_MAX_K)
+KMER_INDEX_FILE_ERROR = "The file is not a valid OPR k-mer index."
+KMER_INDEX_PRIMER_TYPE_ERROR = "Binding sites can only be searched for Primer objects."
+KMER_INDEX_PRIMER_LENGTH_ERROR = "The primer should not be shorter than the index k-mers."
+KMER_INDEX_MISMATCHES_ERROR = "`max_mismatches` should be a non-negative integer."
+KMER_INDEX_RECORD_ERROR = "The record is not in the k-mer index."
+KMER_INDEX_REGION_ERROR = "The region should be a (start, end) pair of integers within the record."
+
+PACKED_SEQUENCES_MAGIC_NUMBER = b"OPRPACK1"
+PACKED_SEQUENCES_BYTE_ORDER_MARK = KMER_INDEX_BYTE_ORDER_MARK
+PACKED_SEQUENCES_FILE_ERROR = "The file is not a valid OPR packed sequences file."
+PACKED_SEQUENCES_RECORD_ERROR = "The record is not in the packed sequences."
+PACKED_SEQUENCES_REGION_ERROR = "The region should be a (start, end) pair of integers within the record."
+PACKED_SEQUENCES_WINDOW_ERROR = "`length` and `step` should be positive integers."
+
+PAIR_TEMPLATE_TYPE_ERROR = "Template sequence should be a string variable."
+PAIR_PRIMERS_TYPE_ERROR = "Candidate primers should be Primer objects or a PrimerBatch."
+PAIR_PRODUCT_SIZE_ERROR = "`product_size` should be a (minimum, maximum) pair of positive integers."
+PAIR_TOP_K_ERROR = "`top_k` should be a positive integer."
+
+PROPERTY_CACHE_DEFAULT_SIZE = 2 ** 16
+PROPERTY_CACHE_SIZE_ERROR = "`maxsize` should be a positive integer."
+
+# Version of the property calculation formulas, increased whenever the calculation of a stored property changes
+PROPERTY_STORE_FORMULA_VERSION = 2
+# Scientific parameters of the stored property calculations
+PROPERTY_STORE_PARAMETERS = (
+    "A_WEIGHT", "T_WEIGHT", "C_WEIGHT", "G_WEIGHT", "ANHYDROUS_MOLECULAR_WEIGHT_CONSTANT",
+    "BASE_EXTINCTION_COEFFICIENTS", "NN53_EXTINCTION_COEFFICIENTS", "NN_PARAMS",
+    "DEFAULT_TEMPERATURE", "KELVIN_OFFSET", "GAS_CONSTANT", "HAIRPIN_MIN_LOOP_LENGTH", "HAIRPIN_LOOP_DELTA_G",
+)
+PROPERTY_STORE_BATCH_SIZE = 500
+PROPERTY_STORE_TIMEOUT = 60  # seconds
+PROPERTY_STORE_FILE_ERROR = "The file is not a valid OPR property store."
+
+DIAGNOSTICS_MODE_ERROR = "`mode` should be a DiagnosticsMode."
+
+PRIMER_SET_PRIMER_TYPE_ERROR = "PrimerSet primers should be Primer objects."
+PRIMER_SET_EMPTY_PRIMER_ERROR = "PrimerSet primers should not be empty."
+PRIMER_SET_SEQUENCE_TYPE_ERROR = "Sequence should be a string variable."
+
+PANEL_PRIMER_TYPE_ERROR = "Panel primers should be Primer objects."
+PANEL_KEY_ERROR = "There is no primer with the given key in the panel."
+PANEL_TOP_K_ERROR = "`top_k` should be a positive integer."
+
+POOL_PRIMERS_TYPE_ERROR = "Pool primers should be Primer objects."
+POOL_MELTING_TEMPERATURE_RANGE_ERROR = "`max_melting_temperature_range` should be a non-negative number."
+POOL_SIZE_ERROR = "`max_pool_size` should be a positive integer."
+POOL_COMPLEMENTARITY_ERROR = "Complementarity thresholds should be positive integers."
+
+PCR_INDEX_TYPE_ERROR = "Templates should be a KmerIndex."
+PCR_PAIRS_TYPE_ERROR = "Primer pairs should be (forward, reverse) pairs of Primer objects."
+PCR_PRODUCT_SIZE_ERROR = "`product_size` should be a (minimum, maximum) pair of positive integers."
+
+TRANSLATION_CHUNK_SIZE = 2 ** 20  # codons translated at once while scanning ORFs
+TRANSLATION_SEQUENCE_TYPE_ERROR = "Sequence should be a string variable."
+TRANSLATION_SEQUENCE_VALID_BASES_ERROR = "Sequence should only contain the nucleotide bases A, T, C, and G."
+TRANSLATION_FRAME_ERROR = "Parameter `frame` must be 1, 2, 3, -1, -2, or -3."
+ORF_MIN_LENGTH_ERROR = "`min_length` should be a positive integer."
+ORF_CHUNK_SIZE_ERROR = "`chunk_size` should be a positive integer."
+
+DEFAULT_TEMPERATURE = 37  # °C, used for ΔG calculations
+KELVIN_OFFSET = 273.15
+GAS_CONSTANT = 0.0019872  # kcal / (K·mol)
+
+# Hairpin loop initiation ΔG at 37 °C (in kcal/mol), keyed by the number of unpaired loop bases
+# ref: SantaLucia Jr, John, and Donald Hicks. "The thermodynamics of DNA structural motifs." (2004)
+HAIRPIN_MIN_LOOP_LENGTH = 3
+HAIRPIN_LOOP_DELTA_G = {
+    3: 3.5,
+    4: 3.5,
+    5: 3.3,
+    6: 4.0,
+    7: 4.2,
+    8: 4.3,
+    9: 4.5,
+    10: 4.6,
+    12: 5.0,
+    14: 5.1,
+    16: 5.3,
+    18: 5.5,
+    20: 5.7,
+    25: 6.1,
+    30: 6.3,
+}
+# a hairpin has a loop and at least 2 stem base pairs
+HAIRPIN_MIN_SEQUENCE_LENGTH = HAIRPIN_MIN_LOOP_LENGTH + 4
+HAIRPIN_CACHE_SIZE = 2 ** 18
+HAIRPIN_SUBRESULTS_CACHE_SIZE = 2 ** 16
+
 # For DNA
 # Nearest-neighbor parameters (ΔH in kcal/mol, ΔS in kcal/K·mol)
 # ref: https://www.sigmaaldrich.com/CA/en/technical-documents/protocol/genomics/pcr/oligos-melting-temp
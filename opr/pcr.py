@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""OPR in-silico PCR."""
+from typing import Iterable, Optional, Tuple, List, Dict, NamedTuple
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from .errors import OPRBaseError
+from .primer import Primer
+from .index import KmerIndex, BindingSite
+from .functions import NN_PAIR_PARAMS, nearest_neighbor_melting_temperature_calc
+from .functions import is_valid_sequence, reverse_complement_calc
+from .params import PCR_INDEX_TYPE_ERROR, PCR_PAIRS_TYPE_ERROR, PCR_PRODUCT_SIZE_ERROR
+
+
+class Amplicon(NamedTuple):
+    """
+    Predicted PCR product of a primer pair on a template record.
+
+    The product spans [`start`, `end`) of the forward strand of the `name` record. `forward` binds the "+" strand site
+    `forward_site` at the start of the product and `reverse` binds the "-" strand site `reverse_site` at its end; they
+    are the pair primers in either order, or the same primer for single-primer products. The binding melting
+    temperatures are nearest-neighbor Tms of the primers on their sites, and `product` is None if the product contains
+    bases other than A, T, C and G.
+    """
+
+    pair: int
+    name: str
+    start: int
+    end: int
+    product_size: int
+    forward: Primer
+    reverse: Primer
+    forward_site: BindingSite
+    reverse_site: BindingSite
+    forward_melting_temperature: float
+    reverse_melting_temperature: float
+    product: Optional[Primer]
+
+
+class _Binding(NamedTuple):
+    """Binding site of a primer and its melting temperature."""
+
+    primer: Primer
+    site: BindingSite
+    melting_temperature: float
+
+
+def binding_melting_temperature(sequence: str, target: str, salt: float = 50) -> float:
+    """
+    Calculate the nearest-neighbor melting temperature of a primer bound to a target and return it.
+
+    `target` is the sequence the primer is aligned to without gaps (the sequence it would be identical to if fully
+    matched). Only the stacks of two consecutive matched bases contribute to ΔH and ΔS, so a fully matched primer has
+    its own nearest-neighbor Tm and each mismatch removes the stacks it breaks.
+
+    :param sequence: primer nucleotides sequence
+    :param target: target nucleotides sequence
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    """
+    delta_h = 0.0
+    delta_s = 0.0
+    matched = False
+    for index, (base, target_base) in enumerate(zip(sequence, target)):
+        if base != target_base:
+            matched = False
+            continue
+        if matched:
+            stack_delta_h, stack_delta_s = NN_PAIR_PARAMS[sequence[index - 1:index + 1]]
+            delta_h += stack_delta_h
+            delta_s += stack_delta_s
+        matched = True
+    return nearest_neighbor_melting_temperature_calc(sequence, salt, (delta_h, delta_s))
+
+
+def _bindings(index: KmerIndex, primer: Primer, max_mismatches: int, salt: float) -> List[Tuple[BindingSite, float]]:
+    """
+    Find the binding sites of a primer and return them with their melting temperatures.
+
+    :param index: k-mer index of the templates
+    :param primer: primer
+    :param max_mismatches: maximum number of mismatches per binding site
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    """
+    sequence = primer.sequence
+    bindings = []
+    for site in index.search(primer, max_mismatches):
+        target = index.region(site.name, site.position, site.position + len(sequence))
+        if site.strand == "-":
+            target = reverse_complement_calc(target)
+        bindings.append((site, binding_melting_temperature(sequence, target, salt)))
+    return bindings
+
+
+def predict_amplicons(index: KmerIndex, pairs: Iterable[Tuple[Primer, Primer]], max_mismatches: int = 2,
+                      product_size: Tuple[int, int] = (50, 3000), salt: float = 50) -> List[Amplicon]:
+    """
+    Predict the PCR products of primer pairs on the templates of a k-mer index.
+
+    The binding sites of both primers of a pair are searched on both strands with the index seeds. Each "+" strand
+    site is paired with every "-" strand site of the same record that starts at or after it and gives a product size
+    in the `product_size` range, so products of the swapped pair and of a single primer are found too. Amplicons are
+    returned ordered by pair, record, start and end.
+
+    :param index: k-mer index of the templates
+    :param pairs: (forward, reverse) primer pairs, such as PrimerPair objects
+    :param max_mismatches: maximum number of mismatches per binding site
+    :param product_size: (minimum, maximum) product size
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    """
+    if not isinstance(index, KmerIndex):
+        raise OPRBaseError(PCR_INDEX_TYPE_ERROR)
+    if len(product_size) != 2 or not all(isinstance(size, int) for size in product_size) or \
+            not 0 < product_size[0] <= product_size[1]:
+        raise OPRBaseError(PCR_PRODUCT_SIZE_ERROR)
+    primer_pairs = []
+    for pair in pairs:
+        pair = tuple(pair[:2])
+        if len(pair) != 2 or not all(isinstance(primer, Primer) for primer in pair):
+            raise OPRBaseError(PCR_PAIRS_TYPE_ERROR)
+        primer_pairs.append(pair)
+    records = {name: record for record, name in reversed(list(enumerate(index.names)))}
+    searches: Dict[str, List[Tuple[BindingSite, float]]] = {}
+    amplicons = []
+    for pair_index, pair in enumerate(primer_pairs):
+        forward_bindings = []
+        reverse_bindings = defaultdict(list)
+        for primer in {primer.sequence: primer for primer in reversed(pair)}.values():
+            if primer.sequence not in searches:
+                searches[primer.sequence] = _bindings(index, primer, max_mismatches, salt)
+            for site, melting_temperature in searches[primer.sequence]:
+                binding = _Binding(primer, site, melting_temperature)
+                if site.strand == "+":
+                    forward_bindings.append(binding)
+                else:
+                    reverse_bindings[site.name].append((site.position + len(primer), binding))
+        forward_bindings.sort(key=lambda binding: (records[binding.site.name], binding.site.position))
+        reverse_ends = {}
+        for name, bindings in reverse_bindings.items():
+            bindings.sort(key=lambda item: item[0])
+            reverse_ends[name] = [end for end, _ in bindings]
+        for forward in forward_bindings:
+            name = forward.site.name
+            if name not in reverse_ends:
+                continue
+            start = forward.site.position
+            lowest = bisect_left(reverse_ends[name], start + product_size[0])
+            highest = bisect_right(reverse_ends[name], start + product_size[1])
+            for end, reverse in reverse_bindings[name][lowest:highest]:
+                if reverse.site.position < start:
+                    continue
+                sequence = index.region(name, start, end)
+                product = None
+                if is_valid_sequence(sequence):
+                    # products are longer than primers, their length is only recorded as a diagnostic
+                    product = Primer._from_valid_sequence(sequence, "{0}:{1}-{2}".format(name, start, end), salt)
+                amplicons.append(Amplicon(
+                    pair_index, name, start, end, end - start, forward.primer, reverse.primer, forward.site,
+                    reverse.site, forward.melting_temperature, reverse.melting_temperature, product))
+    return amplicons
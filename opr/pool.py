@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""OPR multiplex pool assignment."""
+from typing import Callable, Iterable, Optional, List, Dict, NamedTuple
+import math
+import random
+from .errors import OPRBaseError
+from .primer import Primer, MeltingTemperature
+from .dimer import DimerIndex
+from .params import DEFAULT_TEMPERATURE
+from .params import POOL_PRIMERS_TYPE_ERROR, POOL_MELTING_TEMPERATURE_RANGE_ERROR, POOL_SIZE_ERROR
+from .params import POOL_COMPLEMENTARITY_ERROR
+
+
+class Pool(NamedTuple):
+    """Pool of a multiplex panel, `indices` are the positions of its primers in the input."""
+
+    indices: List[int]
+    lowest_melting_temperature: float
+    highest_melting_temperature: float
+
+
+def dimer_conflict(min_end_complementarity: int = 5, min_complementarity: int = 10,
+                   temperature: float = DEFAULT_TEMPERATURE) -> Callable[[Primer, Primer], bool]:
+    """
+    Return a conflict predicate reporting the primer pairs that form a dimer.
+
+    Two primers conflict if they have at least `min_end_complementarity` complementary bases at a 3' end or at
+    least `min_complementarity` consecutive complementary bases anywhere. The primers are kept in a DimerIndex by
+    sequence, so pairs without a complementary seed are rejected without being aligned.
+
+    :param min_end_complementarity: minimum 3' end complementarity of a conflict
+    :param min_complementarity: minimum complementarity of a conflict
+    :param temperature: temperature of the ΔG calculations (unit °C)
+    """
+    if not all(isinstance(value, int) and value > 0 for value in (min_end_complementarity, min_complementarity)):
+        raise OPRBaseError(POOL_COMPLEMENTARITY_ERROR)
+    # any stretch of complementary bases long enough for a conflict holds a complementary seed
+    oindex = DimerIndex(min(min_end_complementarity, min_complementarity), temperature)
+
+    def conflict(primer1: Primer, primer2: Primer) -> bool:
+        for primer in (primer1, primer2):
+            if primer.sequence not in oindex:
+                oindex.add(primer.sequence, primer)
+        dimer = oindex.dimer(primer1.sequence, primer2.sequence)
+        return dimer is not None and (dimer.end_complementarity >= min_end_complementarity or
+                                      dimer.longest_complementarity >= min_complementarity)
+    return conflict
+
+
+def _bands(order: List[int], melting_temperatures: Dict[int, float], max_range: float) -> List[List[int]]:
+    """
+    Split primers sorted by melting temperature into the fewest bands within a melting temperature range.
+
+    :param order: primer indices sorted by melting temperature
+    :param melting_temperatures: melting temperature of each primer
+    :param max_range: maximum melting temperature range of a band
+    """
+    bands = []
+    for index in order:
+        if not bands or melting_temperatures[index] - melting_temperatures[bands[-1][0]] > max_range:
+            bands.append([])
+        bands[-1].append(index)
+    return bands
+
+
+def assign_pools(primers: Iterable[Primer], conflict: Optional[Callable[[Primer, Primer], bool]] = None,
+                 max_melting_temperature_range: float = 5, max_pool_size: Optional[int] = None,
+                 method: MeltingTemperature = MeltingTemperature.NEAREST_NEIGHBOR, seed: int = 0) -> List[Pool]:
+    """
+    Split a multiplex panel into pools of compatible primers and return them.
+
+    The primers are sorted by melting temperature and split into the fewest bands whose melting temperatures differ
+    by at most `max_melting_temperature_range`. Each band starts with as many pools as `max_pool_size` requires, and
+    its primers are placed in random order (seeded by `seed`) into the least loaded pool with room and without a
+    conflicting primer; a new pool is opened if there is none, like in greedy graph coloring. `conflict` is only called
+    for the primers of the tried pools. The pools are returned in ascending order of their lowest melting temperature.
+
+    :param primers: panel primers
+    :param conflict: function returning true if two primers should not share a pool
+    :param max_melting_temperature_range: maximum melting temperature range of a pool (unit °C)
+    :param max_pool_size: maximum number of primers in a pool
+    :param method: melting temperature calculation method
+    :param seed: random seed of the placement order
+    """
+    primers = list(primers)
+    if not all(isinstance(primer, Primer) for primer in primers):
+        raise OPRBaseError(POOL_PRIMERS_TYPE_ERROR)
+    if not isinstance(max_melting_temperature_range, (int, float)) or max_melting_temperature_range < 0:
+        raise OPRBaseError(POOL_MELTING_TEMPERATURE_RANGE_ERROR)
+    if max_pool_size is not None and (not isinstance(max_pool_size, int) or max_pool_size < 1):
+        raise OPRBaseError(POOL_SIZE_ERROR)
+    randomizer = random.Random(seed)
+    melting_temperatures = {index: primer.melting_temperature(method) for index, primer in enumerate(primers)}
+    order = list(range(len(primers)))
+    randomizer.shuffle(order)
+    order.sort(key=lambda index: melting_temperatures[index])
+    result = []
+    for band in _bands(order, melting_temperatures, max_melting_temperature_range):
+        pools = [[] for _ in range(math.ceil(len(band) / max_pool_size) if max_pool_size else 1)]
+        randomizer.shuffle(band)
+        for index in band:
+            candidates = sorted(
+                (pool for pool in pools if max_pool_size is None or len(pool) < max_pool_size), key=len)
+            for pool in candidates:
+                if conflict is None or not any(conflict(primers[index], primers[member]) for member in pool):
+                    pool.append(index)
+                    break
+            else:
+                pools.append([index])
+        for pool in pools:
+            if pool:
+                pool.sort()
+                band_melting_temperatures = [melting_temperatures[index] for index in pool]
+                result.append(Pool(pool, min(band_melting_temperatures), max(band_melting_temperatures)))
+    result.sort(key=lambda pool: pool.lowest_melting_temperature)
+    return result
@@ -2,24 +2,30 @@
 """OPR primer."""
 from __future__ import annotations
 from typing import Union, Generator, Optional
-from typing import Dict
+from typing import Callable, Dict, Tuple, Any, NamedTuple
 import re
-import itertools
+import functools
 from enum import Enum
-from warnings import warn
 from .errors import OPRBaseError
-from .params import DEFAULT_PRIMER_NAME, VALID_BASES
-from .params import PRIMER_SEQUENCE_TYPE_ERROR, PRIMER_SEQUENCE_LENGTH_WARNING, PRIMER_SEQUENCE_VALID_BASES_ERROR, PRIMER_SEQUENCE_VALID_GC_CONTENT_RANGE_WARNING
-from .params import PRIMER_LOWER_LENGTH, PRIMER_HIGHEST_LENGTH, PRIMER_LOWEST_GC_RANGE, PRIMER_HIGHEST_GC_RANGE
-from .params import DNA_COMPLEMENT_MAP
+from .params import DEFAULT_PRIMER_NAME
+from .params import PRIMER_SEQUENCE_TYPE_ERROR, PRIMER_SEQUENCE_VALID_BASES_ERROR
 from .params import PRIMER_ADDITION_ERROR, PRIMER_MULTIPLICATION_ERROR
 from .params import PRIMER_MELTING_TEMPERATURE_NOT_IMPLEMENTED_ERROR
-from .params import PRIMER_ATTRIBUTE_NOT_COMPUTABLE_ERROR
+from .params import PRIMER_ATTRIBUTE_NOT_COMPUTABLE_ERROR, FROZEN_PRIMER_INPLACE_ERROR
 from .params import FRAME_ERROR
-from .params import CODONS_TO_AMINO_ACIDS_LONG, CODONS_TO_AMINO_ACIDS_SHORT
+from .params import ANHYDROUS_MOLECULAR_WEIGHT_CONSTANT, BASE_EXTINCTION_COEFFICIENTS, NN53_EXTINCTION_COEFFICIENTS
 from .functions import molecular_weight_calc, basic_melting_temperature_calc, salt_adjusted_melting_temperature_calc, gc_clamp_calc
 from .functions import nearest_neighbor_melting_temperature_calc, calculate_thermodynamics_constants
-from .functions import e260_ssnn_calc
+from .functions import e260_ssnn_calc, is_valid_sequence, complement_calc, reverse_complement_calc
+from .functions import primer_profile_calc, molecular_weight_from_counts, max_runs_calc
+from .functions import basic_melting_temperature_from_counts, salt_adjusted_melting_temperature_from_counts
+from .functions import NN_PAIR_PARAMS
+from .hairpin import Hairpin, hairpin_calc
+from .translation import translate_codons, multi_letter_protein
+from .variants import Variant, sequence_variants
+from .cache import get_property_cache
+from .store import get_property_store
+from .diagnostics import Diagnostic, report_diagnostic, length_diagnostic, gc_content_diagnostic
 
 
 class MeltingTemperature(Enum):
@@ -30,6 +36,121 @@ class MeltingTemperature(Enum):
     NEAREST_NEIGHBOR = 3
 
 
+# Bit flags of the computed attributes, packed into the `_computed` integer of each Primer
+COMPUTED_FLAGS = {
+    "molecular_weight": 1 << 0,
+    "gc_content": 1 << 1,
+    "gc_clamp": 1 << 2,
+    "single_runs": 1 << 3,
+    "double_runs": 1 << 4,
+    "E260": 1 << 5,
+    "delta_s": 1 << 6,
+    "delta_h": 1 << 7,
+    "hairpin": 1 << 11,
+}
+MELTING_TEMPERATURE_FLAGS = {
+    MeltingTemperature.BASIC: 1 << 8,
+    MeltingTemperature.SALT_ADJUSTED: 1 << 9,
+    MeltingTemperature.NEAREST_NEIGHBOR: 1 << 10,
+}
+ALL_COMPUTED_FLAGS = sum(COMPUTED_FLAGS.values()) + sum(MELTING_TEMPERATURE_FLAGS.values())
+# the hairpin is left out of the single pass of `profile`
+PROFILE_COMPUTED_FLAGS = ALL_COMPUTED_FLAGS & ~COMPUTED_FLAGS["hairpin"]
+MELTING_TEMPERATURE_SLOTS = {
+    MeltingTemperature.BASIC: "_basic_melting_temperature",
+    MeltingTemperature.SALT_ADJUSTED: "_salt_adjusted_melting_temperature",
+    MeltingTemperature.NEAREST_NEIGHBOR: "_nearest_neighbor_melting_temperature",
+}
+
+
+class _Composition(NamedTuple):
+    """
+    Properties of a sequence that can be combined across concatenations, None if they have not been computed.
+
+    `gc_count` is the number of G and C bases, the other values are the Primer properties of the same name.
+    """
+
+    length: int
+    first_base: str
+    last_base: str
+    molecular_weight: Optional[float]
+    gc_count: Optional[int]
+    delta_h: Optional[float]
+    delta_s: Optional[float]
+    E260: Optional[float]
+
+
+def _concatenate(first: _Composition, second: _Composition) -> _Composition:
+    """
+    Combine the properties of two sequences into the properties of their concatenation and return them.
+
+    The molecular weight and GC count are sums, while ΔH, ΔS and E260 also get the terms of the dinucleotide formed
+    at the junction. E260 subtracts the single base coefficient of the bases that become interior.
+
+    :param first: properties of the first sequence
+    :param second: properties of the second sequence
+    """
+    if first.length == 0:
+        return second
+    if second.length == 0:
+        return first
+
+    def combine(name: str, junction: float) -> Optional[float]:
+        first_value = getattr(first, name)
+        second_value = getattr(second, name)
+        if first_value is None or second_value is None:
+            return None
+        return first_value + second_value + junction
+
+    junction_dh, junction_ds = NN_PAIR_PARAMS[first.last_base + second.first_base]
+    junction_e260 = NN53_EXTINCTION_COEFFICIENTS[first.last_base][second.first_base]
+    if first.length > 1:
+        junction_e260 -= BASE_EXTINCTION_COEFFICIENTS[first.last_base]
+    if second.length > 1:
+        junction_e260 -= BASE_EXTINCTION_COEFFICIENTS[second.first_base]
+    return _Composition(
+        length=first.length + second.length,
+        first_base=first.first_base,
+        last_base=second.last_base,
+        molecular_weight=combine("molecular_weight", ANHYDROUS_MOLECULAR_WEIGHT_CONSTANT),
+        gc_count=combine("gc_count", 0),
+        delta_h=combine("delta_h", junction_dh),
+        delta_s=combine("delta_s", junction_ds),
+        E260=combine("E260", junction_e260),
+    )
+
+
+def _repeat(composition: _Composition, number: int) -> _Composition:
+    """
+    Combine the properties of a sequence into the properties of its `number` times repetition and return them.
+
+    The repetition is built by doubling, so it takes O(log(number)) concatenations.
+
+    :param composition: properties of the sequence
+    :param number: number of repetitions
+    """
+    result = _Composition(0, "", "", None, None, None, None, None)
+    while number > 0:
+        if number & 1:
+            result = _concatenate(result, composition)
+        number >>= 1
+        if number:
+            composition = _concatenate(composition, composition)
+    return result
+
+
+def melting_temperature_parameters(method: MeltingTemperature, salt: float) -> str:
+    """
+    Return the calculation parameters of a melting temperature method as a key of the shared results.
+
+    :param method: melting temperature calculation method
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    """
+    if method == MeltingTemperature.BASIC:
+        return ""
+    return repr(float(salt))
+
+
 class Primer:
     """
     The Primer class facilitates working with the primer sequence.
@@ -38,6 +159,29 @@ class Primer:
     >>> oprimer.molecular_weight
     """
 
+    __slots__ = (
+        "_sequence",
+        "_name",
+        "_salt_level",
+        "_computed",
+        "_diagnostics",
+        "_molecular_weight",
+        "_gc_content",
+        "_gc_clamp",
+        "_single_runs",
+        "_double_runs",
+        "_E260",
+        "_delta_s",
+        "_delta_h",
+        "_hairpin",
+        "_basic_melting_temperature",
+        "_salt_adjusted_melting_temperature",
+        "_nearest_neighbor_melting_temperature",
+        "_protein_aa1",
+        "_protein_aa3",
+        "_reverse_complement",
+    )
+
     def __init__(self, sequence: str, name: str = DEFAULT_PRIMER_NAME, salt: float = 50) -> None:
         """
         Initialize the Primer instance.
@@ -47,49 +191,64 @@ class Primer:
         :param salt: Sodium ion concentration in millimoles (unit mM)
         """
         self._sequence = Primer.validate_primer(sequence)
+        self._initialize(name, salt)
+
+    def _initialize(self, name: str, salt: float) -> None:
+        """
+        Initialize the attributes of the primer, other than its sequence.
+
+        :param name: primer name
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        self._diagnostics = length_diagnostic(len(self))
         self._name = name
+        self._salt_level = salt
+        # Track computed attributes as bit flags (see COMPUTED_FLAGS and MELTING_TEMPERATURE_FLAGS)
+        self._computed = 0
         self._molecular_weight = None
         self._gc_content = None
         self._gc_clamp = None
         self._single_runs = None
         self._double_runs = None
         self._E260 = None
-        self._salt_level = salt
-        self._melting_temperature = {
-            MeltingTemperature.BASIC: None,
-            MeltingTemperature.SALT_ADJUSTED: None,
-            MeltingTemperature.NEAREST_NEIGHBOR: None,
-        }
         self._delta_s = None
         self._delta_h = None
-        self._protein_seq = {"AA1": {}, "AA3": {}}
-
-        # Track computed attributes
-        self._computed = {
-            "molecular_weight": False,
-            "gc_content": False,
-            "gc_clamp": False,
-            "single_runs": False,
-            "double_runs": False,
-            "E260": False,
-            "melting_temperature": {
-                MeltingTemperature.BASIC: False,
-                MeltingTemperature.SALT_ADJUSTED: False,
-                MeltingTemperature.NEAREST_NEIGHBOR: False,
-            },
-            "delta_s": False,
-            "delta_h": False,
-        }
-
-    def is_computed(self, attr: str) -> bool:
+        self._hairpin = None
+        self._basic_melting_temperature = None
+        self._salt_adjusted_melting_temperature = None
+        self._nearest_neighbor_melting_temperature = None
+        # Translations of the 3 reading frames, allocated on the first `to_protein` call
+        self._protein_aa1 = None
+        self._protein_aa3 = None
+        self._reverse_complement = None
+
+    @classmethod
+    def _from_valid_sequence(cls, sequence: str, name: str = DEFAULT_PRIMER_NAME, salt: float = 50) -> Primer:
+        """
+        Build a primer from a sequence that is already valid and in uppercase, and return it.
+
+        The sequence is not validated again and its length condition is not reported.
+
+        :param sequence: primer nucleotides sequence
+        :param name: primer name
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        oprimer = cls.__new__(cls)
+        oprimer._sequence = sequence
+        oprimer._initialize(name, salt)
+        return oprimer
+
+    def is_computed(self, attr: str) -> Union[bool, Dict[MeltingTemperature, bool]]:
         """
         Check whether the given attribute has been computed. Return true if it has been previously computed.
 
         :param attr: The attribute to check.
         """
-        if attr not in self._computed:
+        if attr == "melting_temperature":
+            return {method: bool(self._computed & flag) for method, flag in MELTING_TEMPERATURE_FLAGS.items()}
+        if attr not in COMPUTED_FLAGS:
             raise OPRBaseError(PRIMER_ATTRIBUTE_NOT_COMPUTABLE_ERROR)
-        return self._computed.get(attr, False)
+        return bool(self._computed & COMPUTED_FLAGS[attr])
 
     def __len__(self):
         """Return the length of the Primer sequence."""
@@ -105,24 +264,69 @@ class Primer:
             return self._sequence == other_primer._sequence
         return False
 
+    def _composition(self) -> _Composition:
+        """Return the computed properties of the primer that can be combined across concatenations."""
+        computed = self._computed
+        return _Composition(
+            length=len(self._sequence),
+            first_base=self._sequence[:1],
+            last_base=self._sequence[-1:],
+            molecular_weight=self._molecular_weight if computed & COMPUTED_FLAGS["molecular_weight"] else None,
+            gc_count=round(self._gc_content * len(self._sequence)) if computed & COMPUTED_FLAGS["gc_content"] else None,
+            delta_h=self._delta_h if computed & COMPUTED_FLAGS["delta_h"] else None,
+            delta_s=self._delta_s if computed & COMPUTED_FLAGS["delta_s"] else None,
+            E260=self._E260 if computed & COMPUTED_FLAGS["E260"] else None,
+        )
+
+    def _set_composition(self, composition: _Composition) -> None:
+        """
+        Cache the combined properties of the primer sequence.
+
+        :param composition: properties of the primer sequence
+        """
+        if composition.molecular_weight is not None:
+            self._molecular_weight = composition.molecular_weight
+            self._computed |= COMPUTED_FLAGS["molecular_weight"]
+        if composition.gc_count is not None:
+            self._gc_content = composition.gc_count / composition.length
+            self._diagnostics |= gc_content_diagnostic(self._gc_content)
+            self._computed |= COMPUTED_FLAGS["gc_content"]
+        if composition.delta_h is not None and composition.delta_s is not None:
+            self._delta_h = composition.delta_h
+            self._delta_s = composition.delta_s
+            self._computed |= COMPUTED_FLAGS["delta_h"] | COMPUTED_FLAGS["delta_s"]
+        if composition.E260 is not None:
+            self._E260 = composition.E260
+            self._computed |= COMPUTED_FLAGS["E260"]
+
     def __add__(self, other_primer: Primer) -> Primer:
         """
         Concatenate the sequences of the current Primer with another one and return a new Primer.
 
+        The molecular weight, GC content, ΔH, ΔS and E260 computed for both primers are combined into the new Primer.
+
         :param other_primer: another Primer to concat its sequence to the current Primer
         """
         if isinstance(other_primer, Primer):
-            return Primer(self._sequence + other_primer._sequence)
+            oprimer = Primer._from_valid_sequence(self._sequence + other_primer._sequence)
+            report_diagnostic(length_diagnostic(len(oprimer._sequence)))
+            oprimer._set_composition(_concatenate(self._composition(), other_primer._composition()))
+            return oprimer
         raise OPRBaseError(PRIMER_ADDITION_ERROR)
 
     def __mul__(self, number: int) -> Primer:
         """
         Multiply the Primer sequence `number` times and return a new Primer.
 
+        The molecular weight, GC content, ΔH, ΔS and E260 computed for the primer are combined into the new Primer.
+
         :param number: times to concat the Primer sequence to itself
         """
         if isinstance(number, int):
-            return Primer(self._sequence * number)
+            oprimer = Primer._from_valid_sequence(self._sequence * number)
+            report_diagnostic(length_diagnostic(len(oprimer._sequence)))
+            oprimer._set_composition(_repeat(self._composition(), number))
+            return oprimer
         raise OPRBaseError(PRIMER_MULTIPLICATION_ERROR)
 
     def __contains__(self, sequence: Union[str, Primer]) -> bool:
@@ -145,6 +349,15 @@ class Primer:
         """Iterate through the primer sequence."""
         yield from self.sequence
 
+    def _replace_sequence(self, sequence: str) -> None:
+        """
+        Replace the sequence of the primer in place and reset its computed attributes.
+
+        :param sequence: new primer nucleotides sequence, already valid and in uppercase
+        """
+        self._sequence = sequence
+        self._initialize(self._name, self._salt_level)
+
     def reverse(self, inplace: bool = False) -> Optional[Primer]:
         """
         Reverse the sequence.
@@ -153,7 +366,7 @@ class Primer:
         """
         new_sequence = self._sequence[::-1]
         if inplace:
-            self._sequence = new_sequence
+            self._replace_sequence(new_sequence)
         else:
             return Primer(sequence=new_sequence)
 
@@ -163,14 +376,41 @@ class Primer:
 
         :param inplace: inplace flag
         """
-        new_sequence = ""
-        for item in self._sequence:
-            new_sequence += DNA_COMPLEMENT_MAP[item]
+        new_sequence = complement_calc(self._sequence)
         if inplace:
-            self._sequence = new_sequence
+            self._replace_sequence(new_sequence)
         else:
             return Primer(sequence=new_sequence)
 
+    def reverse_complement(self, inplace: bool = False) -> Optional[Primer]:
+        """
+        Reverse complement sequence.
+
+        The reverse complement sequence is cached, so repeated calls do not translate the sequence again.
+
+        :param inplace: inplace flag
+        """
+        if self._reverse_complement is None:
+            self._reverse_complement = reverse_complement_calc(self._sequence)
+        new_sequence = self._reverse_complement
+        if inplace:
+            sequence = self._sequence
+            self._replace_sequence(new_sequence)
+            self._reverse_complement = sequence
+        else:
+            return Primer(sequence=new_sequence)
+
+    def variants(self, indels: bool = False) -> Generator[Variant, None, None]:
+        """
+        Generate the single-base variants of the primer with their properties and return them.
+
+        Each variant's ΔH, ΔS, nearest neighbor melting temperature, GC content and molecular weight are derived from
+        the primer by updating only the dinucleotides and base counts around the mutation.
+
+        :param indels: include insertions and deletions flag
+        """
+        return sequence_variants(self._sequence, self._salt_level, indels)
+
     def to_rna(self) -> str:
         """Convert DNA sequence to RNA."""
         return self._sequence.replace('T', 'U')
@@ -185,24 +425,16 @@ class Primer:
         if frame not in [1, 2, 3]:
             raise OPRBaseError(FRAME_ERROR)
 
-        key = "AA3" if multi_letter else "AA1"
-        if frame in self._protein_seq[key]:
-            return self._protein_seq[key][frame]
-
-        rna_sequence = self.to_rna()
-        start = frame - 1
-        protein_aa1 = []
-        protein_aa3 = []
-        for i in range(start, len(rna_sequence) - 2, 3):
-            codon = rna_sequence[i:i+3]
-            protein_aa1.append(CODONS_TO_AMINO_ACIDS_SHORT[codon])
-            protein_aa3.append(CODONS_TO_AMINO_ACIDS_LONG[codon])
-
-        self._protein_seq["AA1"][frame] = ''.join(protein_aa1)
-        self._protein_seq["AA3"][frame] = '-'.join(protein_aa3)
+        if self._protein_aa1 is None:
+            self._protein_aa1 = [None, None, None]
+            self._protein_aa3 = [None, None, None]
+        if self._protein_aa1[frame - 1] is None:
+            start = frame - 1
+            codons = self._sequence[start:start + (len(self._sequence) - start) // 3 * 3].encode("ascii")
+            self._protein_aa1[frame - 1] = translate_codons(codons)
+            self._protein_aa3[frame - 1] = multi_letter_protein(self._protein_aa1[frame - 1])
 
-        result = self._protein_seq["AA3"][frame] if multi_letter else self._protein_seq["AA1"][frame]
-        return result
+        return self._protein_aa3[frame - 1] if multi_letter else self._protein_aa1[frame - 1]
 
     @staticmethod
     def validate_primer(sequence: str) -> str:
@@ -215,13 +447,33 @@ class Primer:
             raise OPRBaseError(PRIMER_SEQUENCE_TYPE_ERROR)
         sequence = sequence.upper()
 
-        if len(sequence) < PRIMER_LOWER_LENGTH or len(sequence) > PRIMER_HIGHEST_LENGTH:
-            warn(PRIMER_SEQUENCE_LENGTH_WARNING, RuntimeWarning)
+        report_diagnostic(length_diagnostic(len(sequence)))
 
-        if not all(base in VALID_BASES for base in sequence):
+        if not is_valid_sequence(sequence):
             raise OPRBaseError(PRIMER_SEQUENCE_VALID_BASES_ERROR)
         return sequence
 
+    def _shared(self, name: str, parameters: str, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Calculate a property with the given function, through the property cache and store if they are enabled.
+
+        Results are shared by the property name, the sequence and the calculation parameters.
+
+        :param name: property name
+        :param parameters: calculation parameters
+        :param function: property calculation function
+        :param args: function arguments
+        """
+        def compute() -> Any:
+            return function(*args)
+        property_store = get_property_store()
+        if property_store is not None:
+            compute = functools.partial(property_store.get, name, self._sequence, parameters, compute)
+        property_cache = get_property_cache()
+        if property_cache is None:
+            return compute()
+        return property_cache.get((name, self._sequence, parameters), compute)
+
     @property
     def sequence(self) -> str:
         """Return the primer sequence."""
@@ -235,28 +487,38 @@ class Primer:
     @property
     def molecular_weight(self) -> float:
         """Calculate the molecular weight and return it."""
-        if not self._computed["molecular_weight"]:
-            self._molecular_weight = molecular_weight_calc(self._sequence)
-            self._computed["molecular_weight"] = True
+        if not self._computed & COMPUTED_FLAGS["molecular_weight"]:
+            self._molecular_weight = self._shared("molecular_weight", "", molecular_weight_calc, self._sequence)
+            self._computed |= COMPUTED_FLAGS["molecular_weight"]
         return self._molecular_weight
 
+    def _compute_gc_content(self) -> None:
+        """Calculate gc content and record its diagnostic, if it has not been computed."""
+        if not self._computed & COMPUTED_FLAGS["gc_content"]:
+            gc_count = self._sequence.count('G') + self._sequence.count('C')
+            self._gc_content = gc_count / len(self._sequence)
+            self._diagnostics |= gc_content_diagnostic(self._gc_content)
+            self._computed |= COMPUTED_FLAGS["gc_content"]
+
     @property
     def gc_content(self) -> float:
         """Calculate gc content and return it."""
-        if not self._computed["gc_content"]:
-            gc_count = self._sequence.count('G') + self._sequence.count('C')
-            self._gc_content = gc_count / len(self._sequence)
-            self._computed["gc_content"] = True
-        if self._gc_content < PRIMER_LOWEST_GC_RANGE or self._gc_content > PRIMER_HIGHEST_GC_RANGE:
-            warn(PRIMER_SEQUENCE_VALID_GC_CONTENT_RANGE_WARNING, RuntimeWarning)
+        self._compute_gc_content()
+        report_diagnostic(self._diagnostics & Diagnostic.GC_CONTENT_OUT_OF_RANGE)
         return self._gc_content
 
+    @property
+    def diagnostics(self) -> Diagnostic:
+        """Return the conditions found in the primer (length and GC content out of range) as Diagnostic flags."""
+        self._compute_gc_content()
+        return self._diagnostics
+
     @property
     def gc_clamp(self) -> int:
         """Calculate GC clamp of the primer and return it."""
-        if not self._computed["gc_clamp"]:
+        if not self._computed & COMPUTED_FLAGS["gc_clamp"]:
             self._gc_clamp = gc_clamp_calc(self._sequence)
-            self._computed["gc_clamp"] = True
+            self._computed |= COMPUTED_FLAGS["gc_clamp"]
         return self._gc_clamp
 
     @property
@@ -266,11 +528,9 @@ class Primer:
 
         Run length refers to how many times a single base is repeated consecutively in the primer.
         """
-        if not self._computed["single_runs"]:
-            self._single_runs = {}
-            for base in VALID_BASES:
-                self._single_runs[base] = self.repeats(base, consecutive=True)
-            self._computed["single_runs"] = True
+        if not self._computed & COMPUTED_FLAGS["single_runs"]:
+            self._single_runs = max_runs_calc(self._sequence, unit_length=1)
+            self._computed |= COMPUTED_FLAGS["single_runs"]
         return self._single_runs
 
     @property
@@ -280,41 +540,88 @@ class Primer:
 
         It refers to how many times each 2-base pairs occurs consecutively in the primer.
         """
-        if not self._computed["double_runs"]:
-            pairs = [''.join(pair) for pair in itertools.product(VALID_BASES, repeat=2) if pair[0] != pair[1]]
-            counts = {}
-            for pair in pairs:
-                counts[pair] = self.repeats(pair, consecutive=True)
-            self._double_runs = counts
-            self._computed["double_runs"] = True
+        if not self._computed & COMPUTED_FLAGS["double_runs"]:
+            self._double_runs = max_runs_calc(self._sequence, unit_length=2)
+            self._computed |= COMPUTED_FLAGS["double_runs"]
         return self._double_runs
 
     @property
     def E260(self) -> float:
         """Calculate the extinction coefficient at 260 nm and return it."""
-        if not self._computed["E260"]:
-            self._E260 = e260_ssnn_calc(self._sequence)
-            self._computed["E260"] = True
+        if not self._computed & COMPUTED_FLAGS["E260"]:
+            self._E260 = self._shared("E260", "", e260_ssnn_calc, self._sequence)
+            self._computed |= COMPUTED_FLAGS["E260"]
         return self._E260
 
     @property
     def delta_s(self) -> float:
         """Calculate entropy change, ΔS (in kcal/mol·K), and return it."""
-        if not self._computed["delta_s"]:
-            self._delta_h , self._delta_s = calculate_thermodynamics_constants(self._sequence)
-            self._computed["delta_s"] = True
-            self._computed["delta_h"] = True
+        if not self._computed & COMPUTED_FLAGS["delta_s"]:
+            self._delta_h, self._delta_s = self._shared(
+                "thermodynamics_constants", "", calculate_thermodynamics_constants, self._sequence)
+            self._computed |= COMPUTED_FLAGS["delta_s"] | COMPUTED_FLAGS["delta_h"]
         return self._delta_s
 
     @property
     def delta_h(self) -> float:
         """Calculate enthalpy change, ΔH (in kcal/mol), and return it."""
-        if not self._computed["delta_h"]:
-            self._delta_h , self._delta_s = calculate_thermodynamics_constants(self._sequence)
-            self._computed["delta_s"] = True
-            self._computed["delta_h"] = True
+        if not self._computed & COMPUTED_FLAGS["delta_h"]:
+            self._delta_h, self._delta_s = self._shared(
+                "thermodynamics_constants", "", calculate_thermodynamics_constants, self._sequence)
+            self._computed |= COMPUTED_FLAGS["delta_s"] | COMPUTED_FLAGS["delta_h"]
         return self._delta_h
 
+    def profile(self, hairpin: bool = False) -> Dict[str, Any]:
+        """
+        Calculate all properties of the primer, cache them and return them.
+
+        Base counts, thermodynamic constants, E260, GC clamp and runs are calculated in a single pass over the
+        sequence. Properties that have already been computed are kept as they are. The hairpin takes O(L²) time, so
+        it is only included on request.
+
+        :param hairpin: include the hairpin flag
+        """
+        if self._computed & PROFILE_COMPUTED_FLAGS != PROFILE_COMPUTED_FLAGS:
+            profile = primer_profile_calc(self._sequence)
+            base_counts = profile["base_counts"]
+            a_count, t_count, c_count, g_count = (base_counts[base] for base in "ATCG")
+            profile["molecular_weight"] = molecular_weight_from_counts(a_count, t_count, c_count, g_count)
+            profile["gc_content"] = (g_count + c_count) / len(self._sequence)
+            for attr, flag in COMPUTED_FLAGS.items():
+                if attr != "hairpin" and not self._computed & flag:
+                    setattr(self, "_" + attr, profile[attr])
+                    self._computed |= flag
+            self._diagnostics |= gc_content_diagnostic(self._gc_content)
+            melting_temperatures = {
+                MeltingTemperature.BASIC: basic_melting_temperature_from_counts(
+                    a_count, t_count, c_count, g_count),
+                MeltingTemperature.SALT_ADJUSTED: salt_adjusted_melting_temperature_from_counts(
+                    a_count, t_count, c_count, g_count, self._salt_level),
+                MeltingTemperature.NEAREST_NEIGHBOR: nearest_neighbor_melting_temperature_calc(
+                    self._sequence, self._salt_level, (self._delta_h, self._delta_s)),
+            }
+            for method, flag in MELTING_TEMPERATURE_FLAGS.items():
+                if not self._computed & flag:
+                    setattr(self, MELTING_TEMPERATURE_SLOTS[method], melting_temperatures[method])
+                    self._computed |= flag
+        report_diagnostic(self._diagnostics & Diagnostic.GC_CONTENT_OUT_OF_RANGE)
+        result = {attr: getattr(self, "_" + attr) for attr in COMPUTED_FLAGS if attr != "hairpin"}
+        if hairpin:
+            result["hairpin"] = self.hairpin
+        result["melting_temperature"] = {
+            method: getattr(self, MELTING_TEMPERATURE_SLOTS[method]) for method in MeltingTemperature}
+        return result
+
+    @property
+    def hairpin(self) -> Optional[Hairpin]:
+        """Predict the most stable hairpin (stem-loop) of the primer and return it, or None if no hairpin is stable."""
+        if not self._computed & COMPUTED_FLAGS["hairpin"]:
+            hairpin = self._shared("hairpin", "", hairpin_calc, self._sequence)
+            # the property store returns the hairpin as a plain tuple
+            self._hairpin = Hairpin(*hairpin) if hairpin is not None else None
+            self._computed |= COMPUTED_FLAGS["hairpin"]
+        return self._hairpin
+
     def repeats(self, sequence: str, consecutive: bool = False) -> int:
         """
         Count occurrences of a subsequence in a given sequence and return it.
@@ -336,22 +643,90 @@ class Primer:
 
         :param method: requested calculation mode for melting temperature
         """
-        if method not in self._computed["melting_temperature"]:
+        if method not in MELTING_TEMPERATURE_FLAGS:
             raise NotImplementedError(PRIMER_MELTING_TEMPERATURE_NOT_IMPLEMENTED_ERROR)
-        if self._computed["melting_temperature"][method]:
-            return self._melting_temperature[method]
+        if self._computed & MELTING_TEMPERATURE_FLAGS[method]:
+            return getattr(self, MELTING_TEMPERATURE_SLOTS[method])
 
+        name = MELTING_TEMPERATURE_SLOTS[method][1:]
+        parameters = melting_temperature_parameters(method, self._salt_level)
         if method == MeltingTemperature.BASIC:
-            self._melting_temperature[MeltingTemperature.BASIC] = basic_melting_temperature_calc(self._sequence)
+            melting_temperature = self._shared(name, parameters, basic_melting_temperature_calc, self._sequence)
         elif method == MeltingTemperature.SALT_ADJUSTED:
-            self._melting_temperature[MeltingTemperature.SALT_ADJUSTED] = salt_adjusted_melting_temperature_calc(
-                self._sequence, self._salt_level)
+            melting_temperature = self._shared(
+                name, parameters, salt_adjusted_melting_temperature_calc, self._sequence, self._salt_level)
         else:
             # the method is MeltingTemperature.NEAREST_NEIGHBOR
-            self._melting_temperature[MeltingTemperature.NEAREST_NEIGHBOR] = nearest_neighbor_melting_temperature_calc(
+            melting_temperature = self._shared(
+                name,
+                parameters,
+                nearest_neighbor_melting_temperature_calc,
                 self._sequence,
                 self._salt_level,
                 (self.delta_h, self.delta_s)
                 )
-        self._computed["melting_temperature"][method] = True
-        return self._melting_temperature[method]
+        setattr(self, MELTING_TEMPERATURE_SLOTS[method], melting_temperature)
+        self._computed |= MELTING_TEMPERATURE_FLAGS[method]
+        return melting_temperature
+
+
+class FrozenPrimer(Primer):
+    """
+    The FrozenPrimer class is an immutable Primer that can be used as a dict key or a set member.
+
+    Its hash is the hash of its sequence, computed once, so a FrozenPrimer is equal to any Primer with the same
+    sequence and hashes like the other FrozenPrimer objects with that sequence.
+
+    >>> oprimer = FrozenPrimer("ATCGATCGATCGATCGAT")
+    >>> {oprimer: oprimer.molecular_weight}
+    """
+
+    __slots__ = ("_hash",)
+
+    def _initialize(self, name: str, salt: float) -> None:
+        """
+        Initialize the attributes of the primer, other than its sequence, and compute its hash.
+
+        :param name: primer name
+        :param salt: Sodium ion concentration in millimoles (unit mM)
+        """
+        super()._initialize(name, salt)
+        self._hash = hash(self._sequence)
+
+    def __hash__(self) -> int:
+        """Return the hash of the primer sequence."""
+        return self._hash
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, str, float]]:
+        """Pickle the primer by its sequence, name and salt, so its hash is computed again in the new process."""
+        return FrozenPrimer, (self._sequence, self._name, self._salt_level)
+
+    def reverse(self, inplace: bool = False) -> Optional[Primer]:
+        """
+        Reverse the sequence.
+
+        :param inplace: inplace flag, not supported
+        """
+        if inplace:
+            raise OPRBaseError(FROZEN_PRIMER_INPLACE_ERROR)
+        return super().reverse()
+
+    def complement(self, inplace: bool = False) -> Optional[Primer]:
+        """
+        Complement sequence.
+
+        :param inplace: inplace flag, not supported
+        """
+        if inplace:
+            raise OPRBaseError(FROZEN_PRIMER_INPLACE_ERROR)
+        return super().complement()
+
+    def reverse_complement(self, inplace: bool = False) -> Optional[Primer]:
+        """
+        Reverse complement sequence.
+
+        :param inplace: inplace flag, not supported
+        """
+        if inplace:
+            raise OPRBaseError(FROZEN_PRIMER_INPLACE_ERROR)
+        return super().reverse_complement()
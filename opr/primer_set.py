@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""OPR multi-primer search."""
+from typing import Union, Iterable, Iterator, List, NamedTuple
+from collections import deque
+from .errors import OPRBaseError
+from .primer import Primer, FrozenPrimer
+from .functions import reverse_complement_calc
+from .params import PRIMER_SET_PRIMER_TYPE_ERROR, PRIMER_SET_EMPTY_PRIMER_ERROR, PRIMER_SET_SEQUENCE_TYPE_ERROR
+
+# Bases are encoded as A=0, C=1, G=2, T=3 and any other byte as 4, which leads back to the automaton root
+PRIMER_SET_ALPHABET_SIZE = 5
+PRIMER_SET_BASE_CODES = bytes({"A": 0, "C": 1, "G": 2, "T": 3}.get(chr(byte).upper(), 4) for byte in range(256))
+
+
+class PrimerOccurrence(NamedTuple):
+    """
+    Occurrence of a primer in a sequence.
+
+    `position` is the 0-based start of the occurrence. The primer occurs on the "+" strand if its sequence is found,
+    and on the "-" strand if its reverse complement is.
+    """
+
+    primer: FrozenPrimer
+    position: int
+    strand: str
+
+
+class PrimerSet:
+    """
+    The PrimerSet class is an immutable set of primers compiled into an Aho-Corasick automaton.
+
+    The automaton matches the primers and their reverse complements, so all their occurrences in a sequence are found
+    in a single pass. Primers are stored as FrozenPrimer objects, one per sequence.
+
+    >>> oprimer_set = PrimerSet([Primer("CTGGAGGACGGAAGAGGAAGTAA"), Primer("GACTCAACTGCCTCCTTCTGCTA")])
+    >>> oprimer_set.find(template)
+    """
+
+    def __init__(self, primers: Iterable[Primer] = (), reverse_complements: bool = True) -> None:
+        """
+        Initialize the PrimerSet instance.
+
+        :param primers: primers
+        :param reverse_complements: match the reverse complements of the primers flag
+        """
+        self._primers = {}
+        for primer in primers:
+            if not isinstance(primer, Primer):
+                raise OPRBaseError(PRIMER_SET_PRIMER_TYPE_ERROR)
+            if not len(primer):
+                raise OPRBaseError(PRIMER_SET_EMPTY_PRIMER_ERROR)
+            if primer.sequence not in self._primers:
+                if not isinstance(primer, FrozenPrimer):
+                    primer = FrozenPrimer(primer.sequence, primer.name, primer._salt_level)
+                self._primers[primer.sequence] = primer
+        self._reverse_complements = reverse_complements
+        self._compile()
+
+    def _compile(self) -> None:
+        """
+        Build the automaton as a transition table over all states and find the occurrences that end in each state.
+
+        States are numbered in steps of PRIMER_SET_ALPHABET_SIZE, so the transition of a state on a base code is at
+        index state + code. Failure links are folded into the table breadth-first, so matching never backtracks.
+        """
+        size = PRIMER_SET_ALPHABET_SIZE
+        transitions = [0] * size
+        outputs = [()]
+        for primer in self._primers.values():
+            patterns = [(primer.sequence, "+")]
+            reverse_complement = reverse_complement_calc(primer.sequence)
+            if self._reverse_complements and reverse_complement != primer.sequence:
+                patterns.append((reverse_complement, "-"))
+            for pattern, strand in patterns:
+                state = 0
+                for code in pattern.encode("ascii").translate(PRIMER_SET_BASE_CODES):
+                    if not transitions[state + code]:
+                        transitions[state + code] = len(transitions)
+                        transitions.extend([0] * size)
+                        outputs.append(())
+                    state = transitions[state + code]
+                outputs[state // size] += ((primer, len(pattern) - 1, strand),)
+        failures = [0] * len(outputs)
+        queue = deque(state for state in transitions[:size] if state)
+        while queue:
+            state = queue.popleft()
+            failure = failures[state // size]
+            outputs[state // size] += outputs[failure // size]
+            for code in range(size):
+                child = transitions[state + code]
+                if child:
+                    failures[child // size] = transitions[failure + code]
+                    queue.append(child)
+                else:
+                    transitions[state + code] = transitions[failure + code]
+        self._transitions = transitions
+        self._order = {primer: index for index, primer in enumerate(self._primers.values())}
+        # occurrences are looked up by the state number as well, so matching does not divide it
+        self._outputs = [()] * len(transitions)
+        for node, output in enumerate(outputs):
+            self._outputs[node * size] = output
+
+    def find(self, sequence: str) -> List[PrimerOccurrence]:
+        """
+        Find all occurrences of the primers in a sequence and return them ordered by position.
+
+        Occurrences at the same position are ordered as the primers were given, "+" strand first.
+
+        :param sequence: nucleotides sequence
+        """
+        if not isinstance(sequence, str):
+            raise OPRBaseError(PRIMER_SET_SEQUENCE_TYPE_ERROR)
+        transitions = self._transitions
+        outputs = self._outputs
+        found = []
+        state = 0
+        for position, code in enumerate(sequence.encode("ascii", "replace").translate(PRIMER_SET_BASE_CODES)):
+            state = transitions[state + code]
+            output = outputs[state]
+            if output:
+                for primer, offset, strand in output:
+                    found.append(PrimerOccurrence(primer, position - offset, strand))
+        order = self._order
+        found.sort(key=lambda occurrence: (occurrence.position, order[occurrence.primer], occurrence.strand))
+        return found
+
+    @property
+    def reverse_complements(self) -> bool:
+        """Return the reverse complements matching flag."""
+        return self._reverse_complements
+
+    def __len__(self) -> int:
+        """Return the number of primers."""
+        return len(self._primers)
+
+    def __iter__(self) -> Iterator[FrozenPrimer]:
+        """Iterate through the primers."""
+        return iter(self._primers.values())
+
+    def __contains__(self, primer: Union[str, Primer]) -> bool:
+        """
+        Check if a primer (or a sequence) is in the set.
+
+        :param primer: primer or sequence
+        """
+        if isinstance(primer, Primer):
+            return primer.sequence in self._primers
+        if isinstance(primer, str):
+            return primer.upper() in self._primers
+        return False
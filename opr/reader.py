@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""OPR sequence reader."""
+from typing import Union, Generator, Iterator, Optional, Tuple, TextIO
+from enum import Enum
+import os
+import gzip
+import itertools
+from .errors import OPRBaseError
+from .primer import Primer
+from .batch import PrimerBatch
+from .params import DEFAULT_PRIMER_NAME, GZIP_MAGIC_NUMBER
+from .params import READER_FORMAT_ERROR, READER_FASTA_RECORD_ERROR, READER_FASTQ_RECORD_ERROR, READER_BATCH_SIZE_ERROR
+
+
+class SequenceFormat(Enum):
+    """Format of a sequence file."""
+
+    FASTA = 1
+    FASTQ = 2
+    PLAIN = 3
+
+
+def open_sequence_file(path: Union[str, os.PathLike]) -> TextIO:
+    """
+    Open a plain or gzip-compressed sequence file in text mode and return it.
+
+    :param path: sequence file path
+    """
+    with open(path, "rb") as file:
+        magic_number = file.read(len(GZIP_MAGIC_NUMBER))
+    if magic_number == GZIP_MAGIC_NUMBER:
+        return gzip.open(path, "rt")
+    return open(path, "r")
+
+
+def _read_fasta(lines: Iterator[str]) -> Generator[Tuple[str, str], None, None]:
+    """
+    Parse FASTA lines and yield (name, sequence) records.
+
+    :param lines: FASTA lines
+    """
+    name = None
+    chunks = []
+    for line in lines:
+        if line.startswith(">"):
+            if name is not None:
+                yield name, "".join(chunks)
+            name = line[1:].strip()
+            chunks = []
+        elif name is None:
+            raise OPRBaseError(READER_FASTA_RECORD_ERROR)
+        else:
+            chunks.append(line)
+    if name is not None:
+        yield name, "".join(chunks)
+
+
+def _read_fastq(lines: Iterator[str]) -> Generator[Tuple[str, str], None, None]:
+    """
+    Parse FASTQ lines and yield (name, sequence) records.
+
+    :param lines: FASTQ lines
+    """
+    for header in lines:
+        # blank lines are only skipped between records, the lines of a record are read as they are
+        if not header:
+            continue
+        record = [header] + list(itertools.islice(lines, 3))
+        if len(record) != 4 or not record[0].startswith("@") or not record[2].startswith("+") or \
+                len(record[1]) != len(record[3]):
+            raise OPRBaseError(READER_FASTQ_RECORD_ERROR)
+        yield record[0][1:].strip(), record[1]
+
+
+def _read_plain(lines: Iterator[str]) -> Generator[Tuple[str, str], None, None]:
+    """
+    Parse one-sequence-per-line lines and yield (name, sequence) records.
+
+    :param lines: plain lines
+    """
+    for line in lines:
+        yield DEFAULT_PRIMER_NAME, line
+
+
+def read_records(source: Union[str, os.PathLike, TextIO],
+                 file_format: Optional[SequenceFormat] = None) -> Generator[Tuple[str, str], None, None]:
+    """
+    Read a FASTA, FASTQ or plain sequence file lazily and yield (name, sequence) records.
+
+    :param source: sequence file path (plain or gzip-compressed) or an open text file
+    :param file_format: sequence file format, detected from the first line if None
+    """
+    if file_format is not None and not isinstance(file_format, SequenceFormat):
+        raise OPRBaseError(READER_FORMAT_ERROR)
+    # any object with a `read` method is used as an open text file and iterated by lines
+    if hasattr(source, "read"):
+        file = source
+    else:
+        file = open_sequence_file(source)
+    try:
+        lines = (line.strip() for line in file)
+        first_line = next((line for line in lines if line), None)
+        if first_line is None:
+            return
+        if file_format is None:
+            if first_line.startswith(">"):
+                file_format = SequenceFormat.FASTA
+            elif first_line.startswith("@"):
+                file_format = SequenceFormat.FASTQ
+            else:
+                file_format = SequenceFormat.PLAIN
+        if file_format is not SequenceFormat.FASTQ:
+            lines = (line for line in lines if line)
+        lines = itertools.chain([first_line], lines)
+        parsers = {
+            SequenceFormat.FASTA: _read_fasta,
+            SequenceFormat.FASTQ: _read_fastq,
+            SequenceFormat.PLAIN: _read_plain,
+        }
+        yield from parsers[file_format](lines)
+    finally:
+        if file is not source:
+            file.close()
+
+
+def read_primers(
+        source: Union[str, os.PathLike, TextIO], file_format: Optional[SequenceFormat] = None, salt: float = 50,
+        batch_size: Optional[int] = None) -> Generator[Union[Primer, PrimerBatch], None, None]:
+    """
+    Read a FASTA, FASTQ or plain sequence file lazily and yield Primer objects or PrimerBatch chunks.
+
+    :param source: sequence file path (plain or gzip-compressed) or an open text file
+    :param file_format: sequence file format, detected from the first line if None
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    :param batch_size: number of primers in each yielded PrimerBatch, Primer objects are yielded if None
+    """
+    if batch_size is not None and (not isinstance(batch_size, int) or batch_size < 1):
+        raise OPRBaseError(READER_BATCH_SIZE_ERROR)
+    records = read_records(source, file_format)
+    if batch_size is None:
+        for name, sequence in records:
+            yield Primer(sequence, name, salt)
+        return
+    while True:
+        chunk = list(itertools.islice(records, batch_size))
+        if not chunk:
+            return
+        names, sequences = zip(*chunk)
+        yield PrimerBatch(sequences, names, salt)
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""OPR template scanner."""
+from typing import Callable, Generator, Optional, Union, List, NamedTuple, Any
+import heapq
+import itertools
+from .errors import OPRBaseError
+from .params import SCANNER_TEMPLATE_TYPE_ERROR, SCANNER_LENGTH_ERROR, SCANNER_TOP_K_ERROR
+from .functions import DELTA_H_SCALE, DELTA_S_SCALE, E260_SCALE, NN_SCALED_PARAMS
+from .functions import NN53_SCALED_EXTINCTION_COEFFICIENTS, BASE_SCALED_EXTINCTION_COEFFICIENTS
+from .functions import basic_melting_temperature_from_counts, salt_adjusted_melting_temperature_from_counts
+from .functions import nearest_neighbor_melting_temperature_calc
+
+BASE_INDEX = {"A": 0, "T": 1, "C": 2, "G": 3}
+
+
+class Window(NamedTuple):
+    """Properties of a template window."""
+
+    start: int
+    sequence: str
+    gc_content: float
+    gc_clamp: int
+    basic_melting_temperature: float
+    salt_adjusted_melting_temperature: float
+    nearest_neighbor_melting_temperature: float
+    delta_h: float
+    delta_s: float
+    E260: float
+
+
+class _WindowState:
+    """Rolling sums of a fixed-length window."""
+
+    __slots__ = ("length", "counts", "invalid", "delta_h", "delta_s", "e260_pairs", "e260_bases", "gc_clamp")
+
+    def __init__(self, length: int) -> None:
+        """
+        Initialize the _WindowState instance.
+
+        :param length: window length
+        """
+        self.length = length
+        self.counts = [0, 0, 0, 0]
+        self.invalid = 0
+        self.delta_h = 0
+        self.delta_s = 0
+        self.e260_pairs = 0
+        self.e260_bases = 0
+        self.gc_clamp = 0
+
+    def update_base(self, base: str, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) a base of the window.
+
+        :param base: base
+        :param sign: update sign
+        """
+        if base in BASE_INDEX:
+            self.counts[BASE_INDEX[base]] += sign
+        else:
+            self.invalid += sign
+
+    def update_pair(self, pair: str, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) a dinucleotide of the window.
+
+        :param pair: dinucleotide
+        :param sign: update sign
+        """
+        if pair in NN_SCALED_PARAMS:
+            dh, ds = NN_SCALED_PARAMS[pair]
+            self.delta_h += sign * dh
+            self.delta_s += sign * ds
+            self.e260_pairs += sign * NN53_SCALED_EXTINCTION_COEFFICIENTS[pair]
+
+    def update_interior_base(self, base: str, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) a base that is neither the first nor the last base of the window.
+
+        :param base: base
+        :param sign: update sign
+        """
+        self.e260_bases += sign * BASE_SCALED_EXTINCTION_COEFFICIENTS.get(base, 0)
+
+    def update_clamp_base(self, base: str, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) one of the last 5 bases of the window.
+
+        :param base: base
+        :param sign: update sign
+        """
+        if base == "G" or base == "C":
+            self.gc_clamp += sign
+
+
+def _window(template: str, start: int, state: _WindowState, salt: float) -> Window:
+    """
+    Build the window starting at the given position from its rolling sums and return it.
+
+    :param template: template sequence
+    :param start: window start position
+    :param state: window rolling sums
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    """
+    a_count, t_count, c_count, g_count = state.counts
+    delta_h = state.delta_h / DELTA_H_SCALE
+    delta_s = state.delta_s / DELTA_S_SCALE
+    sequence = template[start:start + state.length]
+    return Window(
+        start=start,
+        sequence=sequence,
+        gc_content=(g_count + c_count) / state.length,
+        gc_clamp=state.gc_clamp if state.length >= 5 else 0,
+        basic_melting_temperature=basic_melting_temperature_from_counts(a_count, t_count, c_count, g_count),
+        salt_adjusted_melting_temperature=salt_adjusted_melting_temperature_from_counts(
+            a_count, t_count, c_count, g_count, salt),
+        nearest_neighbor_melting_temperature=nearest_neighbor_melting_temperature_calc(
+            sequence, salt, (delta_h, delta_s)),
+        delta_h=delta_h,
+        delta_s=delta_s,
+        E260=(state.e260_pairs - state.e260_bases) / E260_SCALE,
+    )
+
+
+def _scan(template: str, min_length: int, max_length: int, salt: float) -> Generator[Window, None, None]:
+    """
+    Walk the template once and yield every window, ordered by start position and length.
+
+    :param template: template sequence
+    :param min_length: minimum window length
+    :param max_length: maximum window length
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    """
+    states = [_WindowState(length) for length in range(min_length, max_length + 1)]
+    for start in range(len(template) - min_length + 1):
+        for state in states:
+            length = state.length
+            end = start + length
+            if end > len(template):
+                break
+            if start == 0:
+                for index in range(length):
+                    state.update_base(template[index], 1)
+                    if index > 0:
+                        state.update_pair(template[index - 1:index + 1], 1)
+                    if 0 < index < length - 1:
+                        state.update_interior_base(template[index], 1)
+                    if index >= length - 5:
+                        state.update_clamp_base(template[index], 1)
+            else:
+                state.update_base(template[start - 1], -1)
+                state.update_base(template[end - 1], 1)
+                if length >= 2:
+                    state.update_pair(template[start - 1:start + 1], -1)
+                    state.update_pair(template[end - 2:end], 1)
+                if length >= 3:
+                    state.update_interior_base(template[start], -1)
+                    state.update_interior_base(template[end - 2], 1)
+                if start - 1 >= end - 6:
+                    state.update_clamp_base(template[start - 1], -1)
+                else:
+                    state.update_clamp_base(template[end - 6], -1)
+                state.update_clamp_base(template[end - 1], 1)
+            if state.invalid == 0:
+                yield _window(template, start, state, salt)
+
+
+def scan_windows(template: str, min_length: int = 18, max_length: int = 30, salt: float = 50,
+                 predicate: Optional[Callable[[Window], bool]] = None, top_k: Optional[int] = None,
+                 key: Optional[Callable[[Window], Any]] = None) -> Union[Generator[Window, None, None], List[Window]]:
+    """
+    Scan all windows of a template as primer candidates.
+
+    The template is walked once and the properties of each window are updated from the previous window of the same
+    length, so the cost per window does not depend on its length. Windows containing bases other than A, T, C and G
+    are skipped. If `top_k` is given, the `top_k` windows with the highest `key` are returned as a list (in
+    descending order), otherwise a generator of windows is returned.
+
+    :param template: template sequence
+    :param min_length: minimum window length
+    :param max_length: maximum window length
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    :param predicate: filter function, only windows for which it returns true are reported
+    :param top_k: number of the best windows to return
+    :param key: score function used to select the best windows
+    """
+    if not isinstance(template, str):
+        raise OPRBaseError(SCANNER_TEMPLATE_TYPE_ERROR)
+    if not isinstance(min_length, int) or not isinstance(max_length, int) or not 1 <= min_length <= max_length:
+        raise OPRBaseError(SCANNER_LENGTH_ERROR)
+    if top_k is not None and (not isinstance(top_k, int) or top_k < 1 or key is None):
+        raise OPRBaseError(SCANNER_TOP_K_ERROR)
+    windows = _scan(template.upper(), min_length, max_length, salt)
+    if predicate is not None:
+        windows = filter(predicate, windows)
+    if top_k is None:
+        return windows
+    heap = []
+    counter = itertools.count()
+    for window in windows:
+        item = (key(window), -next(counter), window)
+        if len(heap) < top_k:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+    return [window for _, _, window in sorted(heap, key=lambda item: item[:2], reverse=True)]
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""OPR persistent property store."""
+from __future__ import annotations
+from typing import Union, Callable, Iterable, Optional, Tuple, Dict, Any
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from . import params
+from .errors import OPRBaseError
+from .params import OPR_VERSION, PROPERTY_STORE_FORMULA_VERSION, PROPERTY_STORE_PARAMETERS
+from .params import PROPERTY_STORE_BATCH_SIZE, PROPERTY_STORE_TIMEOUT, PROPERTY_STORE_FILE_ERROR
+
+
+def property_store_version() -> str:
+    """
+    Calculate the version of the stored results and return it.
+
+    The version is a hash of OPR_VERSION, PROPERTY_STORE_FORMULA_VERSION and the scientific parameters listed in
+    PROPERTY_STORE_PARAMETERS, so a new release, a formula change or a parameter change invalidates the stored
+    results. Other settings, such as the batch size, timeout or cache sizes, do not change the results and are not
+    part of the version.
+    """
+    parameters = [(name, repr(getattr(params, name))) for name in PROPERTY_STORE_PARAMETERS]
+    version = (OPR_VERSION, PROPERTY_STORE_FORMULA_VERSION, parameters)
+    return hashlib.sha256(repr(version).encode("utf-8")).hexdigest()
+
+
+def _encode(value: Any) -> Union[int, float, str]:
+    """
+    Encode a value to be stored and return it, numbers are stored as they are and other values as JSON.
+
+    :param value: value
+    """
+    if isinstance(value, (int, float)):
+        return value
+    return json.dumps(value)
+
+
+def _decode(value: Union[int, float, str]) -> Any:
+    """
+    Decode a stored value and return it.
+
+    :param value: stored value
+    """
+    if not isinstance(value, str):
+        return value
+    value = json.loads(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class PropertyStore:
+    """
+    The PropertyStore class is a persistent sqlite store of primer properties.
+
+    Results are keyed by the property name, the sequence and the calculation parameters (such as salt). The store
+    records the version of the results and drops all of them when it is opened by a version with different
+    formulas or scientific parameters.
+
+    >>> ostore = open_property_store("properties.db")
+    >>> Primer("ATCGATCGATCGATCGAT").E260
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Open the PropertyStore instance.
+
+        :param path: store file path
+        """
+        self._path = os.fspath(path)
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self._path, timeout=PROPERTY_STORE_TIMEOUT, check_same_thread=False)
+        try:
+            with self._connection:
+                self._connection.execute("PRAGMA journal_mode=WAL")
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+                self._connection.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)")
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS properties (name TEXT, sequence TEXT, parameters TEXT, value, "
+                    "PRIMARY KEY (name, sequence, parameters)) WITHOUT ROWID")
+                row = self._connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+                version = property_store_version()
+                if row is None or row[0] != version:
+                    self._connection.execute("DELETE FROM properties")
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO metadata (key, value) VALUES ('version', ?)", (version,))
+        except sqlite3.DatabaseError:
+            self._connection.close()
+            raise OPRBaseError(PROPERTY_STORE_FILE_ERROR)
+
+    @property
+    def path(self) -> str:
+        """Return the store file path."""
+        return self._path
+
+    @property
+    def version(self) -> str:
+        """Return the version of the stored results."""
+        with self._lock:
+            return self._connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()[0]
+
+    def get(self, name: str, sequence: str, parameters: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the stored value of a property, or compute, store and return it.
+
+        :param name: property name
+        :param sequence: sequence
+        :param parameters: calculation parameters
+        :param compute: function computing the value
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM properties WHERE name = ? AND sequence = ? AND parameters = ?",
+                (name, sequence, parameters)).fetchone()
+        if row is not None:
+            return _decode(row[0])
+        value = compute()
+        self.put_many(name, parameters, [(sequence, value)])
+        return value
+
+    def get_many(self, name: str, parameters: str, sequences: Iterable[str]) -> Dict[str, Any]:
+        """
+        Return the stored values of a property for the given sequences as a dictionary, missing sequences are omitted.
+
+        :param name: property name
+        :param parameters: calculation parameters
+        :param sequences: sequences
+        """
+        result = {}
+        iterator = iter(sequences)
+        with self._lock:
+            while True:
+                chunk = list(itertools.islice(iterator, PROPERTY_STORE_BATCH_SIZE))
+                if not chunk:
+                    return result
+                query = "SELECT sequence, value FROM properties WHERE name = ? AND parameters = ? AND sequence IN ({0})"
+                rows = self._connection.execute(query.format(", ".join("?" * len(chunk))), [name, parameters] + chunk)
+                for sequence, value in rows:
+                    result[sequence] = _decode(value)
+
+    def put_many(self, name: str, parameters: str, items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Store the values of a property for many sequences.
+
+        :param name: property name
+        :param parameters: calculation parameters
+        :param items: (sequence, value) pairs
+        """
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO properties (name, sequence, parameters, value) VALUES (?, ?, ?, ?)",
+                ((name, sequence, parameters, _encode(value)) for sequence, value in items))
+
+    def clear(self) -> None:
+        """Remove all stored results."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM properties")
+
+    def close(self) -> None:
+        """Close the store file."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> PropertyStore:
+        """Enter the store context."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the store file at the end of the context."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored results."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM properties").fetchone()[0]
+
+
+_property_store = None
+
+
+def open_property_store(path: Union[str, os.PathLike]) -> PropertyStore:
+    """
+    Open a persistent property store, use it for all Primer and PrimerBatch calculations and return it.
+
+    A previously opened store is closed.
+
+    :param path: store file path
+    """
+    global _property_store
+    close_property_store()
+    _property_store = PropertyStore(path)
+    return _property_store
+
+
+def close_property_store() -> None:
+    """Close the persistent property store, if any, and stop using it."""
+    global _property_store
+    if _property_store is not None and _property_store._pid == os.getpid():
+        _property_store.close()
+    _property_store = None
+
+
+def get_property_store() -> Optional[PropertyStore]:
+    """
+    Return the persistent property store, or None if no store is open.
+
+    A forked process reopens the store of its parent, since sqlite connections can not be shared between processes.
+    """
+    global _property_store
+    if _property_store is not None and _property_store._pid != os.getpid():
+        _property_store = PropertyStore(_property_store.path)
+    return _property_store
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""OPR translation and ORF scanning."""
+from typing import Generator, Iterator, Dict, Tuple, NamedTuple
+from .errors import OPRBaseError
+from .params import CODONS_TO_AMINO_ACIDS_SHORT, CODONS_TO_AMINO_ACIDS_LONG, DNA_COMPLEMENT_BYTES_TABLE
+from .params import TRANSLATION_CHUNK_SIZE, TRANSLATION_SEQUENCE_TYPE_ERROR, TRANSLATION_SEQUENCE_VALID_BASES_ERROR
+from .params import TRANSLATION_FRAME_ERROR, ORF_MIN_LENGTH_ERROR, ORF_CHUNK_SIZE_ERROR
+from .functions import is_valid_buffer
+
+FRAMES = (1, 2, 3, -1, -2, -3)
+CODON_BASE_CODES = {"U": 0, "C": 1, "A": 2, "G": 3}
+# Codons are encoded as 6-bit integers (first base code << 4 | second << 2 | third). The bases of each codon position
+# are translated to their shifted codes directly, so the codes of all codons are combined with a few big integer ORs.
+CODON_POSITION_TABLES = tuple(
+    bytes.maketrans(b"TCAG", bytes(code << shift for code in range(4))) for shift in (4, 2, 0))
+CODON_AMINO_ACIDS_TABLE = bytes(
+    ord(CODONS_TO_AMINO_ACIDS_SHORT[codon]) for codon in sorted(
+        CODONS_TO_AMINO_ACIDS_SHORT, key=lambda codon: [CODON_BASE_CODES[base] for base in codon])
+).ljust(256, b"?")
+AMINO_ACIDS_LONG_TABLE = str.maketrans({
+    CODONS_TO_AMINO_ACIDS_SHORT[codon]: amino_acid + "-" for codon, amino_acid in CODONS_TO_AMINO_ACIDS_LONG.items()})
+
+
+class ORF(NamedTuple):
+    """
+    Open reading frame, from a start codon up to and including the first in-frame stop codon.
+
+    `start` and `end` are the 0-based coordinates of the ORF on the forward strand, for the reverse frames as well,
+    and `protein` is its translation in 1-letter codes without the stop codon.
+    """
+
+    frame: int
+    start: int
+    end: int
+    protein: str
+
+
+def _encode_sequence(sequence: str) -> bytes:
+    """
+    Validate the given sequence and return it as uppercase ASCII bytes.
+
+    :param sequence: nucleotides sequence
+    """
+    if not isinstance(sequence, str):
+        raise OPRBaseError(TRANSLATION_SEQUENCE_TYPE_ERROR)
+    encoded = sequence.upper().encode("ascii", "replace")
+    if not is_valid_buffer(encoded):
+        raise OPRBaseError(TRANSLATION_SEQUENCE_VALID_BASES_ERROR)
+    return encoded
+
+
+def translate_codons(codons: bytes) -> str:
+    """
+    Translate a sequence of whole codons into 1-letter amino acids and return the protein.
+
+    :param codons: uppercase ASCII nucleotides, of a length multiple of 3
+    """
+    first, second, third = CODON_POSITION_TABLES
+    codes = int.from_bytes(codons[0::3].translate(first), "big") | \
+        int.from_bytes(codons[1::3].translate(second), "big") | int.from_bytes(codons[2::3].translate(third), "big")
+    return codes.to_bytes(len(codons) // 3, "big").translate(CODON_AMINO_ACIDS_TABLE).decode("ascii")
+
+
+def multi_letter_protein(protein: str) -> str:
+    """
+    Convert a protein in 1-letter amino acid codes to 3-letter codes joined by dashes and return it.
+
+    :param protein: protein in 1-letter codes
+    """
+    return protein.translate(AMINO_ACIDS_LONG_TABLE)[:-1]
+
+
+def _frame_codons(strands: Tuple[bytes, bytes], frame: int) -> bytes:
+    """
+    Return the whole codons of a reading frame.
+
+    :param strands: forward and reverse complement strands
+    :param frame: reading frame
+    """
+    strand = strands[frame < 0]
+    start = abs(frame) - 1
+    return strand[start:start + (len(strand) - start) // 3 * 3]
+
+
+def translate_frame(sequence: str, frame: int = 1, multi_letter: bool = False) -> str:
+    """
+    Translate a reading frame of a sequence and return the protein.
+
+    Frames 1, 2 and 3 start from the first, second and third base of the sequence, and frames -1, -2 and -3 from the
+    first, second and third base of its reverse complement.
+
+    :param sequence: nucleotides sequence
+    :param frame: reading frame (1, 2, 3, -1, -2 or -3)
+    :param multi_letter: whether to return amino acids in 1-letter codes (False) or 3-letter codes (True)
+    """
+    if frame not in FRAMES:
+        raise OPRBaseError(TRANSLATION_FRAME_ERROR)
+    encoded = _encode_sequence(sequence)
+    reverse_complement = encoded[::-1].translate(DNA_COMPLEMENT_BYTES_TABLE) if frame < 0 else b""
+    protein = translate_codons(_frame_codons((encoded, reverse_complement), frame))
+    return multi_letter_protein(protein) if multi_letter else protein
+
+
+def six_frame_translation(sequence: str, multi_letter: bool = False) -> Dict[int, str]:
+    """
+    Translate the six reading frames of a sequence and return the proteins by frame.
+
+    :param sequence: nucleotides sequence
+    :param multi_letter: whether to return amino acids in 1-letter codes (False) or 3-letter codes (True)
+    """
+    encoded = _encode_sequence(sequence)
+    strands = (encoded, encoded[::-1].translate(DNA_COMPLEMENT_BYTES_TABLE))
+    proteins = {}
+    for frame in FRAMES:
+        protein = translate_codons(_frame_codons(strands, frame))
+        proteins[frame] = multi_letter_protein(protein) if multi_letter else protein
+    return proteins
+
+
+def _protein_chunks(codons: bytes, chunk_size: int) -> Iterator[Tuple[int, str]]:
+    """
+    Translate the codons chunk by chunk and yield the index of the first codon of each chunk with its protein.
+
+    :param codons: uppercase ASCII nucleotides, of a length multiple of 3
+    :param chunk_size: number of codons in each chunk
+    """
+    for start in range(0, len(codons), 3 * chunk_size):
+        yield start // 3, translate_codons(codons[start:start + 3 * chunk_size])
+
+
+def _frame_orfs(codons: bytes, min_length: int, chunk_size: int) -> Generator[Tuple[int, int, str], None, None]:
+    """
+    Find the ORFs of a reading frame and yield their first codon index, stop codon index and protein.
+
+    The ORF of a start codon extends to the first in-frame stop codon, and the start codons inside an ORF are part of
+    it, so ORFs never overlap within a frame. Unterminated ORFs are not reported.
+
+    :param codons: uppercase ASCII nucleotides of the frame, of a length multiple of 3
+    :param min_length: minimum ORF length in codons, excluding the stop codon
+    :param chunk_size: number of codons translated at once
+    """
+    orf_start = None
+    parts = []
+    for offset, protein in _protein_chunks(codons, chunk_size):
+        position = 0
+        while True:
+            if orf_start is None:
+                position = protein.find("M", position)
+                if position == -1:
+                    break
+                orf_start = offset + position
+            stop = protein.find("*", position)
+            if stop == -1:
+                parts.append(protein[position:])
+                break
+            if offset + stop - orf_start >= min_length:
+                parts.append(protein[position:stop])
+                yield orf_start, offset + stop, "".join(parts)
+            orf_start = None
+            parts = []
+            position = stop + 1
+
+
+def _orfs(encoded: bytes, min_length: int, chunk_size: int) -> Generator[ORF, None, None]:
+    """
+    Scan the six reading frames of an encoded sequence for ORFs and yield them.
+
+    :param encoded: uppercase ASCII nucleotides
+    :param min_length: minimum ORF length in codons, excluding the stop codon
+    :param chunk_size: number of codons translated at once
+    """
+    size = len(encoded)
+    strands = (encoded, encoded[::-1].translate(DNA_COMPLEMENT_BYTES_TABLE))
+    for frame in FRAMES:
+        offset = abs(frame) - 1
+        for first_codon, stop_codon, protein in _frame_orfs(_frame_codons(strands, frame), min_length, chunk_size):
+            start = offset + 3 * first_codon
+            end = offset + 3 * stop_codon + 3
+            if frame < 0:
+                start, end = size - end, size - start
+            yield ORF(frame, start, end, protein)
+
+
+def find_orfs(sequence: str, min_length: int = 30,
+              chunk_size: int = TRANSLATION_CHUNK_SIZE) -> Generator[ORF, None, None]:
+    """
+    Scan the six reading frames of a sequence for ORFs starting with ATG and return a generator of them.
+
+    The frames are translated `chunk_size` codons at a time, and the ORFs are yielded frame by frame (1, 2, 3, -1, -2,
+    -3) in the order they are found.
+
+    :param sequence: nucleotides sequence
+    :param min_length: minimum ORF length in codons, excluding the stop codon
+    :param chunk_size: number of codons translated at once
+    """
+    if not isinstance(min_length, int) or min_length < 1:
+        raise OPRBaseError(ORF_MIN_LENGTH_ERROR)
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise OPRBaseError(ORF_CHUNK_SIZE_ERROR)
+    return _orfs(_encode_sequence(sequence), min_length, chunk_size)
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""OPR mutation scanning."""
+from typing import Generator, List, Tuple, NamedTuple
+from enum import Enum
+from .functions import molecular_weight_from_counts, nearest_neighbor_melting_temperature_calc
+from .functions import NN_SCALED_PARAMS, DELTA_H_SCALE, DELTA_S_SCALE
+from .scanner import BASE_INDEX
+
+
+class Mutation(Enum):
+    """Type of a single-base primer variant."""
+
+    SUBSTITUTION = 1
+    INSERTION = 2
+    DELETION = 3
+
+
+class Variant(NamedTuple):
+    """
+    Single-base variant of a primer and its properties.
+
+    `position` is the 0-based position of the substituted or deleted base, or the position the base is inserted
+    before. `reference` is the original base (empty for insertions) and `alternative` the new one (empty for
+    deletions).
+    """
+
+    mutation: Mutation
+    position: int
+    reference: str
+    alternative: str
+    sequence: str
+    delta_h: float
+    delta_s: float
+    nearest_neighbor_melting_temperature: float
+    gc_content: float
+    molecular_weight: float
+
+
+def _pairs_sum(sequence: str, pairs: List[Tuple[int, int]]) -> Tuple[int, int]:
+    """
+    Sum the scaled nearest-neighbor parameters of dinucleotides of a sequence and return (ΔH, ΔS).
+
+    :param sequence: nucleotides sequence
+    :param pairs: (first, second) positions of the dinucleotides, skipped if out of the sequence
+    """
+    delta_h = 0
+    delta_s = 0
+    for first, second in pairs:
+        if 0 <= first and second < len(sequence):
+            dh, ds = NN_SCALED_PARAMS[sequence[first] + sequence[second]]
+            delta_h += dh
+            delta_s += ds
+    return delta_h, delta_s
+
+
+def sequence_variants(sequence: str, salt: float = 50, indels: bool = False) -> Generator[Variant, None, None]:
+    """
+    Generate the single-base variants of a primer sequence with their properties and yield them.
+
+    Every substitution (3 per base) is yielded, and with `indels` every single-base insertion and deletion as well.
+    Indels that produce the same sequence inside a homopolymer run are yielded once, at their leftmost position.
+    The ΔH and ΔS of the sequence are calculated once, and each variant only replaces the dinucleotides around the
+    mutation; likewise the base counts of the variant are updated from the counts of the sequence.
+
+    :param sequence: uppercase primer nucleotides sequence
+    :param salt: Sodium ion concentration in millimoles (unit mM)
+    :param indels: include insertions and deletions flag
+    """
+    length = len(sequence)
+    counts = [sequence.count(base) for base in BASE_INDEX]
+    delta_h, delta_s = _pairs_sum(sequence, [(index, index + 1) for index in range(length - 1)])
+
+    def variant(mutation: Mutation, position: int, reference: str, alternative: str, new_sequence: str,
+                removed: List[Tuple[int, int]], added: List[Tuple[int, int]]) -> Variant:
+        removed_h, removed_s = _pairs_sum(sequence, removed)
+        added_h, added_s = _pairs_sum(new_sequence, added)
+        new_counts = counts[:]
+        if reference:
+            new_counts[BASE_INDEX[reference]] -= 1
+        if alternative:
+            new_counts[BASE_INDEX[alternative]] += 1
+        variant_h = (delta_h - removed_h + added_h) / DELTA_H_SCALE
+        variant_s = (delta_s - removed_s + added_s) / DELTA_S_SCALE
+        return Variant(
+            mutation=mutation,
+            position=position,
+            reference=reference,
+            alternative=alternative,
+            sequence=new_sequence,
+            delta_h=variant_h,
+            delta_s=variant_s,
+            nearest_neighbor_melting_temperature=nearest_neighbor_melting_temperature_calc(
+                new_sequence, salt, (variant_h, variant_s)),
+            gc_content=(new_counts[2] + new_counts[3]) / len(new_sequence) if new_sequence else 0.0,
+            molecular_weight=molecular_weight_from_counts(*new_counts),
+        )
+
+    for position, reference in enumerate(sequence):
+        for alternative in BASE_INDEX:
+            if alternative != reference:
+                yield variant(
+                    Mutation.SUBSTITUTION, position, reference, alternative,
+                    sequence[:position] + alternative + sequence[position + 1:],
+                    [(position - 1, position), (position, position + 1)],
+                    [(position - 1, position), (position, position + 1)])
+    if not indels:
+        return
+    for position in range(length + 1):
+        for alternative in BASE_INDEX:
+            if position > 0 and sequence[position - 1] == alternative:
+                continue
+            yield variant(
+                Mutation.INSERTION, position, "", alternative,
+                sequence[:position] + alternative + sequence[position:],
+                [(position - 1, position)],
+                [(position - 1, position), (position, position + 1)])
+    for position, reference in enumerate(sequence):
+        if position > 0 and sequence[position - 1] == reference:
+            continue
+        yield variant(
+            Mutation.DELETION, position, reference, "",
+            sequence[:position] + sequence[position + 1:],
+            [(position - 1, position), (position, position + 1)],
+            [(position - 1, position)])
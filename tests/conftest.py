@@ -0,0 +1,11 @@
+import random
+from opr import Primer
+
+
+def write_fasta(path, records):
+    path.write_text("".join(">{0}\n{1}\n".format(name, sequence) for name, sequence in records))
+
+
+def random_primers(seed, number):
+    random.seed(seed)
+    return [Primer("".join(random.choice("ATCG") for _ in range(random.randint(18, 25)))) for _ in range(number)]
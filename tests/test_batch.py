@@ -0,0 +1,83 @@
+import random
+import pytest
+from opr import Primer, PrimerBatch, MeltingTemperature
+
+TEST_CASE_NAME = "Batch tests"
+
+random.seed(4)
+SEQUENCES = ["".join(random.choice("ATCG") for _ in range(random.randint(1, 40))) for _ in range(200)]
+
+
+def test_batch_length():
+    obatch = PrimerBatch(SEQUENCES)
+    assert len(obatch) == len(SEQUENCES)
+    assert obatch.sequences == SEQUENCES
+
+
+def test_batch_properties():
+    obatch = PrimerBatch(SEQUENCES, salt=65)
+    primers = [Primer(sequence, salt=65) for sequence in SEQUENCES]
+    assert list(obatch.molecular_weight) == [oprimer.molecular_weight for oprimer in primers]
+    assert list(obatch.gc_content) == [oprimer.gc_content for oprimer in primers]
+    assert list(obatch.gc_clamp) == [oprimer.gc_clamp for oprimer in primers]
+    assert list(obatch.E260) == [oprimer.E260 for oprimer in primers]
+    assert list(obatch.delta_h) == [oprimer.delta_h for oprimer in primers]
+    assert list(obatch.delta_s) == [oprimer.delta_s for oprimer in primers]
+    for method in MeltingTemperature:
+        assert list(obatch.melting_temperature(method)) == [oprimer.melting_temperature(method) for oprimer in primers]
+
+
+def test_batch_cache():
+    obatch = PrimerBatch(SEQUENCES)
+    assert obatch.molecular_weight is obatch.molecular_weight
+    assert obatch.melting_temperature() is obatch.melting_temperature(MeltingTemperature.BASIC)
+
+
+def test_batch_lowercase():
+    obatch = PrimerBatch(["atcgatcgatcgatcgat"])
+    assert obatch.sequence(0) == "ATCGATCGATCGATCGAT"
+
+
+def test_batch_primers():
+    primers = [Primer("ATCGATCGATCGATCGAT", "primer1"), Primer("CTGGAGGACGGAAGAGGAAGTAA", "primer2")]
+    obatch = PrimerBatch.from_primers(primers)
+    assert obatch.names == ["primer1", "primer2"]
+    assert obatch.name(1) == "primer2"
+    assert list(obatch) == primers
+    assert obatch[-1].name == "primer2"
+    with pytest.raises(IndexError):
+        obatch[2]
+
+
+def test_batch_slice():
+    names = ["primer{0}".format(index) for index in range(len(SEQUENCES))]
+    obatch = PrimerBatch(SEQUENCES, names=names, salt=65)
+    for index in (slice(10, 50), slice(-30, None), slice(None, None, 3), slice(40, 10, -2), slice(5, 5)):
+        sliced = obatch[index]
+        assert isinstance(sliced, PrimerBatch)
+        assert sliced.sequences == SEQUENCES[index]
+        assert sliced.names == names[index]
+        assert sliced.salt == 65
+        assert list(sliced.E260) == list(obatch.E260)[index]
+        assert list(sliced.delta_h) == list(obatch.delta_h)[index]
+        assert list(sliced.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)) == \
+            list(obatch.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR))[index]
+
+
+def test_batch_default_names():
+    obatch = PrimerBatch(["ATCGATCGATCGATCGAT"])
+    assert obatch.names == ["unknown"]
+    assert obatch[0].name == "unknown"
+
+
+def test_batch_complement():
+    sequences = ["ATCGGCTAAATCGGCTAAAT", "CTGGAGGACGGAAGAGGAAGTAA", "GCATCCACTTCCTCTCCGTCAG"]
+    obatch = PrimerBatch(sequences, names=["a", "b", "c"])
+    ocomplement = obatch.complement()
+    assert ocomplement.sequences == [Primer(sequence).complement().sequence for sequence in sequences]
+    assert ocomplement.names == ["a", "b", "c"]
+    oreverse_complement = obatch.reverse_complement()
+    assert oreverse_complement.sequences == [Primer(sequence).reverse_complement().sequence for sequence in sequences]
+    assert list(oreverse_complement.molecular_weight) == [
+        Primer(sequence).reverse_complement().molecular_weight for sequence in sequences]
+    assert PrimerBatch([]).reverse_complement().sequences == []
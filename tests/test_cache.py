@@ -96,24 +96,80 @@ def test_to_protein():  # Reference: https://en.vectorbuilder.com/tool/dna-trans
 
     # Frame 1
     ## not cached
-    assert not oprimer._protein_seq["AA1"].get(1)
+    assert oprimer._protein_aa1 is None
     ## first call -> cache
     assert oprimer.to_protein() == "ID"
     ## check AA1 cache
-    assert oprimer._protein_seq["AA1"][1] == "ID"
+    assert oprimer._protein_aa1[0] == "ID"
     ## check AA3 cache
-    assert oprimer._protein_seq["AA3"][1] == "lle-Asp"
+    assert oprimer._protein_aa3[0] == "lle-Asp"
 
     # Frame 2
     ## not cached
-    assert not oprimer._protein_seq["AA1"].get(2)
+    assert not oprimer._protein_aa1[1]
     assert oprimer.to_protein(frame=2) == "SI"
-    assert oprimer._protein_seq["AA1"][2] == "SI"
-    assert oprimer._protein_seq["AA3"][2] == "Ser-lle"
+    assert oprimer._protein_aa1[1] == "SI"
+    assert oprimer._protein_aa3[1] == "Ser-lle"
 
     # Frame 3
     ## not cached
-    assert not oprimer._protein_seq["AA1"].get(3)
+    assert not oprimer._protein_aa1[2]
     assert oprimer.to_protein(frame=3) == "RS"
-    assert oprimer._protein_seq["AA1"][3] == "RS"
-    assert oprimer._protein_seq["AA3"][3] == "Arg-Ser"
+    assert oprimer._protein_aa1[2] == "RS"
+    assert oprimer._protein_aa3[2] == "Arg-Ser"
+
+
+def test_is_computed_melting_temperature():
+    oprimer = Primer("ATCGATCGATCGATCGATCG")
+    assert oprimer.is_computed("melting_temperature") == {method: False for method in MeltingTemperature}
+    oprimer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+    assert oprimer.is_computed("melting_temperature") == {
+        MeltingTemperature.BASIC: False,
+        MeltingTemperature.SALT_ADJUSTED: False,
+        MeltingTemperature.NEAREST_NEIGHBOR: True,
+    }
+    assert oprimer.is_computed("delta_h") and oprimer.is_computed("delta_s")
+    assert not oprimer.is_computed("molecular_weight")
+
+
+def test_slots():
+    oprimer = Primer("ATCGATCGATCGATCGATCG")
+    assert not hasattr(oprimer, "__dict__")
+
+
+def test_profile():
+    oprimer = Primer("CTGGAGGACGGAAGAGGAAGTAA")
+    profile = oprimer.profile()
+    for attr in ["molecular_weight", "gc_content", "gc_clamp", "single_runs", "double_runs", "E260", "delta_s", "delta_h"]:
+        assert oprimer.is_computed(attr)
+    assert all(oprimer.is_computed("melting_temperature").values())
+    reference = Primer("CTGGAGGACGGAAGAGGAAGTAA")
+    assert profile["molecular_weight"] == reference.molecular_weight
+    assert profile["gc_content"] == reference.gc_content
+    assert profile["gc_clamp"] == reference.gc_clamp
+    assert profile["single_runs"] == reference.single_runs
+    assert profile["double_runs"] == reference.double_runs
+    assert profile["E260"] == reference.E260
+    assert profile["delta_h"] == reference.delta_h
+    assert profile["delta_s"] == reference.delta_s
+    for method in MeltingTemperature:
+        assert profile["melting_temperature"][method] == reference.melting_temperature(method)
+
+
+def test_profile_partial():
+    oprimer = Primer("ATCGATCGATCGATCGATCG")
+    molecular_weight = oprimer.molecular_weight
+    single_runs = oprimer.single_runs
+    profile = oprimer.profile()
+    assert profile["molecular_weight"] == molecular_weight
+    assert oprimer.single_runs is single_runs
+
+
+def test_hairpin():
+    oprimer = Primer("GGGGCCAAAAGGCCCC")
+    assert not oprimer.is_computed("hairpin")
+    hairpin_first = oprimer.hairpin
+    assert oprimer.is_computed("hairpin")
+
+    hairpin_second = oprimer.hairpin
+    assert hairpin_first is hairpin_second
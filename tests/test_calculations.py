@@ -1,4 +1,6 @@
+import random
 from opr import Primer, MeltingTemperature
+from opr.functions import runs_calc, max_runs_calc, padding_calc
 
 TEST_CASE_NAME = "Calculations tests"
 
@@ -220,3 +222,43 @@ def test_e260_1():  # https://atdbio.com/tools/oligo-calculator
 def test_e260_2():  # https://atdbio.com/tools/oligo-calculator
     oprimer = Primer("ACGT")
     assert round(oprimer.E260, 1) == 40.3
+
+
+def test_profile_calc():
+    random.seed(5)
+    for _ in range(300):
+        sequence = "".join(random.choice("ATCG"[:random.randint(2, 4)]) for _ in range(random.randint(1, 40)))
+        profile = Primer(sequence).profile()
+        oprimer = Primer(sequence)
+        assert profile["single_runs"] == oprimer.single_runs
+        assert profile["double_runs"] == oprimer.double_runs
+        assert profile["gc_clamp"] == oprimer.gc_clamp
+        assert profile["E260"] == oprimer.E260
+        assert (profile["delta_h"], profile["delta_s"]) == (oprimer.delta_h, oprimer.delta_s)
+        assert profile["molecular_weight"] == oprimer.molecular_weight
+
+
+def test_runs_calc_1():
+    assert runs_calc("AAAAATTCGGGGATCCCCG") == [
+        ("A", 0, 5), ("T", 5, 2), ("C", 7, 1), ("G", 8, 4), ("A", 12, 1), ("T", 13, 1), ("C", 14, 4), ("G", 18, 1)]
+    assert runs_calc("AAAAATTCGGGGATCCCCG", min_repeats=4) == [("A", 0, 5), ("G", 8, 4), ("C", 14, 4)]
+
+
+def test_runs_calc_2():
+    assert runs_calc("ATATCGAACACACACACA", unit_length=2, min_repeats=2) == [("AT", 0, 2), ("AC", 7, 5), ("CA", 8, 5)]
+    assert runs_calc("", unit_length=2) == []
+
+
+def test_max_runs_calc():
+    random.seed(6)
+    for _ in range(300):
+        sequence = "".join(random.choice("ATCG"[:random.randint(2, 4)]) for _ in range(random.randint(1, 40)))
+        oprimer = Primer(sequence)
+        assert max_runs_calc(sequence, 1) == {base: oprimer.repeats(base, consecutive=True) for base in "ATCG"}
+        assert max_runs_calc(sequence, 2) == {
+            first + second: oprimer.repeats(first + second, consecutive=True)
+            for first in "ATCG" for second in "ATCG" if first != second}
+
+
+def test_padding():
+    assert [padding_calc(size) for size in (0, 1, 7, 8, 9, 20)] == [0, 7, 1, 0, 7, 4]
@@ -0,0 +1,96 @@
+import warnings
+import pytest
+from opr import Primer, PrimerBatch, OPRBaseError, analyze_many
+from opr import Diagnostic, DiagnosticsMode, count_diagnostics
+from opr import set_diagnostics_mode, get_diagnostics_mode, diagnostics_mode
+
+TEST_CASE_NAME = "Diagnostics tests"
+
+
+@pytest.fixture(autouse=True)
+def default_mode():
+    yield
+    set_diagnostics_mode(DiagnosticsMode.WARN)
+
+
+def test_warn_by_default():
+    assert get_diagnostics_mode() == DiagnosticsMode.WARN
+    with pytest.warns(RuntimeWarning, match="The recommended range for primer length is between 18 and 30."):
+        Primer("ATCG")
+    oprimer = Primer("AAAAAAAAAAAAAAAAAAAA")
+    for _ in range(2):
+        with pytest.warns(RuntimeWarning, match="The recommended range for GC content is between 30% and 80%."):
+            oprimer.gc_content
+
+
+def test_primer_diagnostics():
+    with diagnostics_mode(DiagnosticsMode.RECORD):
+        assert Primer("ATCGATCGATCGATCGAT").diagnostics == Diagnostic.NONE
+        assert Primer("AAAAAAAAAAAAAAAAAAAA").diagnostics == Diagnostic.GC_CONTENT_OUT_OF_RANGE
+        assert Primer("ATCG").diagnostics == Diagnostic.LENGTH_OUT_OF_RANGE
+        assert Primer("AAAA").diagnostics == Diagnostic.LENGTH_OUT_OF_RANGE | Diagnostic.GC_CONTENT_OUT_OF_RANGE
+
+
+def test_primer_diagnostics_quiet():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        oprimer = Primer("AAAAAAAAAAAAAAAAAAAA")
+        assert oprimer.diagnostics == Diagnostic.GC_CONTENT_OUT_OF_RANGE
+
+
+def test_primer_diagnostics_profile():
+    with diagnostics_mode(DiagnosticsMode.RECORD):
+        oprimer = Primer("AAAAAAAAAAAAAAAAAAAA")
+        oprimer.profile()
+        assert oprimer._diagnostics == Diagnostic.GC_CONTENT_OUT_OF_RANGE
+
+
+def test_record():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with diagnostics_mode(DiagnosticsMode.RECORD):
+            assert get_diagnostics_mode() == DiagnosticsMode.RECORD
+            assert Primer("AAAA").gc_content == 0
+            PrimerBatch(["AAAA", "ATCGATCGATCGATCGAT"]).gc_content
+    assert get_diagnostics_mode() == DiagnosticsMode.WARN
+
+
+def test_raise():
+    set_diagnostics_mode(DiagnosticsMode.RAISE)
+    with pytest.raises(OPRBaseError, match="The recommended range for primer length is between 18 and 30."):
+        Primer("ATCG")
+    with pytest.raises(OPRBaseError, match="The recommended range for GC content is between 30% and 80%."):
+        Primer("AAAAAAAAAAAAAAAAAAAA").gc_content
+    with pytest.raises(OPRBaseError, match="The recommended range for GC content is between 30% and 80%."):
+        PrimerBatch(["ATCGATCGATCGATCGAT", "AAAAAAAAAAAAAAAAAAAA"]).gc_content
+
+
+def test_batch_warns_once():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        obatch = PrimerBatch(["AAAA"] * 100)
+        obatch.gc_content
+        obatch.gc_content
+    assert [str(warning.message) for warning in caught] == [
+        "The recommended range for primer length is between 18 and 30.",
+        "The recommended range for GC content is between 30% and 80%.",
+    ]
+
+
+def test_batch_diagnostics():
+    sequences = ["ATCGATCGATCGATCGAT", "AAAAAAAAAAAAAAAAAAAA", "ATCG", "AAAA"]
+    with diagnostics_mode(DiagnosticsMode.RECORD):
+        obatch = PrimerBatch(sequences)
+        assert list(obatch.diagnostics) == [Primer(sequence).diagnostics for sequence in sequences]
+        assert count_diagnostics(obatch.diagnostics) == {
+            Diagnostic.LENGTH_OUT_OF_RANGE: 2, Diagnostic.GC_CONTENT_OUT_OF_RANGE: 2}
+
+
+def test_count_diagnostics_empty():
+    assert count_diagnostics([]) == {Diagnostic.LENGTH_OUT_OF_RANGE: 0, Diagnostic.GC_CONTENT_OUT_OF_RANGE: 0}
+
+
+def test_parallel_mode():
+    with diagnostics_mode(DiagnosticsMode.RAISE):
+        with pytest.raises(OPRBaseError, match="The recommended range for GC content is between 30% and 80%."):
+            analyze_many(["AAAAAAAAAAAAAAAAAAAA"] * 4, properties=["gc_content"], workers=2, chunk_size=2)
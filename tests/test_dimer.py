@@ -0,0 +1,100 @@
+import random
+from opr import Primer, Dimer, DimerIndex, self_dimer, cross_dimer, dimer_matrix
+from opr.params import DNA_COMPLEMENT_MAP, NN_PARAMS
+
+TEST_CASE_NAME = "Dimer tests"
+
+
+def reference_dimer(first, second):
+    reverse_complement = "".join(DNA_COMPLEMENT_MAP[base] for base in reversed(second))
+    longest, end, delta_g = 0, 0, 0.0
+    for shift in range(1 - len(second), len(first)):
+        match = [0 <= index - shift < len(second) and first[index] == reverse_complement[index - shift]
+                 for index in range(len(first))]
+        run = 0
+        for value in match:
+            run = run + 1 if value else 0
+            longest = max(longest, run)
+        run = 0
+        while run < len(first) and match[len(first) - 1 - run]:
+            run += 1
+        end = max(end, run)
+        run = 0
+        while 0 <= shift + run < len(first) and match[shift + run]:
+            run += 1
+        end = max(end, run)
+        alignment_delta_g = 0.0
+        for index in range(len(first) - 1):
+            if match[index] and match[index + 1]:
+                pair = first[index:index + 2]
+                if pair not in NN_PARAMS:
+                    pair = DNA_COMPLEMENT_MAP[pair[1]] + DNA_COMPLEMENT_MAP[pair[0]]
+                dh, ds = NN_PARAMS[pair]
+                alignment_delta_g += dh - 310.15 * ds
+        delta_g = min(delta_g, alignment_delta_g)
+    return longest, end, delta_g
+
+
+def test_self_dimer():
+    oprimer = Primer("GAATTCGAATTC")
+    dimer = self_dimer(oprimer)
+    assert isinstance(dimer, Dimer)
+    assert dimer.longest_complementarity == 12
+    assert dimer.end_complementarity == 12
+    assert dimer.delta_g < -10
+
+
+def test_cross_dimer_1():
+    dimer = cross_dimer(Primer("AAAAAAAA"), Primer("CCCCCCCC"))
+    assert dimer == Dimer(0, 0, 0.0)
+
+
+def test_cross_dimer_2():
+    random.seed(8)
+    for _ in range(200):
+        first = "".join(random.choice("ATCG") for _ in range(random.randint(1, 25)))
+        second = "".join(random.choice("ATCG") for _ in range(random.randint(1, 25)))
+        dimer = cross_dimer(Primer(first), Primer(second))
+        longest, end, delta_g = reference_dimer(first, second)
+        assert dimer.longest_complementarity == longest
+        assert dimer.end_complementarity == end
+        assert abs(dimer.delta_g - delta_g) < 1e-9
+
+
+def test_cross_dimer_symmetry():
+    first, second = Primer("CTGGAGGACGGAAGAGGAAGTAA"), Primer("TTACTTCCTCTTCCGTCC")
+    assert cross_dimer(first, second).longest_complementarity == cross_dimer(second, first).longest_complementarity
+    assert cross_dimer(first, second).end_complementarity == 18
+
+
+def test_dimer_matrix():
+    random.seed(9)
+    primers = [Primer("".join(random.choice("ATCG") for _ in range(20))) for _ in range(40)]
+    matrix = dimer_matrix(primers, seed_length=5)
+    pairs = {(first, second): dimer for first, second, dimer in matrix}
+    for first in range(len(primers)):
+        for second in range(first, len(primers)):
+            dimer = cross_dimer(primers[first], primers[second])
+            if dimer.longest_complementarity >= 5:
+                assert pairs[(first, second)].longest_complementarity == dimer.longest_complementarity
+                assert pairs[(first, second)].delta_g >= dimer.delta_g
+            else:
+                assert (first, second) not in pairs
+    assert [pair[:2] for pair in matrix] == sorted(pair[:2] for pair in matrix)
+
+
+def test_dimer_index():
+    oindex = DimerIndex(seed_length=6)
+    first, second, third = Primer("CTGGAGGACGGAAGAGGAAGTAA"), Primer("TTACTTCCTCTTCCGTCC"), Primer("AAAAAAAAAAAAAAAAAA")
+    oindex.add("first", first)
+    oindex.add("second", second)
+    oindex.add("third", third)
+    assert len(oindex) == 3 and "second" in oindex and oindex.seed_length == 6
+    assert oindex.dimers("second") == {"first": cross_dimer(first, second)}
+    assert oindex.dimer("first", "second") == cross_dimer(first, second)
+    assert oindex.dimer("first", "third") is None
+    assert oindex.shared_seeds("first") == {}
+    oindex.add("copy", Primer("GGAGGACGGAAGAG"))
+    assert oindex.shared_seeds("first") == {"copy": 9}
+    oindex.remove("first")
+    assert "first" not in oindex and list(oindex.dimers("second")) == ["copy"]
@@ -1,5 +1,11 @@
+import io
 import pytest
-from opr import Primer, MeltingTemperature, OPRBaseError
+from opr import Primer, PrimerBatch, MeltingTemperature, SequenceFormat, OPRBaseError
+from opr import read_primers, read_records, analyze_many, scan_windows
+from opr import cross_dimer, dimer_matrix, DimerIndex, KmerIndex, design_pairs, enable_property_cache, open_property_store
+from opr import set_diagnostics_mode, translate_frame, find_orfs, Panel, assign_pools, dimer_conflict
+from opr import predict_amplicons, PackedSequences, FrozenPrimer, PrimerSet
+from opr.functions import runs_calc
 
 TEST_CASE_NAME = "Errors tests"
 
@@ -36,3 +42,337 @@ def test_is_computed():
     oprimer = Primer("ATCGATCGATCGATCGAT")
     with pytest.raises(OPRBaseError, match=r"^This attribute either doesn't exist or cannot be computed/cached."):
         oprimer.is_computed("Invalid Attribute")
+
+
+def test_batch_validate_primer_1():
+    with pytest.raises(OPRBaseError, match=r"Primer sequence should be a string variable."):
+        obatch = PrimerBatch(["ATCGATCGATCGATCGAT", 222])
+
+
+def test_batch_validate_primer_2():
+    with pytest.raises(OPRBaseError, match=r"Primer sequence should only contain the nucleotide bases A, T, C, and G."):
+        obatch = PrimerBatch(["ATCGATCGATCGATCGAF"])
+
+
+def test_batch_names():
+    with pytest.raises(OPRBaseError, match=r"The number of names should be equal to the number of sequences."):
+        obatch = PrimerBatch(["ATCGATCGATCGATCGAT"], names=["primer1", "primer2"])
+
+
+def test_batch_from_primers():
+    with pytest.raises(OPRBaseError, match=r"PrimerBatch can only be built from Primer objects."):
+        obatch = PrimerBatch.from_primers(["ATCGATCGATCGATCGAT"])
+
+
+def test_batch_melting_temperature():
+    obatch = PrimerBatch(["ATCGATCGATCGATCGAT"])
+    with pytest.raises(NotImplementedError, match=r"This method for calculating melting temperature has not been implemented."):
+        obatch.melting_temperature(method="Invalid Method")
+
+
+def test_reader_format():
+    with pytest.raises(OPRBaseError, match=r"`file_format` should be a SequenceFormat."):
+        list(read_records(io.StringIO(">primer1\nATCG\n"), file_format="FASTA"))
+
+
+def test_reader_fasta():
+    with pytest.raises(OPRBaseError, match=r"FASTA sequence lines should follow a `>` header line."):
+        list(read_records(io.StringIO("ATCG\n>primer1\nATCG\n"), file_format=SequenceFormat.FASTA))
+
+
+def test_reader_fastq():
+    with pytest.raises(OPRBaseError, match=r"FASTQ records should consist of a header, sequence, separator and quality line."):
+        list(read_records(io.StringIO("@primer1\nATCG\n+\n")))
+
+
+def test_reader_batch_size():
+    with pytest.raises(OPRBaseError, match=r"`batch_size` should be a positive integer."):
+        list(read_primers(io.StringIO("ATCG\n"), batch_size=0))
+
+
+def test_analyze_many_properties():
+    with pytest.raises(OPRBaseError, match=r"Properties should be chosen from"):
+        analyze_many(["ATCGATCGATCGATCGAT"], properties=["name"])
+
+
+def test_analyze_many_workers():
+    with pytest.raises(OPRBaseError, match=r"`workers` should be a positive integer."):
+        analyze_many(["ATCGATCGATCGATCGAT"], workers=0)
+
+
+def test_analyze_many_chunk_size():
+    with pytest.raises(OPRBaseError, match=r"`chunk_size` should be a positive integer."):
+        analyze_many(["ATCGATCGATCGATCGAT"], chunk_size="10")
+
+
+def test_runs_calc():
+    with pytest.raises(OPRBaseError, match=r"`unit_length` should be 1 \(single runs\) or 2 \(double runs\)."):
+        runs_calc("ATCGATCGATCGATCGAT", unit_length=3)
+
+
+def test_scan_windows_template():
+    with pytest.raises(OPRBaseError, match=r"Template sequence should be a string variable."):
+        scan_windows(222)
+
+
+def test_scan_windows_length():
+    with pytest.raises(OPRBaseError, match=r"Window lengths should be positive integers"):
+        scan_windows("ATCGATCGATCGATCGAT", min_length=20, max_length=18)
+
+
+def test_scan_windows_top_k():
+    with pytest.raises(OPRBaseError, match=r"`top_k` should be a positive integer and requires a `key` function."):
+        scan_windows("ATCGATCGATCGATCGAT", top_k=5)
+
+
+def test_cross_dimer():
+    with pytest.raises(OPRBaseError, match=r"Dimers can only be calculated between Primer objects."):
+        cross_dimer(Primer("ATCGATCGATCGATCGAT"), "ATCGATCGATCGATCGAT")
+
+
+def test_dimer_matrix_1():
+    with pytest.raises(OPRBaseError, match=r"Dimers can only be calculated between Primer objects."):
+        dimer_matrix(["ATCGATCGATCGATCGAT"])
+
+
+def test_dimer_matrix_2():
+    with pytest.raises(OPRBaseError, match=r"`seed_length` should be a positive integer."):
+        dimer_matrix([Primer("ATCGATCGATCGATCGAT")], seed_length=0)
+
+
+def test_dimer_index_1():
+    with pytest.raises(OPRBaseError, match=r"`seed_length` should be a positive integer."):
+        DimerIndex(seed_length=0)
+
+
+def test_dimer_index_2():
+    with pytest.raises(OPRBaseError, match=r"Dimers can only be calculated between Primer objects."):
+        DimerIndex().add(0, "ATCGATCGATCGATCGAT")
+
+
+def test_dimer_index_3():
+    oindex = DimerIndex()
+    oindex.add(0, Primer("ATCGATCGATCGATCGAT"))
+    with pytest.raises(OPRBaseError, match=r"There is already a primer with the given key in the dimer index."):
+        oindex.add(0, Primer("ATCGATCGATCGATCGAT"))
+
+
+def test_dimer_index_4():
+    with pytest.raises(OPRBaseError, match=r"There is no primer with the given key in the dimer index."):
+        DimerIndex().dimers(0)
+
+
+def test_kmer_index_k(tmp_path):
+    with pytest.raises(OPRBaseError, match=r"`k` should be an integer between 1 and 13."):
+        KmerIndex.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.idx", k=14)
+
+
+def test_kmer_index_file(tmp_path):
+    path = tmp_path / "reference.idx"
+    path.write_bytes(b"ATCGATCGATCGATCGAT" * 10)
+    with pytest.raises(OPRBaseError, match=r"The file is not a valid OPR k-mer index."):
+        KmerIndex(path)
+
+
+def test_kmer_index_search_1(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.idx", k=4) as oindex:
+        with pytest.raises(OPRBaseError, match=r"Binding sites can only be searched for Primer objects."):
+            oindex.search("ATCGATCGATCGATCGAT")
+
+
+def test_kmer_index_search_2(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.idx", k=4) as oindex:
+        with pytest.raises(OPRBaseError, match=r"`max_mismatches` should be a non-negative integer."):
+            oindex.search(Primer("ATCGATCGATCGATCGAT"), max_mismatches=-1)
+
+
+def test_kmer_index_search_3(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.idx", k=4) as oindex:
+        with pytest.raises(OPRBaseError, match=r"The primer should not be shorter than the index k-mers."):
+            oindex.search(Primer("ATC"))
+
+
+def test_kmer_index_region_1(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.idx", k=4) as oindex:
+        with pytest.raises(OPRBaseError, match=r"The record is not in the k-mer index."):
+            oindex.region("b", 0, 4)
+
+
+def test_kmer_index_region_2(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.idx", k=4) as oindex:
+        with pytest.raises(OPRBaseError, match=r"The region should be a \(start, end\) pair of integers within the record."):
+            oindex.region("a", 10, 20)
+
+
+def test_design_pairs_1():
+    with pytest.raises(OPRBaseError, match=r"Template sequence should be a string variable."):
+        design_pairs(Primer("ATCGATCGATCGATCGAT"), [], [])
+
+
+def test_design_pairs_2():
+    with pytest.raises(OPRBaseError, match=r"Candidate primers should be Primer objects or a PrimerBatch."):
+        design_pairs("ATCGATCGATCGATCGAT", ["ATCGATCGATCGATCGAT"], [])
+
+
+def test_design_pairs_3():
+    with pytest.raises(OPRBaseError, match=r"`product_size` should be a \(minimum, maximum\) pair of positive integers."):
+        design_pairs("ATCGATCGATCGATCGAT", [], [], product_size=(1000, 100))
+
+
+def test_design_pairs_4():
+    with pytest.raises(OPRBaseError, match=r"`top_k` should be a positive integer."):
+        design_pairs("ATCGATCGATCGATCGAT", [], [], top_k=0)
+
+
+def test_property_cache_size():
+    with pytest.raises(OPRBaseError, match=r"`maxsize` should be a positive integer."):
+        enable_property_cache(maxsize=0)
+
+
+def test_property_store_file(tmp_path):
+    path = tmp_path / "properties.db"
+    path.write_bytes(b"ATCGATCGATCGATCGAT" * 100)
+    with pytest.raises(OPRBaseError, match=r"The file is not a valid OPR property store."):
+        open_property_store(path)
+
+
+def test_diagnostics_mode():
+    with pytest.raises(OPRBaseError, match=r"`mode` should be a DiagnosticsMode."):
+        set_diagnostics_mode("raise")
+
+
+def test_translate_frame_1():
+    with pytest.raises(OPRBaseError, match=r"Parameter `frame` must be 1, 2, 3, -1, -2, or -3."):
+        translate_frame("ATCGATCG", frame=4)
+
+
+def test_translate_frame_2():
+    with pytest.raises(OPRBaseError, match=r"Sequence should only contain the nucleotide bases A, T, C, and G."):
+        translate_frame("ATCGNTCG")
+
+
+def test_find_orfs_1():
+    with pytest.raises(OPRBaseError, match=r"Sequence should be a string variable."):
+        find_orfs(1234)
+
+
+def test_find_orfs_2():
+    with pytest.raises(OPRBaseError, match=r"`min_length` should be a positive integer."):
+        find_orfs("ATGAAATAA", min_length=0)
+
+
+def test_find_orfs_3():
+    with pytest.raises(OPRBaseError, match=r"`chunk_size` should be a positive integer."):
+        find_orfs("ATGAAATAA", chunk_size=0)
+
+
+def test_panel_1():
+    with pytest.raises(OPRBaseError, match=r"Panel primers should be Primer objects."):
+        Panel(["ATCGATCGATCGATCGAT"])
+
+
+def test_panel_2():
+    with pytest.raises(OPRBaseError, match=r"There is no primer with the given key in the panel."):
+        Panel([Primer("ATCGATCGATCGATCGAT")]).remove(1)
+
+
+def test_panel_3():
+    with pytest.raises(OPRBaseError, match=r"`top_k` should be a positive integer."):
+        Panel().worst(top_k=0)
+
+
+def test_panel_4():
+    with pytest.raises(OPRBaseError, match=r"`seed_length` should be a positive integer."):
+        Panel(seed_length=0)
+
+
+def test_assign_pools_1():
+    with pytest.raises(OPRBaseError, match=r"Pool primers should be Primer objects."):
+        assign_pools(["ATCGATCGATCGATCGAT"])
+
+
+def test_assign_pools_2():
+    with pytest.raises(OPRBaseError, match=r"`max_melting_temperature_range` should be a non-negative number."):
+        assign_pools([Primer("ATCGATCGATCGATCGAT")], max_melting_temperature_range=-1)
+
+
+def test_assign_pools_3():
+    with pytest.raises(OPRBaseError, match=r"`max_pool_size` should be a positive integer."):
+        assign_pools([Primer("ATCGATCGATCGATCGAT")], max_pool_size=0)
+
+
+def test_dimer_conflict():
+    with pytest.raises(OPRBaseError, match=r"Complementarity thresholds should be positive integers."):
+        dimer_conflict(min_end_complementarity=0)
+
+
+def test_predict_amplicons_1():
+    with pytest.raises(OPRBaseError, match=r"Templates should be a KmerIndex."):
+        predict_amplicons("ATCGATCGATCGATCGAT", [])
+
+
+def test_predict_amplicons_2(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.idx", k=4) as oindex:
+        with pytest.raises(OPRBaseError, match=r"Primer pairs should be \(forward, reverse\) pairs of Primer objects."):
+            predict_amplicons(oindex, [(Primer("ATCGATCGATCGATCGAT"), "ATCGATCGATCGATCGAT")])
+
+
+def test_predict_amplicons_3(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.idx", k=4) as oindex:
+        with pytest.raises(OPRBaseError, match=r"`product_size` should be a \(minimum, maximum\) pair of positive integers."):
+            predict_amplicons(oindex, [], product_size=(500, 100))
+
+
+def test_packed_sequences_file(tmp_path):
+    path = tmp_path / "reference.2bit"
+    path.write_bytes(b"OPRPACK0" + bytes(64))
+    with pytest.raises(OPRBaseError, match=r"The file is not a valid OPR packed sequences file."):
+        PackedSequences(path)
+
+
+def test_packed_sequences_record(tmp_path):
+    with PackedSequences.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.2bit") as opacked:
+        with pytest.raises(OPRBaseError, match=r"The record is not in the packed sequences."):
+            opacked.view("b")
+
+
+def test_packed_sequences_region(tmp_path):
+    with PackedSequences.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.2bit") as opacked:
+        with pytest.raises(OPRBaseError, match=r"The region should be a \(start, end\) pair of integers within the record."):
+            opacked.sequence("a", 4, 2)
+
+
+def test_packed_sequences_windows(tmp_path):
+    with PackedSequences.build(io.StringIO(">a\nATCGATCGATCGATCGAT\n"), tmp_path / "reference.2bit") as opacked:
+        with pytest.raises(OPRBaseError, match=r"`length` and `step` should be positive integers."):
+            opacked.windows("a", 18, step=0)
+
+
+def test_frozen_primer_1():
+    with pytest.raises(OPRBaseError, match=r"The sequence of a FrozenPrimer cannot be changed inplace."):
+        FrozenPrimer("ATCGATCGATCGATCGAT").reverse(inplace=True)
+
+
+def test_frozen_primer_2():
+    with pytest.raises(OPRBaseError, match=r"The sequence of a FrozenPrimer cannot be changed inplace."):
+        FrozenPrimer("ATCGATCGATCGATCGAT").complement(inplace=True)
+
+
+def test_frozen_primer_3():
+    with pytest.raises(OPRBaseError, match=r"The sequence of a FrozenPrimer cannot be changed inplace."):
+        FrozenPrimer("ATCGATCGATCGATCGAT").reverse_complement(inplace=True)
+
+
+def test_primer_set_1():
+    with pytest.raises(OPRBaseError, match=r"PrimerSet primers should be Primer objects."):
+        PrimerSet(["ATCGATCGATCGATCGAT"])
+
+
+def test_primer_set_2():
+    with pytest.raises(OPRBaseError, match=r"Sequence should be a string variable."):
+        PrimerSet([Primer("ATCGATCGATCGATCGAT")]).find(1)
+
+
+def test_primer_set_3():
+    with pytest.raises(OPRBaseError, match=r"PrimerSet primers should not be empty."):
+        PrimerSet([Primer("ATCGATCGATCGATCGAT"), Primer("ATCG") * 0])
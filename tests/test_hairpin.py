@@ -0,0 +1,108 @@
+import random
+from opr import Primer, Hairpin
+from opr.hairpin import hairpin_calc, hairpin_loop_delta_g_calc
+from opr.hairpin import _best_hairpin, _sequence_hairpin, _HAIRPIN_SUBRESULTS
+from opr.functions import NN_PAIR_PARAMS, delta_g_calc
+from opr.params import DNA_COMPLEMENT_MAP
+
+TEST_CASE_NAME = "Hairpin tests"
+
+
+def reference_hairpin(sequence):
+    best = None
+    for start in range(len(sequence)):
+        for end in range(start + 1, len(sequence)):
+            stem_length = 0
+            delta_g = 0.0
+            while end - start - 2 * stem_length - 1 >= 3 and \
+                    DNA_COMPLEMENT_MAP[sequence[start + stem_length]] == sequence[end - stem_length]:
+                if stem_length > 0:
+                    delta_g += delta_g_calc(*NN_PAIR_PARAMS[sequence[start + stem_length - 1:start + stem_length + 1]])
+                stem_length += 1
+                if stem_length >= 2:
+                    loop_length = end - start - 2 * stem_length + 1
+                    total = delta_g + hairpin_loop_delta_g_calc(loop_length)
+                    if best is None or total < best:
+                        best = total
+    return best if best is not None and best < 0 else None
+
+
+def test_hairpin_1():
+    oprimer = Primer("GGGGCCAAAAGGCCCC")
+    hairpin = oprimer.hairpin
+    assert isinstance(hairpin, Hairpin)
+    assert (hairpin.stem_start, hairpin.stem_end, hairpin.stem_length, hairpin.loop_length) == (0, 15, 6, 4)
+    assert hairpin.delta_g < -5
+
+
+def test_hairpin_2():
+    assert Primer("AAAAAAAAAAAAAAAAAAAA").hairpin is None
+
+
+def test_hairpin_3():
+    random.seed(10)
+    for _ in range(300):
+        sequence = "".join(random.choice("ATCG") for _ in range(random.randint(1, 30)))
+        hairpin = hairpin_calc(sequence)
+        reference = reference_hairpin(sequence)
+        if reference is None:
+            assert hairpin is None
+        else:
+            assert abs(hairpin.delta_g - reference) < 1e-9
+            stem = sequence[hairpin.stem_start:hairpin.stem_start + hairpin.stem_length]
+            other_stem = sequence[hairpin.stem_end - hairpin.stem_length + 1:hairpin.stem_end + 1]
+            assert stem == "".join(DNA_COMPLEMENT_MAP[base] for base in reversed(other_stem))
+            assert hairpin.stem_end - hairpin.stem_start + 1 == 2 * hairpin.stem_length + hairpin.loop_length
+
+
+def test_hairpin_windows():
+    random.seed(11)
+    template = "".join(random.choice("ATCG") for _ in range(300))
+    windows = [template[index:index + 30] for index in range(len(template) - 29)]
+    _best_hairpin.cache_clear()
+    _HAIRPIN_SUBRESULTS.clear()
+    hairpins = [hairpin_calc(window) for window in windows]
+    info = _HAIRPIN_SUBRESULTS.info()
+    assert info.hits >= len(windows) - 1
+    _HAIRPIN_SUBRESULTS.clear()
+    for window, hairpin in zip(windows, hairpins):
+        expected = _sequence_hairpin(window, 37)
+        assert hairpin == (None if expected is None else Hairpin(*expected))
+
+
+def test_hairpin_variants():
+    random.seed(12)
+    base = "".join(random.choice("ATCG") for _ in range(30))
+    variants = [base[:index] + base_ + base[index + 1:] for index in range(len(base)) for base_ in "ATCG"]
+    _best_hairpin.cache_clear()
+    _HAIRPIN_SUBRESULTS.clear()
+    hairpin_calc(base)
+    hits = _HAIRPIN_SUBRESULTS.info().hits
+    hairpins = [hairpin_calc(variant) for variant in variants]
+    assert _HAIRPIN_SUBRESULTS.info().hits - hits >= len(variants) - len(base)
+    _HAIRPIN_SUBRESULTS.clear()
+    for variant, hairpin in zip(variants, hairpins):
+        expected = _sequence_hairpin(variant, 37)
+        assert hairpin == (None if expected is None else Hairpin(*expected))
+        reference = reference_hairpin(variant)
+        assert (hairpin is None) == (reference is None)
+        if reference is not None:
+            assert abs(hairpin.delta_g - reference) < 1e-9
+
+
+def test_hairpin_loop():
+    assert hairpin_loop_delta_g_calc(4) == 3.5
+    assert 4.6 < hairpin_loop_delta_g_calc(11) < 5.0
+    assert hairpin_loop_delta_g_calc(40) > 6.3
+    assert hairpin_loop_delta_g_calc(4, temperature=60) > 3.5
+
+
+def test_hairpin_long():
+    stem = "GGGGCCGCGG"
+    sequence = "A" * 600 + stem + "AAAA" + "".join(DNA_COMPLEMENT_MAP[base] for base in reversed(stem)) + "A" * 600
+    hairpin = hairpin_calc(sequence)
+    assert (hairpin.stem_start, hairpin.stem_end, hairpin.stem_length, hairpin.loop_length) == (600, 623, 10, 4)
+    oprimer = Primer(sequence)
+    assert "hairpin" not in oprimer.profile()
+    assert not oprimer.is_computed("hairpin")
+    assert oprimer.profile(hairpin=True)["hairpin"] == hairpin
@@ -0,0 +1,106 @@
+import io
+import pickle
+import random
+from opr import Primer, KmerIndex, BindingSite
+from opr.functions import reverse_complement_calc
+from conftest import write_fasta
+
+TEST_CASE_NAME = "K-mer index tests"
+
+def brute_force_search(records, sequence, max_mismatches):
+    reverse_complement = reverse_complement_calc(sequence)
+    sites = []
+    for name, reference in records:
+        for position in range(len(reference) - len(sequence) + 1):
+            region = reference[position:position + len(sequence)]
+            for strand, query in (("+", sequence), ("-", reverse_complement)):
+                mismatches = sum(1 for first, second in zip(query, region) if first != second)
+                if mismatches <= max_mismatches:
+                    sites.append(BindingSite(name, position, strand, mismatches))
+    return sorted(sites, key=lambda site: ([name for name, _ in records].index(site.name),) + site[1:])
+
+
+def test_search_exact(tmp_path):
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, [("chr1", "AAAACTGGAGGACGGAAGAGGAAGTAAAAAA"), ("chr2", "TTTTTACTTCCTCTTCCGTCCTCCAGTTTT")])
+    with KmerIndex.build(reference, tmp_path / "reference.idx", k=8) as oindex:
+        assert oindex.k == 8
+        assert oindex.names == ["chr1", "chr2"]
+        assert oindex.search(Primer("CTGGAGGACGGAAGAGGAAGTAA"), max_mismatches=0) == [
+            BindingSite("chr1", 4, "+", 0), BindingSite("chr2", 3, "-", 0)]
+
+
+def test_search_random(tmp_path):
+    random.seed(1)
+    records = [("chr{0}".format(index), "".join(random.choice("ATCG") for _ in range(3000))) for index in range(3)]
+    # plant mutated copies of the primer on both strands
+    primer = "".join(random.choice("ATCG") for _ in range(20))
+    reverse_complement = reverse_complement_calc(primer)
+    for index, (name, sequence) in enumerate(records):
+        for offset, query in ((100 * (index + 1), primer), (2000 + index, reverse_complement)):
+            query = list(query)
+            for position in random.sample(range(20), index + 1):
+                query[position] = random.choice("ATCG".replace(query[position], ""))
+            sequence = sequence[:offset] + "".join(query) + sequence[offset + 20:]
+        records[index] = (name, sequence)
+    records.append(("chrN", "NNNN" + primer + "NNNN"))
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, records)
+    oindex = KmerIndex.build(reference, tmp_path / "reference.idx", k=6)
+    for max_mismatches in range(4):
+        assert oindex.search(Primer(primer), max_mismatches) == brute_force_search(records, primer, max_mismatches)
+    oindex.close()
+
+
+def test_search_record_boundary(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nATCGATCGAT\n>b\nCGATCGATCG\n"), tmp_path / "reference.idx", k=4) as oindex:
+        assert oindex.search(Primer("ATCGATCGATCGATCGAT"), max_mismatches=0) == []
+
+
+def test_search_invalid_bases(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nCTGGANGACGGAAGAGGAAG\n"), tmp_path / "reference.idx", k=4) as oindex:
+        assert len(oindex) == 13
+        assert oindex.search(Primer("CTGGAGGACGGAAGAG"), max_mismatches=1) == [BindingSite("a", 0, "+", 1)]
+
+
+def test_search_invalid_bases_in_site(tmp_path):
+    # every seed of the primer overlaps an N in both sites
+    reference = "GGGGGGGG" + "CTGGANGACGGAAGANGAAG" + "GGGGGGGG" + "CTNNAGGACGGAAGAGGAAG"
+    with KmerIndex.build(io.StringIO(">a\n{0}\n".format(reference)), tmp_path / "reference.idx", k=10) as oindex:
+        assert oindex.search(Primer("CTGGAGGACGGAAGAGGAAG"), max_mismatches=1) == []
+        assert oindex.search(Primer("CTGGAGGACGGAAGAGGAAG"), max_mismatches=2) == [
+            BindingSite("a", 8, "+", 2), BindingSite("a", 36, "+", 2)]
+        candidates = oindex._invalid_block_candidates(20, 2)
+        assert candidates is oindex._invalid_block_candidates(20, 2)
+        assert oindex.search(Primer("CTGGAGGACGGAAGAGGAAG"), max_mismatches=2) == [
+            BindingSite("a", 8, "+", 2), BindingSite("a", 36, "+", 2)]
+
+
+def test_search_random_invalid_bases(tmp_path):
+    random.seed(2)
+    records = [("chr{0}".format(index), "".join(random.choice("ATCG" * 6 + "N") for _ in range(1000)))
+               for index in range(3)]
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, records)
+    with KmerIndex.build(reference, tmp_path / "reference.idx", k=6) as oindex:
+        for start in random.sample(range(980), 20):
+            query = records[0][1][start:start + 18].replace("N", "A")
+            for max_mismatches in range(4):
+                assert oindex.search(Primer(query), max_mismatches) == brute_force_search(
+                    records, query, max_mismatches)
+
+
+def test_default_k(tmp_path):
+    with KmerIndex.build(io.StringIO(">a\nCTGGAGGACGGAAGAGGAAG\n"), tmp_path / "small.idx") as oindex:
+        assert oindex.k == 8
+    reference = ">a\n{0}\n".format("ACGT" * 1024 * 256)
+    with KmerIndex.build(io.StringIO(reference), tmp_path / "large.idx") as oindex:
+        assert oindex.k == 10
+
+
+def test_pickle(tmp_path):
+    path = tmp_path / "reference.idx"
+    with KmerIndex.build(io.StringIO(">a\nCTGGAGGACGGAAGAGGAAGTAA\n"), path, k=5) as oindex:
+        with pickle.loads(pickle.dumps(oindex)) as oindex_copy:
+            assert oindex_copy.path == str(path)
+            assert oindex_copy.search(Primer("CTGGAGGACGGAAGAGGAAGTAA")) == [BindingSite("a", 0, "+", 0)]
@@ -0,0 +1,102 @@
+import time
+from opr import Primer, MeltingTemperature
+from opr import enable_instrumentation, disable_instrumentation, get_instrumentation
+import pytest
+
+TEST_CASE_NAME = "Instrumentation tests"
+
+
+@pytest.fixture(autouse=True)
+def instrumentation():
+    yield
+    disable_instrumentation()
+
+
+def test_disabled_by_default():
+    assert get_instrumentation() is None
+    assert not hasattr(Primer.__dict__["molecular_weight"].fget, "__wrapped__")
+
+
+def test_computes_and_hits():
+    oinstrumentation = enable_instrumentation()
+    assert get_instrumentation() is oinstrumentation
+    assert hasattr(Primer.__dict__["molecular_weight"].fget, "__wrapped__")
+    oprimer = Primer("ATCGATCGATCGATCGAT")
+    assert oprimer.molecular_weight == Primer("ATCGATCGATCGATCGAT").molecular_weight
+    oprimer.molecular_weight
+    Primer("CTGGAGGACGGAAGAGGAAGTAA").molecular_weight
+    stats = oinstrumentation.snapshot()["molecular_weight"]
+    assert stats.computes == 3
+    assert stats.hits == 1
+    assert stats.time > 0
+    assert stats.lengths == {18: 2, 23: 1}
+
+
+def test_melting_temperature():
+    oinstrumentation = enable_instrumentation()
+    oprimer = Primer("ATCGATCGATCGATCGAT")
+    oprimer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+    oprimer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+    oprimer.melting_temperature()
+    snapshot = oinstrumentation.snapshot()
+    assert snapshot["nearest_neighbor_melting_temperature"][:2] == (1, 1)
+    assert snapshot["basic_melting_temperature"][:2] == (1, 0)
+    # the thermodynamic constants are computed inside the nearest neighbor method, and recorded separately
+    assert snapshot["delta_h"][:2] == (1, 0) and snapshot["delta_h"].lengths == {18: 1}
+    assert snapshot["delta_s"][:2] == (0, 1)
+    oprimer.delta_h
+    assert oinstrumentation.snapshot()["delta_h"][:2] == (1, 1)
+
+
+def test_exclusive_time():
+    events = []
+    oinstrumentation = enable_instrumentation(callback=events.append)
+    start = time.perf_counter()
+    Primer("ATCGATCGATCGATCGAT").melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+    elapsed = time.perf_counter() - start
+    # the nested accesses are recorded before the access that contains them, and their time is not counted twice
+    assert [event.name for event in events] == ["delta_h", "delta_s", "nearest_neighbor_melting_temperature"]
+    assert all(event.duration >= 0 for event in events)
+    assert sum(stats.time for stats in oinstrumentation.snapshot().values()) <= elapsed
+
+
+def test_profile():
+    oinstrumentation = enable_instrumentation()
+    oprimer = Primer("ATCGATCGATCGATCGAT")
+    oprimer.profile()
+    oprimer.profile()
+    snapshot = oinstrumentation.snapshot()
+    assert snapshot["profile"][:2] == (1, 1)
+    # the properties calculated in the single pass of profile are recorded as computes, without time
+    for name in ["molecular_weight", "gc_content", "E260", "delta_h", "nearest_neighbor_melting_temperature"]:
+        assert snapshot[name] == (1, 0, 0.0, {18: 1})
+    assert "hairpin" not in snapshot
+    oprimer.E260
+    oprimer.profile(hairpin=True)
+    snapshot = oinstrumentation.snapshot()
+    assert snapshot["E260"][:2] == (1, 1)
+    assert snapshot["hairpin"][:2] == (1, 0)
+    assert snapshot["profile"][:2] == (2, 1)
+
+
+def test_callback():
+    events = []
+    enable_instrumentation(callback=events.append)
+    oprimer = Primer("ATCGATCGATCGATCGAT")
+    oprimer.E260
+    oprimer.E260
+    assert [(event.name, event.sequence_length, event.cached) for event in events] == [
+        ("E260", 18, False), ("E260", 18, True)]
+    assert all(event.duration >= 0 for event in events)
+
+
+def test_reset_and_disable():
+    oinstrumentation = enable_instrumentation()
+    Primer("ATCGATCGATCGATCGAT").gc_clamp
+    oinstrumentation.reset()
+    assert oinstrumentation.snapshot() == {}
+    disable_instrumentation()
+    assert get_instrumentation() is None
+    assert not hasattr(Primer.__dict__["gc_clamp"].fget, "__wrapped__")
+    Primer("ATCGATCGATCGATCGAT").gc_clamp
+    assert oinstrumentation.snapshot() == {}
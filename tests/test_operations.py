@@ -1,4 +1,6 @@
-from opr import Primer
+import math
+import pytest
+from opr import Primer, Diagnostic, DiagnosticsMode, OPRBaseError, diagnostics_mode
 
 TEST_CASE_NAME = "Operations tests"
 
@@ -96,6 +98,67 @@ def test_multiply():
     assert oprimer_concat.sequence == "ATCGATCGATCGATCG"
 
 
+COMPOSED_PROPERTIES = ["molecular_weight", "gc_content", "delta_h", "delta_s", "E260"]
+
+
+def compute_properties(oprimer):
+    for attr in COMPOSED_PROPERTIES:
+        getattr(oprimer, attr)
+    return oprimer
+
+
+def assert_composed(oprimer):
+    oprimer_fresh = Primer(oprimer.sequence)
+    for attr in COMPOSED_PROPERTIES:
+        assert oprimer.is_computed(attr)
+        assert math.isclose(getattr(oprimer, attr), getattr(oprimer_fresh, attr), rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_addition_composition():
+    for first, second in [("ATCGGCTAAATCGGCTAA", "CTGGAGGACGGAAGAGGAAG"), ("A", "TTTTT"), ("GGGGG", "C"), ("A", "C")]:
+        assert_composed(compute_properties(Primer(first)) + compute_properties(Primer(second)))
+
+
+def test_addition_composition_partial():
+    oprimer_1 = compute_properties(Primer("ATCGGCTAAATCGGCTAA"))
+    oprimer_2 = Primer("CTGGAGGACGGAAGAGGAAG")
+    oprimer_2.molecular_weight
+    oprimer_concat = oprimer_1 + oprimer_2
+    assert oprimer_concat.is_computed("molecular_weight")
+    assert not oprimer_concat.is_computed("E260")
+    assert math.isclose(oprimer_concat.molecular_weight, Primer(oprimer_concat.sequence).molecular_weight)
+
+
+def test_multiply_composition():
+    for sequence in ["ATCGGCTAAATCGGCTAA", "CG", "T"]:
+        for number in [1, 2, 3, 7, 16]:
+            assert_composed(compute_properties(Primer(sequence)) * number)
+    assert (compute_properties(Primer("ATCG")) * 0).sequence == ""
+
+
+def test_operations_not_validated():
+    oprimer = Primer("CTGGAGGACGGAAGAGGAAG")
+    with diagnostics_mode(DiagnosticsMode.RECORD):
+        oprimer_concat = oprimer + oprimer
+        oprimer_repeated = oprimer * 2
+        assert oprimer_concat == oprimer_repeated == Primer("CTGGAGGACGGAAGAGGAAG" * 2)
+    assert oprimer_concat.diagnostics & Diagnostic.LENGTH_OUT_OF_RANGE
+    assert oprimer_repeated.name == oprimer_concat.name == Primer("A" * 20).name
+
+
+def test_operations_length_diagnostic():
+    oprimer = Primer("ATCGGCTAATCGGCTAAT")
+    with pytest.warns(RuntimeWarning, match="The recommended range for primer length is between 18 and 30."):
+        oprimer * 2
+    with pytest.warns(RuntimeWarning, match="The recommended range for primer length is between 18 and 30."):
+        oprimer + oprimer
+    with diagnostics_mode(DiagnosticsMode.RAISE):
+        with pytest.raises(OPRBaseError, match="The recommended range for primer length is between 18 and 30."):
+            oprimer * 2
+        with pytest.raises(OPRBaseError, match="The recommended range for primer length is between 18 and 30."):
+            oprimer + oprimer
+
+
 def test_equality1():
     oprimer_1 = Primer("ATCG")
     oprimer_2 = Primer("ATCG")
@@ -149,3 +212,34 @@ def test_contains3():
 def test_contains4():
     oprimer = Primer("TCGAT")
     assert 2 not in oprimer
+
+
+def test_reverse_complement_1():
+    oprimer = Primer("ATCGGCTAAATCGGCTAAAT")
+    assert oprimer.reverse_complement() == oprimer.complement().reverse()
+    assert oprimer.reverse_complement() == Primer("ATTTAGCCGATTTAGCCGAT")
+
+
+def test_reverse_complement_2():
+    oprimer = Primer("ATCGGCTAAATCGGCTAAAT")
+    oprimer.reverse_complement(inplace=True)
+    assert oprimer.sequence == "ATTTAGCCGATTTAGCCGAT"
+    assert oprimer.reverse_complement().sequence == "ATCGGCTAAATCGGCTAAAT"
+    oprimer.complement(inplace=True)
+    assert oprimer.reverse_complement().sequence == "TAGCCGATTTAGCCGATTTA"
+
+
+
+def test_reverse_complement_3():
+    oprimer = Primer("ATCGGCTAAATCGGCTAAGG")
+    assert oprimer.gc_clamp == 2
+    assert oprimer.E260 == Primer("ATCGGCTAAATCGGCTAAGG").E260
+    assert oprimer.to_protein() == "IG*IG*"
+    oprimer.reverse_complement(inplace=True)
+    reference = Primer("CCTTAGCCGATTTAGCCGAT")
+    assert not oprimer.is_computed("gc_clamp")
+    assert oprimer.gc_clamp == reference.gc_clamp == 3
+    assert oprimer.E260 == reference.E260
+    assert oprimer.to_protein() == reference.to_protein()
+    oprimer.reverse(inplace=True)
+    assert oprimer.E260 == Primer("TAGCCGATTTAGCCGATTCC").E260
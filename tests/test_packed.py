@@ -0,0 +1,89 @@
+import pickle
+import random
+import pytest
+from opr import Primer, MeltingTemperature, PackedSequences, PrimerView, OPRBaseError
+from conftest import write_fasta
+
+TEST_CASE_NAME = "Packed sequences tests"
+
+
+def test_sequence_random(tmp_path):
+    random.seed(1)
+    records = [("chr1", "".join(random.choice("ATCGN") for _ in range(1001))),
+               ("chr2", "atcgNNNNatcgRYatcg"), ("chr3", ""),
+               ("chr4", "".join(random.choice("ATCG") for _ in range(3000)))]
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, records)
+    with PackedSequences.build(reference, tmp_path / "reference.2bit") as opacked:
+        assert opacked.names == ["chr1", "chr2", "chr3", "chr4"]
+        assert len(opacked) == 4
+        assert "chr2" in opacked and "chr5" not in opacked
+        for name, sequence in records:
+            sequence = sequence.upper()
+            assert opacked.length(name) == len(sequence)
+            assert opacked.sequence(name) == sequence.replace("R", "N").replace("Y", "N")
+            for _ in range(200):
+                start = random.randint(0, len(sequence))
+                end = random.randint(start, len(sequence))
+                assert opacked.sequence(name, start, end) == opacked.sequence(name)[start:end]
+
+
+def test_open(tmp_path):
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, [("chr1", "CTGGAGGACGGAAGAGGAAGTAA")])
+    PackedSequences.build(reference, tmp_path / "reference.2bit").close()
+    with PackedSequences(tmp_path / "reference.2bit") as opacked:
+        assert opacked.path == str(tmp_path / "reference.2bit")
+        assert opacked.sequence("chr1", 4, 8) == "AGGA"
+        assert pickle.loads(pickle.dumps(opacked)).sequence("chr1") == "CTGGAGGACGGAAGAGGAAGTAA"
+
+
+def test_view(tmp_path):
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, [("chr1", "NNNN"), ("chr2", "TTCTGGAGGACGGAAGAGGAAGTAATT")])
+    with PackedSequences.build(reference, tmp_path / "reference.2bit") as opacked:
+        oview = opacked.view("chr2", 2, 25)
+        oprimer = Primer("CTGGAGGACGGAAGAGGAAGTAA")
+        assert isinstance(oview, PrimerView) and isinstance(oview, Primer)
+        assert oview.record == "chr2" and oview.start == 2 and oview.end == 25
+        assert oview.name == "chr2:2-25"
+        assert oview.sequence == str(oview) == oprimer.sequence
+        assert len(oview) == 23
+        assert oview == oprimer
+        assert "GGAGG" in oview and oprimer in oview
+        assert oview.gc_content == oprimer.gc_content
+        assert oview.molecular_weight == oprimer.molecular_weight
+        assert oview.E260 == oprimer.E260
+        for method in MeltingTemperature:
+            assert oview.melting_temperature(method) == oprimer.melting_temperature(method)
+        assert oview.profile() == oprimer.profile()
+        assert oview.hairpin == oprimer.hairpin
+        assert oview.reverse_complement() == oprimer.reverse_complement()
+        assert oview.to_protein() == oprimer.to_protein()
+        assert oview + oprimer == oprimer * 2
+        assert list(oview.variants()) == list(oprimer.variants())
+        unpickled = pickle.loads(pickle.dumps(oview))
+        assert isinstance(unpickled, PrimerView) and unpickled == oprimer
+        with pytest.raises(OPRBaseError, match=r"Primer sequence should only contain the nucleotide bases A, T, C, and G."):
+            opacked.view("chr1")
+
+
+def test_view_inplace(tmp_path):
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, [("chr1", "CTGGAGGACGGAAGAGGAAGTAA")])
+    with PackedSequences.build(reference, tmp_path / "reference.2bit") as opacked:
+        oview = opacked.view("chr1")
+        oview.reverse(inplace=True)
+        assert oview.sequence == "AATGAAGGAGAAGGCAGGAGGTC"
+        assert opacked.sequence("chr1") == "CTGGAGGACGGAAGAGGAAGTAA"
+        unpickled = pickle.loads(pickle.dumps(oview))
+        assert type(unpickled) is Primer and unpickled.sequence == "AATGAAGGAGAAGGCAGGAGGTC"
+
+
+def test_windows(tmp_path):
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, [("chr1", "ATCGATNNATCGATCGATCG")])
+    with PackedSequences.build(reference, tmp_path / "reference.2bit") as opacked:
+        windows = list(opacked.windows("chr1", 5, step=2))
+        assert [(oview.start, oview.sequence) for oview in windows] == [
+            (0, "ATCGA"), (8, "ATCGA"), (10, "CGATC"), (12, "ATCGA"), (14, "CGATC")]
@@ -0,0 +1,104 @@
+import random
+from opr import Primer, PrimerBatch, MeltingTemperature, PrimerPair, design_pairs
+from opr.functions import reverse_complement_calc
+
+TEST_CASE_NAME = "Pair design tests"
+
+def random_case(seed):
+    random.seed(seed)
+    template = "".join(random.choice("ATCG") for _ in range(2000))
+    forward = []
+    reverse = []
+    for _ in range(60):
+        start = random.randrange(1980)
+        length = random.randint(18, 25)
+        forward.append(template[start:start + length])
+        start = random.randrange(1980)
+        reverse.append(reverse_complement_calc(template[start:start + length]))
+    return template, forward, reverse
+
+
+def sites(template, sequence):
+    return [start for start in range(len(template) - len(sequence) + 1) if template.startswith(sequence, start)]
+
+
+def brute_force_pairs(template, forward, reverse, product_size, max_difference, gc_range):
+    forward_sites = {sequence: sites(template, sequence) for sequence in forward}
+    reverse_sites = {sequence: sites(template, reverse_complement_calc(sequence)) for sequence in reverse}
+    pairs = []
+    for forward_sequence in forward:
+        for reverse_sequence in reverse:
+            oforward = Primer(forward_sequence)
+            oreverse = Primer(reverse_sequence)
+            if not all(gc_range[0] <= oprimer.gc_content <= gc_range[1] for oprimer in (oforward, oreverse)):
+                continue
+            difference = abs(oforward.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR) -
+                             oreverse.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR))
+            for forward_start in forward_sites[forward_sequence]:
+                for reverse_start in reverse_sites[reverse_sequence]:
+                    size = reverse_start + len(reverse_sequence) - forward_start
+                    if reverse_start >= forward_start and product_size[0] <= size <= product_size[1] and \
+                            difference <= max_difference:
+                        pairs.append(
+                            (forward_sequence, reverse_sequence, forward_start, reverse_start, size, difference))
+    return sorted(pairs)
+
+
+def as_tuples(pairs):
+    return sorted((pair.forward.sequence, pair.reverse.sequence, pair.forward_start, pair.reverse_start,
+                   pair.product_size, pair.melting_temperature_difference) for pair in pairs)
+
+
+def test_design_pairs():
+    template = "A" * 10 + "CTGGAGGACGGAAGAGGAAGTAA" + "T" * 200 + "GCATCCACTTCCTCTCCGTCAG" + "A" * 10
+    pairs = design_pairs(template, [Primer("CTGGAGGACGGAAGAGGAAGTAA")], [Primer("CTGACGGAGAGGAAGTGGATGC")])
+    assert pairs == [PrimerPair(Primer("CTGGAGGACGGAAGAGGAAGTAA"), Primer("CTGACGGAGAGGAAGTGGATGC"), 10, 233, 245,
+                                pairs[0].melting_temperature_difference)]
+    assert pairs[0].melting_temperature_difference < 5
+
+
+def test_design_pairs_binding_twice():
+    template = "A" * 10 + "CTGGAGGACGGAAGAGGAAGTAA" + "T" * 100 + "CTGGAGGACGGAAGAGGAAGTAA" + "T" * 100 + \
+        "GCATCCACTTCCTCTCCGTCAG" + "A" * 10
+    pairs = design_pairs(template, [Primer("CTGGAGGACGGAAGAGGAAGTAA")], [Primer("CTGACGGAGAGGAAGTGGATGC")])
+    assert [(pair.forward_start, pair.reverse_start, pair.product_size) for pair in pairs] == [
+        (10, 256, 268), (133, 256, 145)]
+    pairs = design_pairs(template, [Primer("CTGGAGGACGGAAGAGGAAGTAA")], [Primer("CTGACGGAGAGGAAGTGGATGC")],
+                         product_size=(100, 200))
+    assert [(pair.forward_start, pair.reverse_start, pair.product_size) for pair in pairs] == [(133, 256, 145)]
+
+
+def test_design_pairs_random():
+    for seed in range(3):
+        template, forward, reverse = random_case(seed)
+        for product_size, max_difference, gc_range in [((100, 1000), 5, (0.3, 0.7)), ((1, 2000), 2, (0, 1))]:
+            pairs = design_pairs(template, [Primer(sequence) for sequence in forward],
+                                 [Primer(sequence) for sequence in reverse], product_size, max_difference, gc_range)
+            assert as_tuples(pairs) == brute_force_pairs(template, forward, reverse, product_size, max_difference,
+                                                         gc_range)
+            assert [pair.melting_temperature_difference for pair in pairs] == sorted(
+                pair.melting_temperature_difference for pair in pairs)
+
+
+def test_design_pairs_batch():
+    template, forward, reverse = random_case(3)
+    pairs = design_pairs(template, PrimerBatch(forward), PrimerBatch(reverse))
+    assert as_tuples(pairs) == as_tuples(design_pairs(
+        template, [Primer(sequence) for sequence in forward], [Primer(sequence) for sequence in reverse]))
+
+
+def test_design_pairs_top_k():
+    template, forward, reverse = random_case(4)
+    pairs = design_pairs(template, PrimerBatch(forward), PrimerBatch(reverse), product_size=(1, 2000))
+    top_pairs = design_pairs(template, PrimerBatch(forward), PrimerBatch(reverse), product_size=(1, 2000), top_k=3)
+    assert top_pairs == pairs[:3]
+    top_pairs = design_pairs(template, PrimerBatch(forward), PrimerBatch(reverse), product_size=(1, 2000), top_k=3,
+                             penalty=lambda pair: -pair.product_size)
+    assert [pair.product_size for pair in top_pairs] == sorted((pair.product_size for pair in pairs), reverse=True)[:3]
+
+
+def test_design_pairs_cached_melting_temperature():
+    template = "A" * 10 + "CTGGAGGACGGAAGAGGAAGTAA" + "T" * 200 + "GCATCCACTTCCTCTCCGTCAG" + "A" * 10
+    oforward = Primer("CTGGAGGACGGAAGAGGAAGTAA")
+    design_pairs(template, [oforward], [Primer("CTGACGGAGAGGAAGTGGATGC")])
+    assert oforward.is_computed("melting_temperature")[MeltingTemperature.NEAREST_NEIGHBOR]
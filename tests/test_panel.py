@@ -0,0 +1,72 @@
+from opr import Primer, MeltingTemperature, Panel, PanelInteraction, dimer_matrix, cross_dimer
+from conftest import random_primers
+
+TEST_CASE_NAME = "Panel tests"
+
+
+def brute_force_shared_kmers(first, second, seed_length):
+    def seeds(sequence):
+        return {sequence[i:i + seed_length] for i in range(len(sequence) - seed_length + 1)}
+    return len(seeds(first.sequence) & seeds(second.sequence))
+
+
+def test_panel():
+    primers = [Primer("CTGGAGGACGGAAGAGGAAGTAA"), Primer("TTACTTCCTCTTCCGTCCTCCAG"), Primer("ATCGATCGATCGATCGAT")]
+    opanel = Panel(primers)
+    assert len(opanel) == 3
+    assert [key for key, _ in opanel] == [0, 1, 2]
+    assert opanel[1] == primers[1]
+    interaction = opanel.interactions_of(0)[0]
+    assert interaction == PanelInteraction(0, 1, cross_dimer(primers[0], primers[1]), 0)
+    assert interaction.dimer.end_complementarity == 23
+    assert opanel.worst(top_k=1) == [interaction]
+
+
+def test_panel_random():
+    primers = random_primers(1, 150)
+    opanel = Panel(primers, seed_length=5)
+    assert [(item.first, item.second, item.dimer) for item in opanel.interactions if item.dimer is not None] == \
+        dimer_matrix(primers, seed_length=5)
+    for item in opanel.interactions:
+        if item.first != item.second:
+            assert item.shared_kmers == brute_force_shared_kmers(primers[item.first], primers[item.second], 5)
+
+
+def test_panel_incremental():
+    primers = random_primers(2, 60)
+    opanel = Panel(primers)
+    removed = opanel.remove(10)
+    assert removed.key == 10
+    assert all(10 in item[:2] for item in removed.interactions)
+    assert 10 not in opanel
+    added = opanel.add(primers[10])
+    assert added.key == 60
+    opanel_expected = Panel(primers[:10] + primers[11:] + [primers[10]])
+
+    def renumber(key):
+        return key if key < 10 else (key - 1 if key < 60 else 59)
+    assert sorted(
+        (renumber(item.first), renumber(item.second), item.dimer, item.shared_kmers) for item in opanel.interactions
+    ) == sorted(tuple(item) for item in opanel_expected.interactions)
+    assert len(opanel.interactions_of(60)) == len(added.interactions)
+
+
+def test_melting_temperature_spread():
+    primers = random_primers(3, 20)
+    opanel = Panel(primers, method=MeltingTemperature.BASIC)
+    melting_temperatures = [primer.melting_temperature(MeltingTemperature.BASIC) for primer in primers]
+    assert opanel.melting_temperature_spread == max(melting_temperatures) - min(melting_temperatures)
+    assert opanel.melting_temperatures[4] == melting_temperatures[4]
+    assert Panel().melting_temperature_spread == 0
+
+
+def test_worst():
+    opanel = Panel(random_primers(4, 80))
+    worst = opanel.worst(top_k=5)
+    assert len(worst) == 5
+    end_complementarities = [item.dimer.end_complementarity for item in worst]
+    assert end_complementarities == sorted(end_complementarities, reverse=True)
+    assert end_complementarities[0] == max(
+        item.dimer.end_complementarity for item in opanel.interactions if item.dimer is not None)
+    assert opanel.worst(top_k=1, key=lambda item: -item.shared_kmers)[0].shared_kmers == max(
+        item.shared_kmers for item in opanel.interactions)
@@ -0,0 +1,42 @@
+from opr import Primer, MeltingTemperature, analyze_many
+
+TEST_CASE_NAME = "Parallel tests"
+
+SEQUENCES = ["CTGGAGGACGGAAGAGGAAGTAA", "ATCGATCGATCGATCGAT", "AAAAACCCCCGGGGGTTTTT", "ATCG", "GGGCCCATATCGCGAT"] * 7
+
+
+def test_analyze_many_1():
+    results = analyze_many(SEQUENCES, chunk_size=4)
+    assert len(results) == len(SEQUENCES)
+    for sequence, result in zip(SEQUENCES, results):
+        oprimer = Primer(sequence)
+        assert result == {
+            "molecular_weight": oprimer.molecular_weight,
+            "gc_content": oprimer.gc_content,
+            "gc_clamp": oprimer.gc_clamp,
+            "E260": oprimer.E260,
+            "delta_h": oprimer.delta_h,
+            "delta_s": oprimer.delta_s,
+        }
+
+
+def test_analyze_many_2():
+    properties = ["gc_content", MeltingTemperature.NEAREST_NEIGHBOR]
+    primers = [Primer(sequence, salt=65) for sequence in SEQUENCES]
+    results = analyze_many(primers, properties=properties, workers=2, chunk_size=3, salt=65)
+    for oprimer, result in zip(primers, results):
+        assert result["gc_content"] == oprimer.gc_content
+        assert result[MeltingTemperature.NEAREST_NEIGHBOR] == oprimer.melting_temperature(
+            MeltingTemperature.NEAREST_NEIGHBOR)
+
+
+def test_analyze_many_unordered():
+    results = analyze_many(iter(SEQUENCES), properties=["molecular_weight"], workers=2, chunk_size=2, ordered=False)
+    results = dict(results)
+    assert sorted(results) == list(range(len(SEQUENCES)))
+    for index, sequence in enumerate(SEQUENCES):
+        assert results[index]["molecular_weight"] == Primer(sequence).molecular_weight
+
+
+def test_analyze_many_empty():
+    assert analyze_many([]) == []
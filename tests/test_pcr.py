@@ -0,0 +1,129 @@
+import random
+import pytest
+from opr import Primer, MeltingTemperature, KmerIndex, BindingSite, Diagnostic
+from opr import DiagnosticsMode, diagnostics_mode, get_diagnostics_mode
+from opr import Amplicon, predict_amplicons, binding_melting_temperature
+from opr.functions import complement_calc, reverse_complement_calc
+from conftest import write_fasta
+
+TEST_CASE_NAME = "In-silico PCR tests"
+
+def random_sequence(length):
+    return "".join(random.choice("ATCG") for _ in range(length))
+
+
+def test_binding_melting_temperature():
+    primer = Primer("CTGGAGGACGGAAGAGGAAGTAA")
+    assert binding_melting_temperature(primer.sequence, primer.sequence) == pytest.approx(
+        primer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR))
+    middle = binding_melting_temperature(primer.sequence, primer.sequence[:11] + "T" + primer.sequence[12:])
+    end = binding_melting_temperature(primer.sequence, primer.sequence[:-1] + "T")
+    assert middle < end < primer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+
+
+def test_predict_amplicons(tmp_path):
+    random.seed(2)
+    forward = random_sequence(20)
+    reverse = random_sequence(22)
+    insert = random_sequence(200)
+    chr1 = random_sequence(300) + forward + insert + reverse_complement_calc(reverse) + random_sequence(300)
+    chr2 = random_sequence(500)
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, [("chr2", chr2), ("chr1", chr1)])
+    with KmerIndex.build(reference, tmp_path / "reference.idx", k=8) as oindex:
+        forward_primer = Primer(forward, "forward")
+        reverse_primer = Primer(reverse, "reverse")
+        amplicons = predict_amplicons(oindex, [(forward_primer, reverse_primer)], max_mismatches=0)
+        assert len(amplicons) == 1
+        amplicon = amplicons[0]
+        assert amplicon[:9] == (0, "chr1", 300, 542, 242, forward_primer, reverse_primer,
+                                BindingSite("chr1", 300, "+", 0), BindingSite("chr1", 520, "-", 0))
+        assert amplicon.forward_melting_temperature == pytest.approx(
+            forward_primer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR))
+        assert amplicon.reverse_melting_temperature == pytest.approx(
+            reverse_primer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR))
+        assert amplicon.product.sequence == chr1[300:542]
+        assert amplicon.product.name == "chr1:300-542"
+        assert amplicon.product.diagnostics & Diagnostic.LENGTH_OUT_OF_RANGE
+        assert amplicon.product.gc_content == pytest.approx(
+            sum(base in "GC" for base in chr1[300:542]) / 242)
+        with diagnostics_mode(DiagnosticsMode.RAISE):
+            assert predict_amplicons(oindex, [(forward_primer, reverse_primer)], max_mismatches=0) == amplicons
+            assert get_diagnostics_mode() == DiagnosticsMode.RAISE
+        swapped = predict_amplicons(oindex, [(reverse_primer, forward_primer)], max_mismatches=0)
+        assert [item._replace(pair=0) for item in swapped] == amplicons
+        assert predict_amplicons(oindex, [(forward_primer, reverse_primer)], max_mismatches=0,
+                                 product_size=(50, 200)) == []
+
+
+def test_predict_amplicons_mismatches(tmp_path):
+    random.seed(3)
+    forward = random_sequence(20)
+    reverse = random_sequence(20)
+    mutated = forward[:10] + complement_calc(forward[10]) + forward[11:]
+    template = random_sequence(100) + mutated + random_sequence(100) + reverse_complement_calc(reverse) + \
+        random_sequence(100)
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, [("template", template)])
+    with KmerIndex.build(reference, tmp_path / "reference.idx", k=6) as oindex:
+        pair = (Primer(forward), Primer(reverse))
+        assert predict_amplicons(oindex, [pair], max_mismatches=0) == []
+        amplicons = predict_amplicons(oindex, [pair], max_mismatches=1)
+        assert len(amplicons) == 1
+        assert amplicons[0].forward_site == BindingSite("template", 100, "+", 1)
+        assert amplicons[0].forward_melting_temperature == pytest.approx(
+            binding_melting_temperature(forward, mutated))
+        assert amplicons[0].forward_melting_temperature < pair[0].melting_temperature(
+            MeltingTemperature.NEAREST_NEIGHBOR)
+
+
+def test_predict_amplicons_single_primer(tmp_path):
+    random.seed(4)
+    primer = random_sequence(20)
+    template = random_sequence(100) + primer + random_sequence(150) + reverse_complement_calc(primer) + \
+        random_sequence(100)
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, [("template", template + "N" + template)])
+    with KmerIndex.build(reference, tmp_path / "reference.idx", k=8) as oindex:
+        oprimer = Primer(primer)
+        amplicons = predict_amplicons(oindex, [(oprimer, Primer(random_sequence(20)))], max_mismatches=0,
+                                      product_size=(50, 400))
+        assert [(amplicon.start, amplicon.end) for amplicon in amplicons] == [(100, 290), (491, 681)]
+        assert all(amplicon.forward is oprimer and amplicon.reverse is oprimer for amplicon in amplicons)
+        amplicons = predict_amplicons(oindex, [(oprimer, oprimer)], max_mismatches=0, product_size=(50, 1000))
+        assert [(amplicon.start, amplicon.end) for amplicon in amplicons] == [(100, 290), (100, 681), (491, 681)]
+        assert amplicons[1].product is None
+        assert isinstance(amplicons[0], Amplicon)
+
+
+def test_predict_amplicons_random(tmp_path):
+    random.seed(5)
+    records = [("chr{0}".format(index), random_sequence(2000)) for index in range(3)]
+    reference = tmp_path / "reference.fasta"
+    write_fasta(reference, records)
+    pairs = []
+    for name, sequence in records:
+        start = random.randint(0, 1000)
+        end = start + random.randint(100, 900)
+        pairs.append((Primer(sequence[start:start + 20]), Primer(reverse_complement_calc(sequence[end - 20:end]))))
+    with KmerIndex.build(reference, tmp_path / "reference.idx", k=8) as oindex:
+        amplicons = predict_amplicons(oindex, pairs, max_mismatches=1, product_size=(50, 1000))
+        for pair_index, (forward, reverse) in enumerate(pairs):
+            expected = []
+            for name, sequence in records:
+                sites = []
+                for primer in {primer.sequence: primer for primer in (forward, reverse)}.values():
+                    for position in range(len(sequence) - len(primer) + 1):
+                        region = sequence[position:position + len(primer)]
+                        for strand, query in (("+", primer.sequence), ("-", reverse_complement_calc(primer.sequence))):
+                            if sum(1 for first, second in zip(query, region) if first != second) <= 1:
+                                sites.append((strand, position, position + len(primer)))
+                for strand, start, _ in sites:
+                    for other_strand, other_start, end in sites:
+                        if strand == "+" and other_strand == "-" and other_start >= start and \
+                                50 <= end - start <= 1000:
+                            expected.append((name, start, end))
+            found = [(amplicon.name, amplicon.start, amplicon.end) for amplicon in amplicons
+                     if amplicon.pair == pair_index]
+            assert found == sorted(expected, key=lambda item: (int(item[0][3:]), item[1], item[2]))
+            assert found
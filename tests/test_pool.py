@@ -0,0 +1,50 @@
+from opr import MeltingTemperature, Pool, assign_pools, dimer_conflict, cross_dimer
+from conftest import random_primers
+
+TEST_CASE_NAME = "Pool assignment tests"
+
+
+def same_3_end(primer1, primer2):
+    return primer1.sequence[-1] == primer2.sequence[-1]
+
+
+def test_assign_pools():
+    primers = random_primers(1, 300)
+    pools = assign_pools(primers, same_3_end, max_melting_temperature_range=4, max_pool_size=3)
+    assert sorted(index for pool in pools for index in pool.indices) == list(range(300))
+    for pool in pools:
+        melting_temperatures = [primers[index].melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+                                for index in pool.indices]
+        assert pool == Pool(pool.indices, min(melting_temperatures), max(melting_temperatures))
+        assert pool.highest_melting_temperature - pool.lowest_melting_temperature <= 4
+        assert len(pool.indices) <= 3
+        assert len({primers[index].sequence[-1] for index in pool.indices}) == len(pool.indices)
+    lowest_melting_temperatures = [pool.lowest_melting_temperature for pool in pools]
+    assert lowest_melting_temperatures == sorted(lowest_melting_temperatures)
+
+
+def test_assign_pools_balanced():
+    primers = random_primers(2, 100)
+    pools = assign_pools(primers, max_melting_temperature_range=100, max_pool_size=30)
+    assert sorted(len(pool.indices) for pool in pools) == [25, 25, 25, 25]
+    assert len(assign_pools(primers, max_melting_temperature_range=100)) == 1
+
+
+def test_assign_pools_seed():
+    primers = random_primers(3, 200)
+    conflict = dimer_conflict(4, 8)
+    pools = assign_pools(primers, conflict, max_pool_size=20, seed=5)
+    assert pools == assign_pools(primers, conflict, max_pool_size=20, seed=5)
+    for pool in pools:
+        for first in pool.indices:
+            for second in pool.indices:
+                assert first == second or not conflict(primers[first], primers[second])
+
+
+def test_dimer_conflict():
+    primers = random_primers(4, 40)
+    conflict = dimer_conflict(min_end_complementarity=4, min_complementarity=6)
+    for primer1 in primers:
+        for primer2 in primers:
+            dimer = cross_dimer(primer1, primer2)
+            assert conflict(primer1, primer2) == (dimer.end_complementarity >= 4 or dimer.longest_complementarity >= 6)
@@ -0,0 +1,66 @@
+import pickle
+import random
+from opr import Primer, FrozenPrimer, PrimerSet, PrimerOccurrence
+from opr.functions import reverse_complement_calc
+
+TEST_CASE_NAME = "Primer set tests"
+
+def test_frozen_primer_hash():
+    oprimer = FrozenPrimer("ATCGATCGATCGATCGAT", name="forward")
+    assert hash(oprimer) == hash(FrozenPrimer("atcgatcgatcgatcgat"))
+    assert oprimer == Primer("ATCGATCGATCGATCGAT")
+    assert len({oprimer, FrozenPrimer("ATCGATCGATCGATCGAT"), FrozenPrimer("ATCGATCGATCGATCGAA")}) == 2
+    assert {oprimer: 1}[FrozenPrimer("ATCGATCGATCGATCGAT")] == 1
+    unpickled = pickle.loads(pickle.dumps(oprimer))
+    assert type(unpickled) is FrozenPrimer and hash(unpickled) == hash(oprimer) and unpickled.name == "forward"
+
+
+def test_frozen_primer_operations():
+    oprimer = FrozenPrimer("ATCGATCGATCGATCGAA")
+    assert oprimer.reverse().sequence == "AAGCTAGCTAGCTAGCTA"
+    assert oprimer.complement().sequence == "TAGCTAGCTAGCTAGCTT"
+    assert oprimer.reverse_complement().sequence == "TTCGATCGATCGATCGAT"
+    assert oprimer.gc_content == Primer("ATCGATCGATCGATCGAA").gc_content
+
+
+def test_find():
+    oforward = Primer("CTGGAGGACGGAAGAGGAAGTAA")
+    oreverse = Primer("GACTCAACTGCCTCCTTCTGCTA")
+    sequence = "AA" + oforward.sequence + "TT" + reverse_complement_calc(oreverse.sequence) + "GG" + oforward.sequence
+    oprimer_set = PrimerSet([oforward, oreverse, oforward])
+    assert len(oprimer_set) == 2
+    assert oforward in oprimer_set and "gactcaactgcctccttctgcta" in oprimer_set
+    assert Primer("ATCGATCGATCGATCGAT") not in oprimer_set and 1 not in oprimer_set
+    assert all(isinstance(oprimer, FrozenPrimer) for oprimer in oprimer_set)
+    assert oprimer_set.find(sequence) == [
+        PrimerOccurrence(FrozenPrimer(oforward.sequence), 2, "+"),
+        PrimerOccurrence(FrozenPrimer(oreverse.sequence), 27, "-"),
+        PrimerOccurrence(FrozenPrimer(oforward.sequence), 52, "+")]
+    assert PrimerSet([oreverse], reverse_complements=False).find(sequence) == []
+    assert PrimerSet().find(sequence) == []
+
+
+def test_find_palindrome():
+    oprimer_set = PrimerSet([Primer("GAATTC")])
+    assert oprimer_set.find("NNGAATTCNNgaattc") == [
+        PrimerOccurrence(FrozenPrimer("GAATTC"), 2, "+"), PrimerOccurrence(FrozenPrimer("GAATTC"), 10, "+")]
+
+
+def test_find_random():
+    random.seed(3)
+    sequence = "".join(random.choice("ATCGN") for _ in range(5000))
+    patterns = [sequence[start:start + random.randint(3, 8)].replace("N", "A")
+                for start in random.sample(range(4990), 60)] + ["ACGT", "AAAA", "TTTT"]
+    primers = [Primer(pattern) for pattern in patterns]
+    unique_patterns = list(dict.fromkeys(pattern.upper() for pattern in patterns))
+    expected = []
+    for index, pattern in enumerate(unique_patterns):
+        for position in range(len(sequence) - len(pattern) + 1):
+            region = sequence[position:position + len(pattern)]
+            if region == pattern:
+                expected.append((position, index, "+"))
+            if pattern != reverse_complement_calc(pattern) and region == reverse_complement_calc(pattern):
+                expected.append((position, index, "-"))
+    found = [(occurrence.position, unique_patterns.index(occurrence.primer.sequence), occurrence.strand)
+             for occurrence in PrimerSet(primers).find(sequence)]
+    assert found == sorted(expected)
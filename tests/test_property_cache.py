@@ -0,0 +1,87 @@
+import threading
+import pytest
+from opr import Primer, MeltingTemperature, PropertyCache
+from opr import enable_property_cache, disable_property_cache, get_property_cache
+
+TEST_CASE_NAME = "Property cache tests"
+
+
+@pytest.fixture(autouse=True)
+def property_cache():
+    yield
+    disable_property_cache()
+
+
+def test_disabled_by_default():
+    assert get_property_cache() is None
+    Primer("ATCGATCGATCGATCGAT").E260
+    assert get_property_cache() is None
+
+
+def test_shared_between_instances():
+    ocache = enable_property_cache(maxsize=100)
+    assert get_property_cache() is ocache
+    oprimer1 = Primer("ATCGATCGATCGATCGAT")
+    values = [oprimer1.molecular_weight, oprimer1.E260, oprimer1.delta_h, oprimer1.delta_s] + \
+        [oprimer1.melting_temperature(method) for method in MeltingTemperature]
+    info = ocache.info()
+    assert info.hits == 0 and info.currsize == 6
+    oprimer2 = Primer("ATCGATCGATCGATCGAT")
+    assert [oprimer2.molecular_weight, oprimer2.E260, oprimer2.delta_h, oprimer2.delta_s] + \
+        [oprimer2.melting_temperature(method) for method in MeltingTemperature] == values
+    info = ocache.info()
+    assert info.hits == 6 and info.misses == 6 and info.currsize == 6
+
+
+def test_salt_in_key():
+    ocache = enable_property_cache(maxsize=100)
+    melting_temperature_1 = Primer("ATCGATCGATCGATCGAT", salt=50).melting_temperature(MeltingTemperature.SALT_ADJUSTED)
+    melting_temperature_2 = Primer("ATCGATCGATCGATCGAT", salt=100).melting_temperature(MeltingTemperature.SALT_ADJUSTED)
+    assert melting_temperature_1 != melting_temperature_2
+    assert ocache.info().hits == 0
+    melting_temperature_3 = Primer("ATCGATCGATCGATCGAT", salt=100).melting_temperature(MeltingTemperature.SALT_ADJUSTED)
+    assert melting_temperature_3 == melting_temperature_2
+    assert ocache.info().hits == 1
+
+
+def test_lru_eviction():
+    ocache = enable_property_cache(maxsize=2)
+    Primer("ATCGATCGATCGATCGAT").E260
+    Primer("CTGGAGGACGGAAGAGGAAGTAA").E260
+    Primer("ATCGATCGATCGATCGAT").E260
+    Primer("GGGGCCAAAAGGCCCCATAT").E260
+    assert len(ocache) == 2
+    Primer("ATCGATCGATCGATCGAT").E260
+    assert ocache.info().hits == 2
+    Primer("CTGGAGGACGGAAGAGGAAGTAA").E260
+    assert ocache.info().misses == 4
+
+
+def test_clear_and_resize():
+    ocache = enable_property_cache(maxsize=10)
+    for sequence in ["ATCGATCGATCGATCGAT", "CTGGAGGACGGAAGAGGAAGTAA", "GGGGCCAAAAGGCCCCATAT"]:
+        Primer(sequence).E260
+    ocache.resize(1)
+    assert ocache.info().maxsize == 1 and len(ocache) == 1
+    assert enable_property_cache(maxsize=5) is ocache
+    assert ocache.info().maxsize == 5
+    ocache.clear()
+    assert ocache.info() == (0, 0, 5, 0)
+
+
+def test_thread_safety():
+    ocache = PropertyCache(maxsize=50)
+    sequences = ["".join("ATCG"[(index >> shift) & 3] for shift in range(0, 20, 2)) for index in range(200)]
+
+    def worker():
+        for sequence in sequences:
+            ocache.get(("length", sequence), lambda: len(sequence))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = ocache.info()
+    assert info.hits + info.misses == 8 * 200
+    assert info.currsize == 50
@@ -0,0 +1,79 @@
+import io
+import gzip
+from opr import Primer, PrimerBatch, SequenceFormat, read_primers, read_records
+
+TEST_CASE_NAME = "Reader tests"
+
+FASTA = ">primer1 forward\nCTGGAGGACGG\nAAGAGGAAGTAA\n\n>primer2\natcgatcgatcgatcgat\n"
+FASTQ = "@primer1\nCTGGAGGACGGAAGAGGAAGTAA\n+\nIIIIIIIIIIIIIIIIIIIIIII\n@primer2\nATCGATCGATCGATCGAT\n+\nIIIIIIIIIIIIIIIIII\n"
+PLAIN = "CTGGAGGACGGAAGAGGAAGTAA\n\nATCGATCGATCGATCGAT\n"
+
+
+def test_read_fasta(tmp_path):
+    path = tmp_path / "primers.fasta"
+    path.write_text(FASTA)
+    primers = list(read_primers(path))
+    assert primers == [Primer("CTGGAGGACGGAAGAGGAAGTAA"), Primer("ATCGATCGATCGATCGAT")]
+    assert [oprimer.name for oprimer in primers] == ["primer1 forward", "primer2"]
+
+
+def test_read_fastq(tmp_path):
+    path = tmp_path / "primers.fastq"
+    path.write_text(FASTQ)
+    assert list(read_records(path)) == [("primer1", "CTGGAGGACGGAAGAGGAAGTAA"), ("primer2", "ATCGATCGATCGATCGAT")]
+
+
+def test_read_fastq_blank_lines():
+    fastq = "\n@primer1\nCTGGAGGACGGAAGAGGAAGTAA\n+\nIIIIIIIIIIIIIIIIIIIIIII\n\n@empty\n\n+\n\n" \
+            "@primer2\nATCGATCGATCGATCGAT\n+\nIIIIIIIIIIIIIIIIII\n\n"
+    assert list(read_records(io.StringIO(fastq))) == [
+        ("primer1", "CTGGAGGACGGAAGAGGAAGTAA"), ("empty", ""), ("primer2", "ATCGATCGATCGATCGAT")]
+
+
+def test_read_plain(tmp_path):
+    path = tmp_path / "primers.txt"
+    path.write_text(PLAIN)
+    assert list(read_records(path)) == [("unknown", "CTGGAGGACGGAAGAGGAAGTAA"), ("unknown", "ATCGATCGATCGATCGAT")]
+
+
+def test_read_gzip(tmp_path):
+    path = tmp_path / "primers.fasta.gz"
+    with gzip.open(path, "wt") as file:
+        file.write(FASTA)
+    assert [name for name, _ in read_records(path)] == ["primer1 forward", "primer2"]
+
+
+def test_read_file_object():
+    records = list(read_records(io.StringIO(PLAIN), file_format=SequenceFormat.PLAIN))
+    assert len(records) == 2
+
+
+def test_read_empty():
+    assert list(read_primers(io.StringIO(""))) == []
+
+
+def test_read_batches():
+    batches = list(read_primers(io.StringIO(FASTA * 3), batch_size=4, salt=65))
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert all(isinstance(batch, PrimerBatch) for batch in batches)
+    assert batches[1].names == ["primer1 forward", "primer2"]
+    assert batches[0].salt == 65
+    assert list(batches[1].molecular_weight) == [
+        Primer("CTGGAGGACGGAAGAGGAAGTAA").molecular_weight,
+        Primer("ATCGATCGATCGATCGAT").molecular_weight]
+
+
+class LineStream:
+    def __init__(self, text):
+        self._lines = text.splitlines(keepends=True)
+
+    def read(self):
+        return "".join(self._lines)
+
+    def __iter__(self):
+        return iter(self._lines)
+
+
+def test_read_records_duck_typed_stream():
+    assert list(read_records(LineStream(FASTA))) == [
+        ("primer1 forward", "CTGGAGGACGGAAGAGGAAGTAA"), ("primer2", "atcgatcgatcgatcgat")]
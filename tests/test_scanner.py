@@ -0,0 +1,49 @@
+import random
+import pytest
+from opr import Primer, MeltingTemperature, scan_windows
+
+TEST_CASE_NAME = "Scanner tests"
+
+random.seed(7)
+TEMPLATE = "".join(random.choice("ATCG") for _ in range(120))
+
+
+def test_scan_windows_1():
+    windows = list(scan_windows(TEMPLATE, min_length=1, max_length=8, salt=65))
+    assert len(windows) == sum(len(TEMPLATE) - length + 1 for length in range(1, 9))
+    for window in windows:
+        oprimer = Primer(window.sequence, salt=65)
+        assert window.sequence == TEMPLATE[window.start:window.start + len(window.sequence)]
+        assert window.gc_content == oprimer.gc_content
+        assert window.gc_clamp == oprimer.gc_clamp
+        assert window.basic_melting_temperature == oprimer.melting_temperature(MeltingTemperature.BASIC)
+        assert window.salt_adjusted_melting_temperature == oprimer.melting_temperature(MeltingTemperature.SALT_ADJUSTED)
+        assert window.delta_h == pytest.approx(oprimer.delta_h, abs=1e-9)
+        assert window.delta_s == pytest.approx(oprimer.delta_s, abs=1e-9)
+        assert window.E260 == pytest.approx(oprimer.E260, abs=1e-9)
+        assert window.nearest_neighbor_melting_temperature == pytest.approx(
+            oprimer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR), abs=1e-6)
+
+
+def test_scan_windows_2():
+    windows = list(scan_windows(TEMPLATE))
+    assert [(window.start, len(window.sequence)) for window in windows[:3]] == [(0, 18), (0, 19), (0, 20)]
+    assert len(windows) == sum(len(TEMPLATE) - length + 1 for length in range(18, 31))
+
+
+def test_scan_windows_invalid_bases():
+    windows = list(scan_windows("ATCGNNATCGAT", min_length=4, max_length=4))
+    assert [window.sequence for window in windows] == ["ATCG", "ATCG", "TCGA", "CGAT"]
+
+
+def test_scan_windows_predicate():
+    windows = list(scan_windows(TEMPLATE, predicate=lambda window: window.gc_clamp >= 3 and window.gc_content >= 0.5))
+    assert windows
+    assert all(window.gc_clamp >= 3 and window.gc_content >= 0.5 for window in windows)
+
+
+def test_scan_windows_top_k():
+    def key(window): return window.nearest_neighbor_melting_temperature
+    windows = list(scan_windows(TEMPLATE))
+    best = scan_windows(TEMPLATE, top_k=5, key=key)
+    assert best == sorted(windows, key=key, reverse=True)[:5]
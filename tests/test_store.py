@@ -0,0 +1,116 @@
+import pytest
+from opr import Primer, PrimerBatch, MeltingTemperature, analyze_many
+from opr import open_property_store, close_property_store, get_property_store
+from opr import params
+from opr.store import PropertyStore, property_store_version
+
+TEST_CASE_NAME = "Property store tests"
+
+SEQUENCES = ["ATCGATCGATCGATCGAT", "CTGGAGGACGGAAGAGGAAGTAA", "GGGGCCAAAAGGCCCCATAT"]
+
+
+@pytest.fixture(autouse=True)
+def property_store():
+    yield
+    close_property_store()
+
+
+def test_primer_write_and_read(tmp_path):
+    path = tmp_path / "properties.db"
+    ostore = open_property_store(path)
+    assert get_property_store() is ostore
+    oprimer = Primer("ATCGATCGATCGATCGAT")
+    e260 = oprimer.E260
+    delta_h = oprimer.delta_h
+    melting_temperature = oprimer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR)
+    assert len(ostore) == 3
+    close_property_store()
+    ostore = open_property_store(path)
+    assert len(ostore) == 3
+    # stored results are read instead of being calculated
+    ostore.put_many("E260", "", [("ATCGATCGATCGATCGAT", 1.5)])
+    assert Primer("ATCGATCGATCGATCGAT").E260 == 1.5
+    oprimer = Primer("ATCGATCGATCGATCGAT")
+    assert oprimer.delta_h == delta_h
+    assert oprimer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR) == melting_temperature
+    assert e260 != 1.5
+
+
+def test_salt_in_key(tmp_path):
+    ostore = open_property_store(tmp_path / "properties.db")
+    melting_temperature_1 = Primer("ATCGATCGATCGATCGAT", salt=50).melting_temperature(MeltingTemperature.SALT_ADJUSTED)
+    melting_temperature_2 = Primer("ATCGATCGATCGATCGAT", salt=100).melting_temperature(MeltingTemperature.SALT_ADJUSTED)
+    assert melting_temperature_1 != melting_temperature_2
+    assert len(ostore) == 2
+    assert Primer("ATCGATCGATCGATCGAT", salt=50.0).melting_temperature(
+        MeltingTemperature.SALT_ADJUSTED) == melting_temperature_1
+    assert len(ostore) == 2
+
+
+def test_batch(tmp_path):
+    expected = PrimerBatch(SEQUENCES + SEQUENCES[:1])
+    ostore = open_property_store(tmp_path / "properties.db")
+    Primer(SEQUENCES[0]).E260
+    assert len(ostore) == 1
+    obatch = PrimerBatch(SEQUENCES + SEQUENCES[:1])
+    assert obatch.E260 == expected.E260
+    assert len(ostore) == 3
+    assert obatch.molecular_weight == expected.molecular_weight
+    assert obatch.delta_h == expected.delta_h
+    assert obatch.delta_s == expected.delta_s
+    for method in MeltingTemperature:
+        assert obatch.melting_temperature(method) == expected.melting_temperature(method)
+    assert len(ostore) == 3 * 6
+    ostore.put_many("molecular_weight", "", [(SEQUENCES[1], 1.5)])
+    assert PrimerBatch(SEQUENCES).molecular_weight[1] == 1.5
+
+
+def test_analyze_many(tmp_path):
+    ostore = open_property_store(tmp_path / "properties.db")
+    results = analyze_many(SEQUENCES * 2, properties=["E260"], workers=2, chunk_size=2)
+    assert [result["E260"] for result in results] == [Primer(sequence).E260 for sequence in SEQUENCES * 2]
+    assert len(ostore) == 3
+
+
+def test_version(tmp_path, monkeypatch):
+    path = tmp_path / "properties.db"
+    ostore = open_property_store(path)
+    assert ostore.version == property_store_version()
+    Primer("ATCGATCGATCGATCGAT").E260
+    close_property_store()
+    assert len(open_property_store(path)) == 1
+    close_property_store()
+    monkeypatch.setitem(params.BASE_EXTINCTION_COEFFICIENTS, "A", 15.5)
+    assert len(open_property_store(path)) == 0
+    version = open_property_store(path).version
+    close_property_store()
+    monkeypatch.setattr(params, "PROPERTY_CACHE_DEFAULT_SIZE", 2 ** 10)
+    monkeypatch.setattr(params, "PROPERTY_STORE_TIMEOUT", 5)
+    assert property_store_version() == version
+    monkeypatch.setattr("opr.store.PROPERTY_STORE_FORMULA_VERSION", 0)
+    with PropertyStore(path) as ostore:
+        assert ostore.version != version
+        assert ostore.version == property_store_version()
+    formula_version = property_store_version()
+    monkeypatch.setattr("opr.store.OPR_VERSION", "0.0")
+    assert property_store_version() not in (version, formula_version)
+
+
+def test_clear(tmp_path):
+    ostore = open_property_store(tmp_path / "properties.db")
+    Primer("ATCGATCGATCGATCGAT").E260
+    ostore.clear()
+    assert len(ostore) == 0
+
+
+def test_hairpin(tmp_path):
+    path = tmp_path / "properties.db"
+    open_property_store(path)
+    hairpin = Primer("GGGGCCAAAAGGCCCC").hairpin
+    assert Primer("AAAAAAAAAAAAAAAAAA").hairpin is None
+    close_property_store()
+    ostore = open_property_store(path)
+    assert len(ostore) == 2
+    assert Primer("GGGGCCAAAAGGCCCC").hairpin == hairpin
+    assert type(Primer("GGGGCCAAAAGGCCCC").hairpin) is type(hairpin)
+    assert Primer("AAAAAAAAAAAAAAAAAA").hairpin is None
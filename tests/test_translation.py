@@ -0,0 +1,88 @@
+import random
+from opr import Primer, ORF, translate_frame, six_frame_translation, find_orfs
+from opr.functions import reverse_complement_calc
+
+TEST_CASE_NAME = "Translation tests"
+
+CODONS = {
+    "TTT": "F", "TTC": "F", "TTA": "L", "TTG": "L", "CTT": "L", "CTC": "L", "CTA": "L", "CTG": "L",
+    "ATT": "I", "ATC": "I", "ATA": "I", "ATG": "M", "GTT": "V", "GTC": "V", "GTA": "V", "GTG": "V",
+    "TCT": "S", "TCC": "S", "TCA": "S", "TCG": "S", "CCT": "P", "CCC": "P", "CCA": "P", "CCG": "P",
+    "ACT": "T", "ACC": "T", "ACA": "T", "ACG": "T", "GCT": "A", "GCC": "A", "GCA": "A", "GCG": "A",
+    "TAT": "Y", "TAC": "Y", "TAA": "*", "TAG": "*", "CAT": "H", "CAC": "H", "CAA": "Q", "CAG": "Q",
+    "AAT": "N", "AAC": "N", "AAA": "K", "AAG": "K", "GAT": "D", "GAC": "D", "GAA": "E", "GAG": "E",
+    "TGT": "C", "TGC": "C", "TGA": "*", "TGG": "W", "CGT": "R", "CGC": "R", "CGA": "R", "CGG": "R",
+    "AGT": "S", "AGC": "S", "AGA": "R", "AGG": "R", "GGT": "G", "GGC": "G", "GGA": "G", "GGG": "G",
+}
+
+
+def naive_translation(sequence):
+    return "".join(CODONS[sequence[i:i + 3]] for i in range(0, len(sequence) - 2, 3))
+
+
+def naive_orfs(sequence, min_length):
+    orfs = []
+    for frame in (1, 2, 3, -1, -2, -3):
+        strand = sequence if frame > 0 else reverse_complement_calc(sequence)
+        protein = naive_translation(strand[abs(frame) - 1:])
+        index = 0
+        while index < len(protein):
+            stop = protein.find("*", index)
+            start = protein.find("M", index, None if stop == -1 else stop)
+            if stop == -1 or start == -1:
+                if stop == -1:
+                    break
+                index = stop + 1
+                continue
+            if stop - start >= min_length:
+                begin, end = abs(frame) - 1 + 3 * start, abs(frame) + 2 + 3 * stop
+                if frame < 0:
+                    begin, end = len(sequence) - end, len(sequence) - begin
+                orfs.append(ORF(frame, begin, end, protein[start:stop]))
+            index = stop + 1
+    return orfs
+
+
+def test_translate_frame():
+    assert translate_frame("ATCGATCG") == "ID"
+    assert translate_frame("ATCGATCG", frame=2) == "SI"
+    assert translate_frame("ATCGATCG", frame=3, multi_letter=True) == "Arg-Ser"
+    assert translate_frame("atcgatcg", frame=-1) == "RS"
+    assert translate_frame("AT") == ""
+
+
+def test_six_frame_translation_random():
+    random.seed(1)
+    for _ in range(50):
+        sequence = "".join(random.choice("ATCG") for _ in range(random.randint(0, 100)))
+        proteins = six_frame_translation(sequence)
+        for frame in (1, 2, 3):
+            assert proteins[frame] == naive_translation(sequence[frame - 1:])
+            assert proteins[-frame] == naive_translation(reverse_complement_calc(sequence)[frame - 1:])
+
+
+def test_to_protein_random():
+    random.seed(2)
+    for _ in range(20):
+        oprimer = Primer("".join(random.choice("ATCG") for _ in range(random.randint(18, 30))))
+        for frame in (1, 2, 3):
+            assert oprimer.to_protein(frame) == translate_frame(oprimer.sequence, frame)
+            assert oprimer.to_protein(frame, multi_letter=True) == translate_frame(oprimer.sequence, frame, True)
+
+
+def test_find_orfs():
+    sequence = "CC" + "ATGAAATGGTTTTAA" + "GG" + reverse_complement_calc("ATGCCCTAG")
+    assert list(find_orfs(sequence, min_length=2)) == [
+        ORF(3, 2, 17, "MKWF"), ORF(-1, 19, 28, "MP")]
+    assert list(find_orfs(sequence, min_length=3)) == [ORF(3, 2, 17, "MKWF")]
+
+
+def test_find_orfs_random():
+    random.seed(3)
+    for _ in range(50):
+        sequence = "".join(random.choice("ATCG") for _ in range(random.randint(0, 500)))
+        for min_length in (1, 5):
+            expected = naive_orfs(sequence, min_length)
+            assert list(find_orfs(sequence, min_length)) == expected
+            # ORFs spanning translation chunks
+            assert list(find_orfs(sequence, min_length, chunk_size=2)) == expected
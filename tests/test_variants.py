@@ -0,0 +1,57 @@
+import math
+import random
+from opr import Primer, PrimerBatch, MeltingTemperature, Mutation, Variant
+
+TEST_CASE_NAME = "Variants tests"
+
+
+def assert_variant_properties(variant, salt=50):
+    oprimer = Primer(variant.sequence, salt=salt)
+    assert math.isclose(variant.delta_h, oprimer.delta_h, abs_tol=1e-9)
+    assert math.isclose(variant.delta_s, oprimer.delta_s, abs_tol=1e-12)
+    assert math.isclose(variant.nearest_neighbor_melting_temperature,
+                        oprimer.melting_temperature(MeltingTemperature.NEAREST_NEIGHBOR), rel_tol=1e-9)
+    assert math.isclose(variant.gc_content, oprimer.gc_content)
+    assert math.isclose(variant.molecular_weight, oprimer.molecular_weight)
+
+
+def test_substitutions():
+    oprimer = Primer("CTGGAGGACGGAAGAGGAAGTAA")
+    variants = list(oprimer.variants())
+    assert len(variants) == 3 * len(oprimer)
+    assert variants[0] == Variant(
+        Mutation.SUBSTITUTION, 0, "C", "A", "ATGGAGGACGGAAGAGGAAGTAA", variants[0].delta_h, variants[0].delta_s,
+        variants[0].nearest_neighbor_melting_temperature, variants[0].gc_content, variants[0].molecular_weight)
+    assert {variant.sequence for variant in variants} == {
+        oprimer.sequence[:index] + base + oprimer.sequence[index + 1:]
+        for index in range(len(oprimer)) for base in "ATCG" if base != oprimer.sequence[index]}
+    for variant in variants:
+        assert_variant_properties(variant)
+
+
+def test_indels():
+    random.seed(1)
+    for _ in range(10):
+        sequence = "".join(random.choice("ATCG") for _ in range(random.randint(18, 25)))
+        variants = [variant for variant in Primer(sequence, salt=100).variants(indels=True)
+                    if variant.mutation != Mutation.SUBSTITUTION]
+        sequences = [variant.sequence for variant in variants]
+        assert len(sequences) == len(set(sequences))
+        assert set(sequences) == {sequence[:index] + base + sequence[index:]
+                                  for index in range(len(sequence) + 1) for base in "ATCG"} | {
+            sequence[:index] + sequence[index + 1:] for index in range(len(sequence))}
+        for variant in variants:
+            assert_variant_properties(variant, salt=100)
+
+
+def test_homopolymer_indels():
+    variants = [variant for variant in Primer("AAAAAAAAAAAAAAAAAAAA").variants(indels=True)
+                if variant.mutation == Mutation.DELETION]
+    assert [(variant.position, variant.reference) for variant in variants] == [(0, "A")]
+
+
+def test_batch_variants():
+    sequences = ["CTGGAGGACGGAAGAGGAAGTAA", "ATCGATCGATCGATCGAT"]
+    assert list(PrimerBatch(sequences).variants(indels=True)) == [
+        (index, variant) for index, sequence in enumerate(sequences)
+        for variant in Primer(sequence).variants(indels=True)]